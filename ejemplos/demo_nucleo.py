@@ -192,33 +192,26 @@ def ejemplo_completo():
     salida = mapa.obtener_posicion_salida()
     print(f"Objetivo: llegar a la salida en {salida}")
     
-    # Simular algunos movimientos
+    # Calcular una sola vez el camino más corto hasta la salida y
+    # reproducirlo paso a paso
+    camino = mapa.obtener_camino_mas_corto(inicio, salida) or []
+    print(f"Camino más corto: {len(camino)} pasos")
+    mover = {
+        "arriba": jugador.mover_arriba,
+        "abajo": jugador.mover_abajo,
+        "izquierda": jugador.mover_izquierda,
+        "derecha": jugador.mover_derecha,
+    }
+    
+    # Simular los movimientos
     movimientos = 0
     max_movimientos = 20
     
-    while movimientos < max_movimientos and not jugador.ha_llegado_a_salida(mapa):
-        # Estrategia simple: moverse hacia la salida
-        fila_actual, col_actual = jugador.obtener_posicion()
-        fila_salida, col_salida = salida
-        
+    for direccion in camino[:max_movimientos]:
         corriendo = jugador.puede_correr() and movimientos % 3 == 0
-        
-        if fila_actual < fila_salida:
-            if jugador.mover_abajo(mapa, corriendo=corriendo):
-                movimientos += 1
-        elif fila_actual > fila_salida:
-            if jugador.mover_arriba(mapa, corriendo=corriendo):
-                movimientos += 1
-        
-        if col_actual < col_salida:
-            if jugador.mover_derecha(mapa, corriendo=corriendo):
-                movimientos += 1
-        elif col_actual > col_salida:
-            if jugador.mover_izquierda(mapa, corriendo=corriendo):
-                movimientos += 1
-        
-        if movimientos >= max_movimientos:
+        if not mover[direccion](mapa, corriendo=corriendo):
             break
+        movimientos += 1
     
     print(f"\nMovimientos realizados: {movimientos}")
     print(f"Posición final: {jugador.obtener_posicion()}")
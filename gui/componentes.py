@@ -269,14 +269,15 @@ class Particula:
         self.vida -= dt * 2
         return self.vida > 0
     
-    def dibujar(self, superficie: pygame.Surface):
-        """Dibuja la partícula."""
+    def dibujar(self, superficie: pygame.Surface) -> Optional[pygame.Rect]:
+        """Dibuja la partícula y devuelve la zona modificada (None si no dibujó nada)."""
         alpha = int(255 * self.vida)
         tamano = int(self.tamano * self.vida)
         if tamano > 0:
             s = pygame.Surface((tamano * 2, tamano * 2), pygame.SRCALPHA)
             pygame.draw.circle(s, (*self.color, alpha), (tamano, tamano), tamano)
-            superficie.blit(s, (int(self.x) - tamano, int(self.y) - tamano))
+            return superficie.blit(s, (int(self.x) - tamano, int(self.y) - tamano))
+        return None
 
 
 class SistemaParticulas:
@@ -317,15 +318,22 @@ class SistemaParticulas:
         # Actualizar todas las partículas y filtrar las que murieron
         self.particulas = [p for p in self.particulas if p.actualizar(dt)]
     
-    def dibujar(self, superficie: pygame.Surface):
+    def dibujar(self, superficie: pygame.Surface) -> List[pygame.Rect]:
         """
         Dibuja todas las partículas activas.
         
         Args:
             superficie: Superficie de pygame donde dibujar.
+            
+        Returns:
+            Lista de rectángulos de la superficie modificados.
         """
+        zonas = []
         for p in self.particulas:
-            p.dibujar(superficie)
+            zona = p.dibujar(superficie)
+            if zona is not None:
+                zonas.append(zona)
+        return zonas
 
 
 class CuadroTexto:
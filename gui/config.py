@@ -113,7 +113,11 @@ class Config:
     PANTALLA_COMPLETA = True  # Activar pantalla completa por defecto
     ANCHO_VENTANA = 1280  # Ancho en modo ventana (si no está en pantalla completa)
     ALTO_VENTANA = 720   # Alto en modo ventana (si no está en pantalla completa)
-    FPS = 60  # Frames por segundo (velocidad de actualización)
+    FPS = 60  # Frames por segundo (velocidad de dibujado)
+    FPS_MENU = 30  # Frames por segundo de las pantallas estáticas (menús, puntajes)
+    FPS_LOGICA = 120  # Pasos de lógica por segundo (dt fijo de actualizar)
+    MAX_PASOS_LOGICA = 8  # Máximo de pasos de lógica a recuperar por iteración
+    MARGEN_ESPERA = 0.002  # Segundos finales de espera cedidos con sleep(0)
     TITULO = "Escapa del Laberinto"  # Título de la ventana
     
     # ============================================
@@ -10,6 +10,9 @@ from datetime import datetime
 
 from modelo.mapa import Mapa
 from modelo.jugador import Jugador
+from modelo.trampa import Trampa
+from modelo.enemigo import Enemigo
+from modelo.tile import TipoTile
 from logica.generador_mapa import GeneradorMapa
 from logica import Dificultad
 from sistema.puntajes import ScoreBoard, Puntaje, ModoJuego
@@ -24,11 +27,38 @@ from .renderizador import RenderizadorMapa
 class PantallaBase:
     """Clase base para todas las pantallas."""
     
+    # Las pantallas que procesan eventos MOUSEMOTION deben activarlo; el resto
+    # consulta pygame.mouse.get_pos() y el evento queda bloqueado en SDL
+    USA_MOVIMIENTO_MOUSE = False
+    
+    # Frecuencia de dibujado de la pantalla: las pantallas estáticas se
+    # redibujan a menos FPS que el juego (menos trabajo por segundo)
+    FPS = Config.FPS_MENU
+    
     def __init__(self, ancho: int, alto: int):
         self.ancho = ancho
         self.alto = alto
         self.siguiente_pantalla = None
         self.datos_retorno = {}
+    
+    def inicializar_fuentes(self):
+        """Inicializa las fuentes y los elementos que dependen de ellas."""
+        pass
+    
+    def redimensionar(self, ancho: int, alto: int):
+        """
+        Adapta la pantalla a un nuevo tamaño de ventana sin perder su estado.
+        
+        Por defecto actualiza las dimensiones y vuelve a crear las fuentes
+        y botones (cuya posición depende del tamaño de la pantalla).
+        
+        Args:
+            ancho: Nuevo ancho de la pantalla en píxeles.
+            alto: Nuevo alto de la pantalla en píxeles.
+        """
+        self.ancho = ancho
+        self.alto = alto
+        self.inicializar_fuentes()
         
     def manejar_evento(self, evento: pygame.event.Event):
         """Maneja eventos de la pantalla."""
@@ -38,9 +68,16 @@ class PantallaBase:
         """Actualiza la lógica de la pantalla."""
         pass
     
-    def dibujar(self, superficie: pygame.Surface):
-        """Dibuja la pantalla."""
-        pass
+    def dibujar(self, superficie: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Dibuja la pantalla.
+        
+        Returns:
+            Lista de rectángulos modificados en este frame para actualizar
+            solo esas zonas de la ventana, o None si se redibujó la pantalla
+            completa (las subclases actuales redibujan todo en cada frame).
+        """
+        return None
 
 
 class MenuPrincipal(PantallaBase):
@@ -106,6 +143,13 @@ class MenuPrincipal(PantallaBase):
                   accion=self._salir),
         ]
     
+    def redimensionar(self, ancho: int, alto: int):
+        """Reubica el cuadro de nombre, los botones y las estrellas conservando el texto ingresado."""
+        super().redimensionar(ancho, alto)
+        self.cuadro_nombre.rect.x = ancho // 2 - 200
+        self.estrellas = self._generar_estrellas(len(self.estrellas))
+        self._inicializar_botones()
+    
     def _seleccionar_modo(self, modo: str):
         """Selecciona un modo de juego."""
         nombre = self.cuadro_nombre.obtener_texto()
@@ -158,9 +202,10 @@ class MenuPrincipal(PantallaBase):
         for boton in self.botones:
             boton.actualizar(pos_mouse, dt)
         
-        # Actualizar estrellas
+        # Actualizar estrellas (velocidad en píxeles por frame de 60 FPS,
+        # escalada por dt para no depender de la frecuencia de la lógica)
         for estrella in self.estrellas:
-            estrella['y'] += estrella['velocidad']
+            estrella['y'] += estrella['velocidad'] * 60 * dt
             if estrella['y'] > self.alto:
                 estrella['y'] = 0
                 estrella['x'] = random.randint(0, self.ancho)
@@ -168,8 +213,8 @@ class MenuPrincipal(PantallaBase):
         # Actualizar partículas
         self.particulas.actualizar(dt)
         
-        # Emitir partículas ocasionalmente
-        if random.random() < 0.1:
+        # Emitir partículas ocasionalmente (unas 6 por segundo)
+        if random.random() < 6 * dt:
             x = random.randint(0, self.ancho)
             self.particulas.emitir(x, 0, Colores.CYAN_NEON, 1)
     
@@ -238,6 +283,9 @@ class MenuPrincipal(PantallaBase):
 class PantallaJuego(PantallaBase):
     """Pantalla principal del juego."""
     
+    # El juego se dibuja a la frecuencia completa
+    FPS = Config.FPS
+    
     def __init__(self, ancho: int, alto: int, modo: str, nombre_jugador: str):
         super().__init__(ancho, alto)
         
@@ -263,6 +311,17 @@ class PantallaJuego(PantallaBase):
         self.widget_x = 0
         self.widget_y = 0
         
+        # Vistas pre-filtradas de las entidades a dibujar (trampas activas y
+        # enemigos vivos); se reutilizan las mismas listas en cada frame
+        self.trampas_activas: List[Trampa] = []
+        self.enemigos_vivos: List[Enemigo] = []
+        
+        # Redibujado parcial: fondo de la escena (color de fondo + mapa estático)
+        # y zonas dibujadas en el frame anterior, que se restauran desde ese fondo.
+        # _zonas_previas = None obliga a redibujar la pantalla completa
+        self._fondo_escena: Optional[pygame.Surface] = None
+        self._zonas_previas: Optional[List[pygame.Rect]] = None
+        
         # Estado del juego
         self.tiempo_juego = 0
         self.tiempo_limite = Config.TIEMPO_PARTIDA_ESCAPA if modo == "escapa" else Config.TIEMPO_PARTIDA_CAZADOR
@@ -351,9 +410,21 @@ class PantallaJuego(PantallaBase):
         self.mapa = self.modo_juego.mapa
         self.jugador = self.modo_juego.jugador
         
+        # Barra de energía (más pequeña para el widget); se posiciona en _calcular_layout
+        self.barra_energia = BarraEnergia(0, 0, 180, 20)
+        self._calcular_layout()
+        self._invalidar_fondo_escena()
+        
+        # Resetear renderizador
+        self.renderizador.resetear_posicion_jugador(self.jugador)
+        
+        # Iniciar música de fondo
+        self.gestor_sonidos.reproducir_musica(loop=True)
+    
+    def _calcular_layout(self):
+        """Calcula la posición del mapa (centrado) y del widget según el tamaño de la pantalla."""
         # Calcular posición del mapa (centrado, usando casi toda la pantalla)
-        mapa_ancho_px = ancho_mapa * tamano_celda
-        mapa_alto_px = alto_mapa * tamano_celda
+        mapa_ancho_px, mapa_alto_px = self.renderizador.obtener_tamano_mapa_pixeles(self.mapa)
         
         # Centrar el mapa
         self.mapa_offset_x = (self.ancho - mapa_ancho_px) // 2
@@ -361,18 +432,66 @@ class PantallaJuego(PantallaBase):
         
         # Widget pequeño en esquina superior derecha
         widget_ancho = 200
-        widget_alto = 120
         self.widget_x = self.ancho - widget_ancho - 20
         self.widget_y = 20
         
-        # Barra de energía (más pequeña para el widget)
-        self.barra_energia = BarraEnergia(self.widget_x + 10, self.widget_y + 60, widget_ancho - 20, 20)
+        # Barra de energía dentro del widget
+        self.barra_energia.rect.topleft = (self.widget_x + 10, self.widget_y + 60)
+    
+    def redimensionar(self, ancho: int, alto: int):
+        """
+        Adapta la partida en curso a un nuevo tamaño de ventana.
         
-        # Resetear renderizador
+        Conserva el mapa, el jugador, los enemigos y las trampas; solo
+        recalcula el tamaño de celda, la posición del mapa y del widget.
+        El renderizador se recrea únicamente si cambia el tamaño de celda
+        (sus sprites dependen de él); si no, solo se invalidan sus caches.
+        
+        Args:
+            ancho: Nuevo ancho de la pantalla en píxeles.
+            alto: Nuevo alto de la pantalla en píxeles.
+        """
+        self.ancho = ancho
+        self.alto = alto
+        
+        # El mapa ya existe: el tamaño de celda también debe permitir que quepa completo
+        _, _, tamano_celda = self._calcular_dimensiones_mapa()
+        tamano_celda = max(1, min(tamano_celda,
+                                  (ancho - 40) // self.mapa.ancho,
+                                  (alto - 40) // self.mapa.alto))
+        
+        if tamano_celda != self.renderizador.tamano_celda:
+            self.renderizador = RenderizadorMapa(tamano_celda=tamano_celda)
+        else:
+            self.renderizador.invalidar_caches()
         self.renderizador.resetear_posicion_jugador(self.jugador)
         
-        # Iniciar música de fondo
-        self.gestor_sonidos.reproducir_musica(loop=True)
+        self._calcular_layout()
+        self._invalidar_fondo_escena()
+        self.inicializar_fuentes()
+    
+    def _invalidar_fondo_escena(self):
+        """Descarta el fondo de la escena; el siguiente frame se redibuja completo."""
+        self._fondo_escena = None
+        self._zonas_previas = None
+    
+    def _obtener_fondo_escena(self, tamano: Tuple[int, int]) -> pygame.Surface:
+        """
+        Obtiene la superficie con el fondo de la pantalla y el mapa estático.
+        
+        Args:
+            tamano: Tamaño (ancho, alto) de la superficie de destino.
+            
+        Returns:
+            Superficie del tamaño de la pantalla con la parte estática de la escena.
+        """
+        if self._fondo_escena is None or self._fondo_escena.get_size() != tamano:
+            self._zonas_previas = None  # La pantalla no coincide con el fondo nuevo
+            self._fondo_escena = pygame.Surface(tamano)
+            self._fondo_escena.fill(Colores.FONDO_OSCURO)
+            self.renderizador.dibujar_estatico(self._fondo_escena, self.mapa,
+                                               (self.mapa_offset_x, self.mapa_offset_y))
+        return self._fondo_escena
     
     def inicializar_fuentes(self):
         """Inicializa las fuentes."""
@@ -483,11 +602,10 @@ class PantallaJuego(PantallaBase):
                 self.particulas.emitir(x, y, color, 3)
                 
                 # Sonido de movimiento según el tipo de tile
-                from modelo.tile import Liana, Tunel
-                tile = self.mapa.obtener_casilla(pos[0], pos[1])
-                if isinstance(tile, Liana):
+                tipo = self.mapa.obtener_casilla(pos[0], pos[1]).tipo
+                if tipo is TipoTile.LIANA:
                     self.gestor_sonidos.reproducir(TipoSonido.PASO_LIANA)
-                elif isinstance(tile, Tunel):
+                elif tipo is TipoTile.TUNEL:
                     self.gestor_sonidos.reproducir(TipoSonido.PASO_TUNEL)
                 else:
                     # Sonido normal de paso (caminar o correr)
@@ -615,36 +733,53 @@ class PantallaJuego(PantallaBase):
         self.barra_energia.actualizar(self.jugador.obtener_porcentaje_energia(), dt)
         self.particulas.actualizar(dt)
     
-    def dibujar(self, superficie: pygame.Surface):
-        """Dibuja la pantalla del juego."""
-        superficie.fill(Colores.FONDO_OSCURO)
+    def dibujar(self, superficie: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Dibuja la pantalla del juego.
+        
+        La parte estática (fondo y mapa) se guarda en _fondo_escena. Mientras
+        no haya overlays de pantalla completa, cada frame solo restaura desde
+        ese fondo las zonas dibujadas en el frame anterior y vuelve a dibujar
+        los elementos dinámicos encima.
+        
+        Returns:
+            Zonas modificadas (las del frame anterior y las actuales), o None
+            si se redibujó la pantalla completa.
+        """
+        fondo = self._obtener_fondo_escena(superficie.get_size())
+        redibujado_parcial = self._zonas_previas is not None
+        if redibujado_parcial:
+            # Borrar los elementos dinámicos del frame anterior
+            for zona in self._zonas_previas:
+                superficie.blit(fondo, zona, zona)
+        else:
+            superficie.blit(fondo, (0, 0))
         
         # Dibujar mapa con trampas y enemigos si están disponibles
-        trampas = None
-        enemigos = None
-        if self.modo_juego and self.modo == "escapa":
-            trampas = self.modo_juego.gestor_trampas.obtener_trampas_activas()
-            enemigos = self.modo_juego.enemigos
-        elif self.modo_juego and self.modo == "cazador":
-            enemigos = self.modo_juego.enemigos
-        
-        self.renderizador.dibujar(
+        # (el renderizador recibe las listas ya filtradas)
+        self._actualizar_entidades_visibles()
+        zonas = self.renderizador.dibujar_dinamico(
             superficie, self.mapa, self.jugador,
             offset=(self.mapa_offset_x, self.mapa_offset_y),
-            trampas=trampas,
-            enemigos=enemigos,
+            trampas=self.trampas_activas,
+            enemigos=self.enemigos_vivos,
             modo=self.modo
         )
         
         # Dibujar partículas
-        self.particulas.dibujar(superficie)
+        zonas.extend(self.particulas.dibujar(superficie))
         
         # Efectos visuales adicionales para modo cazador
+        pantalla_completa = self.pausado or self.juego_terminado
         if self.modo == "cazador" and self.modo_juego:
-            self._dibujar_efectos_cazador(superficie)
+            zonas_efectos = self._dibujar_efectos_cazador(superficie)
+            if zonas_efectos is None:
+                pantalla_completa = True
+            else:
+                zonas.extend(zonas_efectos)
         
         # Panel lateral
-        self._dibujar_panel_lateral(superficie)
+        zonas.append(self._dibujar_panel_lateral(superficie))
         
         # Overlay de pausa
         if self.pausado:
@@ -653,9 +788,61 @@ class PantallaJuego(PantallaBase):
         # Overlay de fin de juego
         if self.juego_terminado:
             self._dibujar_fin_juego(superficie)
+        
+        if pantalla_completa:
+            # Un overlay cubrió toda la pantalla: el próximo frame también se redibuja completo
+            self._zonas_previas = None
+            return None
+        
+        zonas_modificadas = self._zonas_previas + zonas if redibujado_parcial else None
+        self._zonas_previas = zonas
+        return zonas_modificadas
+    
+    @staticmethod
+    def _filtrar_en_lugar(destino: list, origen: list, condicion: Callable[[object], bool]):
+        """
+        Copia en destino los elementos de origen que cumplen la condición.
+        
+        Reescribe la lista destino con un índice de escritura y la trunca
+        al final, sin crear una lista nueva en cada frame.
+        
+        Args:
+            destino: Lista a reescribir.
+            origen: Lista de elementos a filtrar.
+            condicion: Función que indica si un elemento se conserva.
+        """
+        escritura = 0
+        largo = len(destino)
+        for elemento in origen:
+            if condicion(elemento):
+                if escritura < largo:
+                    destino[escritura] = elemento
+                else:
+                    destino.append(elemento)
+                escritura += 1
+        del destino[escritura:]
     
-    def _dibujar_panel_lateral(self, superficie: pygame.Surface):
-        """Dibuja un widget pequeño en la esquina superior derecha con tiempo, energía y trampas."""
+    def _actualizar_entidades_visibles(self):
+        """Actualiza las listas de trampas activas y enemigos vivos a dibujar."""
+        if not self.modo_juego:
+            self.trampas_activas.clear()
+            self.enemigos_vivos.clear()
+            return
+        
+        if self.modo == "escapa":
+            self._filtrar_en_lugar(self.trampas_activas, self.modo_juego.gestor_trampas.trampas,
+                                   Trampa.esta_activa)
+        else:
+            self.trampas_activas.clear()
+        self._filtrar_en_lugar(self.enemigos_vivos, self.modo_juego.enemigos, Enemigo.esta_vivo)
+    
+    def _dibujar_panel_lateral(self, superficie: pygame.Surface) -> pygame.Rect:
+        """
+        Dibuja un widget pequeño en la esquina superior derecha con tiempo, energía y trampas.
+        
+        Returns:
+            Rectángulo de la pantalla ocupado por el widget y sus textos.
+        """
         widget_ancho = 200
         # Aumentar altura si hay información de trampas
         widget_alto = 180 if self.modo == "escapa" else 120
@@ -666,7 +853,7 @@ class PantallaJuego(PantallaBase):
                         (0, 0, widget_ancho, widget_alto), border_radius=10)
         pygame.draw.rect(widget_surface, Colores.CYAN_NEON, 
                         (0, 0, widget_ancho, widget_alto), width=2, border_radius=10)
-        superficie.blit(widget_surface, (self.widget_x, self.widget_y))
+        zona = superficie.blit(widget_surface, (self.widget_x, self.widget_y))
         
         # Tiempo (más grande y destacado)
         tiempo_restante = max(0, self.tiempo_limite - self.tiempo_juego)
@@ -677,17 +864,17 @@ class PantallaJuego(PantallaBase):
         tiempo_texto = f"{minutos:02d}:{segundos:02d}"
         tiempo = self.fuente_ui.render(tiempo_texto, True, color_tiempo)
         tiempo_rect = tiempo.get_rect(center=(self.widget_x + widget_ancho // 2, self.widget_y + 30))
-        superficie.blit(tiempo, tiempo_rect)
+        zona.union_ip(superficie.blit(tiempo, tiempo_rect))
         
         # Etiqueta "Tiempo"
         tiempo_label = pygame.font.Font(None, 20).render("Tiempo", True, Colores.TEXTO_SECUNDARIO)
         label_rect = tiempo_label.get_rect(center=(self.widget_x + widget_ancho // 2, self.widget_y + 10))
-        superficie.blit(tiempo_label, label_rect)
+        zona.union_ip(superficie.blit(tiempo_label, label_rect))
         
         # Energía
         energia_label = pygame.font.Font(None, 20).render("Energia", True, Colores.TEXTO_SECUNDARIO)
-        superficie.blit(energia_label, (self.widget_x + 10, self.widget_y + 50))
-        self.barra_energia.dibujar(superficie, self.fuente_ui)
+        zona.union_ip(superficie.blit(energia_label, (self.widget_x + 10, self.widget_y + 50)))
+        self.barra_energia.dibujar(superficie, self.fuente_ui)  # Dentro del fondo del widget
         
         # Información de trampas (solo en modo Escapa)
         if self.modo == "escapa" and self.modo_juego:
@@ -696,18 +883,18 @@ class PantallaJuego(PantallaBase):
             trampas_disponibles = estado.get("trampas_disponibles", 0)
             
             trampas_label = pygame.font.Font(None, 20).render("Trampas", True, Colores.TEXTO_SECUNDARIO)
-            superficie.blit(trampas_label, (self.widget_x + 10, self.widget_y + 100))
+            zona.union_ip(superficie.blit(trampas_label, (self.widget_x + 10, self.widget_y + 100)))
             
             # Mostrar trampas disponibles (se regeneran cada 5 segundos)
             trampas_texto = f"Disponibles: {trampas_disponibles}/3"
             color_trampas = Colores.VERDE_NEON if trampas_disponibles > 0 else Colores.ROJO_NEON
             trampas_valor = self.fuente_ui.render(trampas_texto, True, color_trampas)
-            superficie.blit(trampas_valor, (self.widget_x + 10, self.widget_y + 120))
+            zona.union_ip(superficie.blit(trampas_valor, (self.widget_x + 10, self.widget_y + 120)))
             
             # Mostrar trampas activas en el mapa
             trampas_activas_texto = f"En mapa: {trampas_activas}"
             trampas_activas_valor = pygame.font.Font(None, 16).render(trampas_activas_texto, True, Colores.TEXTO_SECUNDARIO)
-            superficie.blit(trampas_activas_valor, (self.widget_x + 10, self.widget_y + 140))
+            zona.union_ip(superficie.blit(trampas_activas_valor, (self.widget_x + 10, self.widget_y + 140)))
         
         # Información de enemigos (solo en modo Cazador)
         elif self.modo == "cazador" and self.modo_juego:
@@ -737,16 +924,16 @@ class PantallaJuego(PantallaBase):
                                 (0, 0, widget_ancho, widget_alto_total), border_radius=10)
                 pygame.draw.rect(widget_surface, Colores.ROJO_NEON if enemigos_cerca > 0 else Colores.CYAN_NEON, 
                                 (0, 0, widget_ancho, widget_alto_total), width=2, border_radius=10)
-                superficie.blit(widget_surface, (self.widget_x, self.widget_y))
+                zona.union_ip(superficie.blit(widget_surface, (self.widget_x, self.widget_y)))
             
             enemigos_label = pygame.font.Font(None, 20).render("Enemigos", True, Colores.TEXTO_SECUNDARIO)
-            superficie.blit(enemigos_label, (self.widget_x + 10, self.widget_y + 100))
+            zona.union_ip(superficie.blit(enemigos_label, (self.widget_x + 10, self.widget_y + 100)))
             
             # Mostrar enemigos vivos
             vivos_texto = f"Vivos: {enemigos_vivos}/3"
             color_vivos = Colores.VERDE_NEON if enemigos_vivos > 0 else Colores.ROJO_NEON
             vivos_valor = self.fuente_ui.render(vivos_texto, True, color_vivos)
-            superficie.blit(vivos_valor, (self.widget_x + 10, self.widget_y + 120))
+            zona.union_ip(superficie.blit(vivos_valor, (self.widget_x + 10, self.widget_y + 120)))
             
             y_offset = 140
             
@@ -757,14 +944,14 @@ class PantallaJuego(PantallaBase):
                 color_combo = tuple(min(255, int(c * brillo_combo)) for c in Colores.ORO)
                 combo_texto = f"COMBO x{combo_actual}!"
                 combo_valor = pygame.font.Font(None, 18).render(combo_texto, True, color_combo)
-                superficie.blit(combo_valor, (self.widget_x + 10, self.widget_y + y_offset))
+                zona.union_ip(superficie.blit(combo_valor, (self.widget_x + 10, self.widget_y + y_offset)))
                 y_offset += 20
             
             # Mostrar puntos ganados si hay
             if puntos_ganados > 0:
                 puntos_texto = f"+{puntos_ganados} pts"
                 puntos_valor = pygame.font.Font(None, 18).render(puntos_texto, True, Colores.VERDE_NEON)
-                superficie.blit(puntos_valor, (self.widget_x + 10, self.widget_y + y_offset))
+                zona.union_ip(superficie.blit(puntos_valor, (self.widget_x + 10, self.widget_y + y_offset)))
                 y_offset += 20
             
             # Advertencia si hay enemigos cerca de salida
@@ -774,17 +961,19 @@ class PantallaJuego(PantallaBase):
                 color_advertencia = tuple(min(255, int(c * brillo_advertencia)) for c in Colores.ROJO_NEON)
                 advertencia_texto = f"! {enemigos_cerca} cerca de salida !"
                 advertencia_valor = pygame.font.Font(None, 16).render(advertencia_texto, True, color_advertencia)
-                superficie.blit(advertencia_valor, (self.widget_x + 10, self.widget_y + y_offset))
+                zona.union_ip(superficie.blit(advertencia_valor, (self.widget_x + 10, self.widget_y + y_offset)))
                 y_offset += 20
             
             # Mostrar capturados y escapados
             capturados_texto = f"Capturados: {enemigos_capturados}"
             capturados_valor = pygame.font.Font(None, 16).render(capturados_texto, True, Colores.VERDE_NEON)
-            superficie.blit(capturados_valor, (self.widget_x + 10, self.widget_y + y_offset))
+            zona.union_ip(superficie.blit(capturados_valor, (self.widget_x + 10, self.widget_y + y_offset)))
             
             escapados_texto = f"Escapados: {enemigos_escapados}"
             escapados_valor = pygame.font.Font(None, 16).render(escapados_texto, True, Colores.ROJO_NEON)
-            superficie.blit(escapados_valor, (self.widget_x + 10, self.widget_y + y_offset + 20))
+            zona.union_ip(superficie.blit(escapados_valor, (self.widget_x + 10, self.widget_y + y_offset + 20)))
+        
+        return zona
     
     def _calcular_puntos_estimados(self) -> int:
         """Calcula los puntos estimados actuales."""
@@ -797,10 +986,17 @@ class PantallaJuego(PantallaBase):
         puntos = 1000 + int(tiempo_restante * 10) + energia * 5 - self.movimientos * 2
         return max(100, puntos)
     
-    def _dibujar_efectos_cazador(self, superficie: pygame.Surface):
-        """Dibuja efectos visuales adicionales para el modo cazador."""
+    def _dibujar_efectos_cazador(self, superficie: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Dibuja efectos visuales adicionales para el modo cazador.
+        
+        Returns:
+            Lista de rectángulos modificados, o None si se dibujó el overlay
+            de advertencia sobre toda la pantalla.
+        """
         if not self.modo_juego:
-            return
+            return []
+        zonas = []
         
         estado = self.modo_juego.obtener_estado()
         enemigos_cerca = estado.get("enemigos_cerca_salida", 0)
@@ -846,7 +1042,10 @@ class PantallaJuego(PantallaBase):
                     # Dibujar círculo de advertencia
                     circle_surface = pygame.Surface((radio * 2, radio * 2), pygame.SRCALPHA)
                     pygame.draw.circle(circle_surface, color_circulo, (radio, radio), radio, width=3)
-                    superficie.blit(circle_surface, (x - radio, y - radio))
+                    zonas.append(superficie.blit(circle_surface, (x - radio, y - radio)))
+        
+        # El overlay de advertencia cubre toda la pantalla
+        return None if enemigos_cerca > 0 else zonas
     
     def _dibujar_leyenda(self, superficie: pygame.Surface, x: int, y: int):
         """Dibuja la leyenda de tipos de tile."""
@@ -1699,8 +1898,8 @@ class PantallaFinJuego(PantallaBase):
         for boton in self.botones:
             boton.actualizar(pos_mouse, dt)
         
-        # Partículas de celebración
-        if self.victoria and random.random() < 0.3:
+        # Partículas de celebración (unas 18 ráfagas por segundo)
+        if self.victoria and random.random() < 18 * dt:
             x = random.randint(100, self.ancho - 100)
             color = random.choice([Colores.ORO, Colores.CYAN_NEON, Colores.MAGENTA_NEON])
             self.particulas.emitir(x, 50, color, 2)
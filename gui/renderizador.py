@@ -4,7 +4,8 @@ Renderizador del mapa del laberinto con efectos visuales.
 
 import pygame
 import math
-from typing import Tuple, Optional
+import numpy as np
+from typing import Dict, Tuple, Optional
 from modelo.tile import Tile, Camino, Muro, Liana, Tunel, TipoTile
 from modelo.mapa import Mapa
 from modelo.jugador import Jugador
@@ -14,6 +15,44 @@ from typing import List, Optional
 from .config import Colores, Config
 
 
+# Código entero (int8) de cada tipo de tile en la grilla cacheada del mapa.
+# El orden coincide con el de las superficies en RenderizadorMapa._sprites_por_codigo
+_CODIGO_POR_TIPO = {
+    TipoTile.CAMINO: 0,
+    TipoTile.MURO: 1,
+    TipoTile.LIANA: 2,
+    TipoTile.TUNEL: 3,
+}
+
+
+def construir_lote_tiles(grid: np.ndarray, tamano_celda: int, sprites: List[pygame.Surface],
+                         offset: Tuple[int, int] = (0, 0)) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+    """
+    Construye el lote (sprite, posición) de todas las celdas de una grilla de tipos.
+    
+    El recorrido de la grilla y el cálculo de coordenadas se hacen de forma
+    vectorizada con numpy por cada código de tipo; en Python solo queda
+    el emparejamiento final de cada posición con su sprite.
+    
+    Args:
+        grid: Array (alto, ancho) int8 con los códigos de _CODIGO_POR_TIPO.
+        tamano_celda: Tamaño de cada celda en píxeles.
+        sprites: Superficie de cada código de tipo (indexada por código).
+        offset: Offset (x, y) en píxeles de la celda (0, 0).
+        
+    Returns:
+        Lista de pares (superficie, (x, y)) lista para Surface.blits/fblits.
+    """
+    offset_x, offset_y = offset
+    lote = []
+    for codigo, sprite in enumerate(sprites):
+        filas, cols = np.nonzero(grid == codigo)
+        xs = (cols * tamano_celda + offset_x).tolist()
+        ys = (filas * tamano_celda + offset_y).tolist()
+        lote.extend([(sprite, posicion) for posicion in zip(xs, ys)])
+    return lote
+
+
 class RenderizadorMapa:
     """
     Renderiza el mapa del juego con efectos visuales.
@@ -28,6 +67,22 @@ class RenderizadorMapa:
     Incluye efectos visuales como animaciones suaves, brillos y partículas.
     """
     
+    __slots__ = (
+        'tamano_celda', 'tiempo', '_pjv_x', '_pjv_y',
+        '_pulso_trampa', '_pulso_enemigo_glow', '_pulso_jugador_glow', '_pulso_salida_alpha',
+        '_sprites_circulo', '_tile_cache', '_sprites_por_codigo',
+        '_tipo_grid', '_tipo_grid_mapa', '_fondo', '_fondo_mapa',
+        '_col_px', '_fila_px', '_px_clave', '_sprites_enemigo',
+    )
+    
+    # Colores (fondo, borde) de cada clase de tile
+    _COLOR_POR_TIPO: Dict[type, Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = {
+        Muro: (Colores.MURO, Colores.MURO_BORDE),
+        Liana: (Colores.LIANA, Colores.LIANA_BORDE),
+        Tunel: (Colores.TUNEL, Colores.TUNEL_BORDE),
+        Camino: (Colores.CAMINO, Colores.CAMINO_ILUMINADO),
+    }
+    
     def __init__(self, tamano_celda: int = Config.TAMANO_CELDA):
         """
         Inicializa el renderizador del mapa.
@@ -37,8 +92,139 @@ class RenderizadorMapa:
         """
         self.tamano_celda = tamano_celda  # Tamaño de cada celda en píxeles
         self.tiempo = 0  # Tiempo acumulado para animaciones
-        self.posicion_jugador_visual = None  # Posición visual del jugador (para animación suave/interpolación)
+        # Posición visual del jugador en píxeles (para animación suave/interpolación).
+        # Se guarda como dos escalares para no crear una tupla nueva en cada frame
+        self._pjv_x: Optional[float] = None
+        self._pjv_y: Optional[float] = None
+        
+        # Valores de pulso de las animaciones, calculados una vez por frame en actualizar()
+        self._calcular_pulsos()
+        
+        # Sprites de círculos translúcidos (brillos y enemigo en spawn) por (color, radio).
+        # Los pulsos solo toman unos pocos radios enteros, así que cada fase de la
+        # animación se renderiza una única vez y luego solo se copia con blit
+        self._sprites_circulo: Dict[Tuple[Tuple[int, ...], int], pygame.Surface] = {}
+        
+        # Sprites del cuerpo del enemigo por (color, en_spawn): el cuerpo y los ojos
+        # se dibujan una vez aquí y en cada frame solo se copian
+        self._sprites_enemigo: Dict[Tuple[Tuple[int, int, int], bool], pygame.Surface] = {
+            (color, en_spawn): self._crear_sprite_enemigo(color, en_spawn)
+            for color in (Colores.MAGENTA_NEON, Colores.VERDE_NEON)
+            for en_spawn in (False, True)
+        }
+        
+        # Cache de superficies pre-renderizadas por tipo de tile (atlas)
+        # Cada variante se dibuja una sola vez y luego solo se copia con blit
+        self._tile_cache: Dict[type, pygame.Surface] = self._construir_cache_tiles()
+        # Mismas superficies indexadas por el código entero de _CODIGO_POR_TIPO
+        self._sprites_por_codigo = [self._tile_cache[tipo] for tipo in (Camino, Muro, Liana, Tunel)]
+        
+        # Grilla int8 con el código de tipo de cada celda (se calcula una vez por mapa)
+        self._tipo_grid: Optional[np.ndarray] = None
+        self._tipo_grid_mapa: Optional[Mapa] = None  # Referencia (no id) para evitar reutilización de ids
+        
+        # Fondo estático: todas las celdas del mapa renderizadas en una sola superficie
+        self._fondo: Optional[pygame.Surface] = None
+        self._fondo_mapa: Optional[Mapa] = None
+        
+        # Tablas de coordenadas en pantalla (offset + índice * tamaño) por columna y fila,
+        # válidas para la combinación (mapa, offset) guardada en _px_clave
+        self._col_px: List[int] = []
+        self._fila_px: List[int] = []
+        self._px_clave: Optional[Tuple[Mapa, Tuple[int, int]]] = None
+        
+    def _construir_cache_tiles(self) -> Dict[type, pygame.Surface]:
+        """
+        Pre-renderiza cada tipo de tile en una superficie propia.
+        
+        Los tiles son estáticos, así que sus primitivas de dibujo
+        (rectángulos, líneas, círculos) se ejecutan una vez por tipo
+        en lugar de una vez por celda en cada frame.
+        
+        Returns:
+            Diccionario {clase de tile: superficie pre-renderizada}.
+        """
+        cache = {}
+        for tipo in (Camino, Muro, Liana, Tunel):
+            sprite = pygame.Surface((self.tamano_celda, self.tamano_celda), pygame.SRCALPHA)
+            self._dibujar_tile(sprite, tipo(), 0, 0)
+            cache[tipo] = sprite
+        return cache
+    
+    def _obtener_grid_tipos(self, mapa: Mapa) -> np.ndarray:
+        """
+        Obtiene la grilla de códigos de tipo del mapa, construyéndola si es necesario.
+        
+        La topología del mapa no cambia durante una partida, así que la
+        conversión de objetos Tile a enteros se hace una sola vez por mapa.
+        
+        Args:
+            mapa: Objeto Mapa a convertir.
+            
+        Returns:
+            Array (alto, ancho) de dtype int8 con los códigos de _CODIGO_POR_TIPO.
+        """
+        if self._tipo_grid is None or self._tipo_grid_mapa is not mapa:
+            self._tipo_grid = np.fromiter(
+                (_CODIGO_POR_TIPO[tile.tipo] for fila in mapa.casillas for tile in fila),
+                dtype=np.int8, count=mapa.ancho * mapa.alto
+            ).reshape(mapa.alto, mapa.ancho)
+            self._tipo_grid_mapa = mapa
+        return self._tipo_grid
+    
+    def _obtener_fondo(self, mapa: Mapa) -> pygame.Surface:
+        """
+        Obtiene la superficie con todas las celdas del mapa, renderizándola si es necesario.
+        
+        Los tiles no cambian durante una partida, así que el mapa completo
+        se dibuja una vez y en cada frame solo se copia con un único blit.
+        
+        Args:
+            mapa: Objeto Mapa a renderizar.
+            
+        Returns:
+            Superficie (con canal alpha) del tamaño del mapa en píxeles.
+        """
+        if self._fondo is None or self._fondo_mapa is not mapa:
+            tamano = self.tamano_celda
+            grid = self._obtener_grid_tipos(mapa)
+            fondo = pygame.Surface(self.obtener_tamano_mapa_pixeles(mapa), pygame.SRCALPHA)
+            
+            # Copiar todo el lote (sprite, posición) con una única llamada a blits
+            self._blit_lote(fondo, construir_lote_tiles(grid, tamano, self._sprites_por_codigo))
+            
+            self._fondo = fondo
+            self._fondo_mapa = mapa
+        return self._fondo
+    
+    def _actualizar_tablas_px(self, mapa: Mapa, offset: Tuple[int, int]):
+        """
+        Recalcula las tablas de coordenadas en píxeles si cambió el mapa o el offset.
+        
+        Args:
+            mapa: Objeto Mapa que se va a dibujar.
+            offset: Offset (x, y) en píxeles del mapa en la pantalla.
+        """
+        if self._px_clave is None or self._px_clave[0] is not mapa or self._px_clave[1] != offset:
+            tamano = self.tamano_celda
+            offset_x, offset_y = offset
+            self._col_px = [offset_x + col * tamano for col in range(mapa.ancho)]
+            self._fila_px = [offset_y + fila * tamano for fila in range(mapa.alto)]
+            self._px_clave = (mapa, tuple(offset))
+    
+    def invalidar_caches(self):
+        """
+        Descarta el fondo, la grilla de tipos y las tablas de coordenadas cacheadas.
         
+        Debe llamarse si las casillas del mapa se modifican o si cambia el
+        tamaño de la pantalla; el siguiente dibujado los reconstruye.
+        """
+        self._fondo = None
+        self._fondo_mapa = None
+        self._tipo_grid = None
+        self._tipo_grid_mapa = None
+        self._px_clave = None
+    
     def actualizar(self, dt: float, jugador: Jugador = None):
         """
         Actualiza animaciones del renderizador.
@@ -52,29 +238,96 @@ class RenderizadorMapa:
         """
         # Actualizar tiempo acumulado (para animaciones basadas en tiempo)
         self.tiempo += dt
+        self._calcular_pulsos()
         
         # ============================================
         # INTERPOLACIÓN DE POSICIÓN DEL JUGADOR
         # ============================================
         # Actualizar posición visual del jugador con interpolación suave
         # Esto crea un efecto de movimiento fluido en lugar de saltos discretos
-        if jugador and self.posicion_jugador_visual:
+        if jugador and self._pjv_x is not None:
             # Obtener posición lógica actual del jugador
             pos_actual = jugador.obtener_posicion()
-            # Convertir a coordenadas de píxeles
-            target_x = pos_actual[1] * self.tamano_celda
-            target_y = pos_actual[0] * self.tamano_celda
             
-            # Calcular diferencia entre posición visual y posición objetivo
-            diff_x = target_x - self.posicion_jugador_visual[0]
-            diff_y = target_y - self.posicion_jugador_visual[1]
-            
-            # Interpolar suavemente hacia la posición objetivo
+            # Interpolar suavemente hacia la posición objetivo (en píxeles)
             velocidad = 15 * dt  # Velocidad de interpolación
-            self.posicion_jugador_visual = (
-                self.posicion_jugador_visual[0] + diff_x * velocidad,
-                self.posicion_jugador_visual[1] + diff_y * velocidad
-            )
+            self._pjv_x += (pos_actual[1] * self.tamano_celda - self._pjv_x) * velocidad
+            self._pjv_y += (pos_actual[0] * self.tamano_celda - self._pjv_y) * velocidad
+    
+    @property
+    def posicion_jugador_visual(self) -> Optional[Tuple[float, float]]:
+        """Posición visual (x, y) del jugador en píxeles, o None si aún no se inicializó."""
+        if self._pjv_x is None:
+            return None
+        return (self._pjv_x, self._pjv_y)
+    
+    def _dibujar_circulo_translucido(self, superficie: pygame.Surface,
+                                     color: Tuple[int, int, int, int], centro: Tuple[int, int],
+                                     radio: int) -> pygame.Rect:
+        """
+        Dibuja un círculo con transparencia usando un sprite pre-renderizado.
+        
+        El sprite de cada combinación (color, radio) se crea la primera vez
+        que se necesita y se reutiliza en los frames siguientes.
+        
+        Args:
+            superficie: Superficie de pygame donde dibujar.
+            color: Color RGBA del círculo.
+            centro: Centro (x, y) del círculo en píxeles.
+            radio: Radio del círculo.
+            
+        Returns:
+            Rectángulo de la superficie afectado por el dibujo.
+        """
+        clave = (color, radio)
+        sprite = self._sprites_circulo.get(clave)
+        if sprite is None:
+            lado = radio * 2 + 2
+            sprite = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radio + 1, radio + 1), radio)
+            self._sprites_circulo[clave] = sprite
+        mitad = radio + 1
+        return superficie.blit(sprite, (centro[0] - mitad, centro[1] - mitad))
+    
+    def _crear_sprite_enemigo(self, color: Tuple[int, int, int], en_spawn: bool) -> pygame.Surface:
+        """
+        Pre-renderiza el cuerpo de un enemigo.
+        
+        Args:
+            color: Color RGB del enemigo.
+            en_spawn: True para la versión semi-transparente y sin ojos (apareciendo).
+            
+        Returns:
+            Superficie con canal alpha centrada en el centro del enemigo.
+        """
+        radio = self.tamano_celda // 3
+        mitad = radio + 5  # Margen para que los ojos quepan aun con celdas pequeñas
+        sprite = pygame.Surface((mitad * 2, mitad * 2), pygame.SRCALPHA)
+        
+        if en_spawn:
+            # Opacidad reducida y sin ojos
+            pygame.draw.circle(sprite, (*color, 150), (mitad, mitad), radio)
+        else:
+            pygame.draw.circle(sprite, color, (mitad, mitad), radio)
+            # Ojos (dos puntos negros), le dan personalidad al enemigo
+            pygame.draw.circle(sprite, Colores.FONDO_OSCURO, (mitad - 3, mitad - 2), 2)  # Ojo izquierdo
+            pygame.draw.circle(sprite, Colores.FONDO_OSCURO, (mitad + 3, mitad - 2), 2)  # Ojo derecho
+        return sprite
+    
+    def _calcular_pulsos(self):
+        """
+        Calcula los valores de pulso de las animaciones para el tiempo actual.
+        
+        Todas las trampas y enemigos comparten el mismo pulso, así que las
+        funciones trigonométricas se evalúan una vez por frame y no una vez
+        por elemento dibujado.
+        """
+        tiempo = self.tiempo
+        sin = math.sin
+        self._pulso_trampa = int(3 * sin(tiempo * 8))
+        self._pulso_enemigo_glow = int(2 * sin(tiempo * 6))
+        self._pulso_jugador_glow = int(2 * sin(tiempo * 5))
+        self._pulso_salida_alpha = int(150 + 100 * sin(tiempo * 4))
     
     def _obtener_color_tile(self, tile: Tile) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
         """
@@ -89,32 +342,24 @@ class RenderizadorMapa:
         Returns:
             Tupla (color_fondo, color_borde) en formato RGB.
         """
-        if isinstance(tile, Muro):
-            return Colores.MURO, Colores.MURO_BORDE
-        elif isinstance(tile, Liana):
-            return Colores.LIANA, Colores.LIANA_BORDE
-        elif isinstance(tile, Tunel):
-            return Colores.TUNEL, Colores.TUNEL_BORDE
-        else:  # Camino (tile por defecto)
-            return Colores.CAMINO, Colores.CAMINO_ILUMINADO
+        # Camino es el tile por defecto para clases desconocidas
+        return self._COLOR_POR_TIPO.get(type(tile), self._COLOR_POR_TIPO[Camino])
     
-    def _dibujar_celda(self, superficie: pygame.Surface, tile: Tile, 
-                       x: int, y: int, es_especial: str = None):
+    def _dibujar_tile(self, superficie: pygame.Surface, tile: Tile, x: int, y: int):
         """
-        Dibuja una celda individual del mapa.
+        Dibuja las primitivas de un tile (fondo, borde y efectos especiales).
         
-        Dibuja el fondo, borde y efectos especiales según el tipo de tile.
-        Cada tipo de tile tiene un patrón visual distintivo.
+        Cada tipo de tile tiene un patrón visual distintivo. Solo se usa
+        para construir el cache de tiles.
         
         Args:
             superficie: Superficie de pygame donde dibujar.
             tile: Objeto Tile a dibujar.
             x: Posición X en píxeles.
             y: Posición Y en píxeles.
-            es_especial: Tipo especial (no se usa actualmente, pero se mantiene por compatibilidad).
         """
-        # Crear rectángulo para la celda (con margen de 1 píxel)
-        rect = pygame.Rect(x, y, self.tamano_celda - 1, self.tamano_celda - 1)
+        # Rectángulo de la celda como tupla (con margen de 1 píxel)
+        rect = (x, y, self.tamano_celda - 1, self.tamano_celda - 1)
         
         # Obtener colores del tile
         color_fondo, color_borde = self._obtener_color_tile(tile)
@@ -155,8 +400,26 @@ class RenderizadorMapa:
             pygame.draw.circle(superficie, color_borde, centro, 8, 2)  # Círculo exterior
             pygame.draw.circle(superficie, Colores.FONDO_OSCURO, centro, 4)  # Círculo interior
     
+    @staticmethod
+    def _blit_lote(superficie: pygame.Surface, lote: List[Tuple[pygame.Surface, Tuple[int, int]]]):
+        """
+        Copia un lote de superficies con una sola llamada.
+        
+        Usa Surface.fblits cuando está disponible (pygame-ce) y
+        Surface.blits en caso contrario.
+        
+        Args:
+            superficie: Superficie de pygame donde dibujar.
+            lote: Lista de pares (superficie origen, posición destino).
+        """
+        fblits = getattr(superficie, "fblits", None)
+        if fblits is not None:
+            fblits(lote)
+        else:
+            superficie.blits(lote, doreturn=0)
+    
     def _dibujar_posicion_especial(self, superficie: pygame.Surface, 
-                                   x: int, y: int, es_inicio: bool = True):
+                                   x: int, y: int, es_inicio: bool = True) -> pygame.Rect:
         """
         Dibuja marcador para posición de inicio o salida.
         
@@ -169,9 +432,12 @@ class RenderizadorMapa:
             x: Posición X en píxeles.
             y: Posición Y en píxeles.
             es_inicio: True si es posición de inicio, False si es salida.
+            
+        Returns:
+            Rectángulo de la superficie afectado por el dibujo.
         """
-        # Crear rectángulo para el marcador
-        rect = pygame.Rect(x + 2, y + 2, self.tamano_celda - 5, self.tamano_celda - 5)
+        # Rectángulo del marcador como tupla (sin crear un objeto Rect)
+        rect = (x + 2, y + 2, self.tamano_celda - 5, self.tamano_celda - 5)
         
         if es_inicio:
             # Color verde para inicio
@@ -183,15 +449,16 @@ class RenderizadorMapa:
             simbolo = "★"  # Símbolo de salida (no se usa actualmente)
             
             # Efecto de pulso para la salida (hace que sea más visible)
-            alpha = int(150 + 100 * math.sin(self.tiempo * 4))
+            alpha = self._pulso_salida_alpha
             glow = pygame.Surface((self.tamano_celda + 10, self.tamano_celda + 10), pygame.SRCALPHA)
             pygame.draw.rect(glow, (*color, alpha), glow.get_rect(), border_radius=6)
-            superficie.blit(glow, (x - 5, y - 5))
+            zona_glow = superficie.blit(glow, (x - 5, y - 5))
         
         # Dibujar borde del marcador
-        pygame.draw.rect(superficie, color, rect, width=3, border_radius=4)
+        zona = pygame.draw.rect(superficie, color, rect, width=3, border_radius=4)
+        return zona if es_inicio else zona.union(zona_glow)
     
-    def _dibujar_jugador(self, superficie: pygame.Surface, x: float, y: float, modo: str = "escapa"):
+    def _dibujar_jugador(self, superficie: pygame.Surface, x: float, y: float, modo: str = "escapa") -> pygame.Rect:
         """
         Dibuja al jugador con efectos visuales.
         
@@ -205,6 +472,9 @@ class RenderizadorMapa:
             x: Posición X en píxeles (puede ser float para interpolación).
             y: Posición Y en píxeles (puede ser float para interpolación).
             modo: Modo de juego ("escapa" o "cazador").
+            
+        Returns:
+            Rectángulo de la superficie afectado por el dibujo.
         """
         # Calcular centro y radio del jugador
         centro_x = int(x + self.tamano_celda // 2)
@@ -220,20 +490,18 @@ class RenderizadorMapa:
             color_glow = (*Colores.JUGADOR_GLOW, 100)
         
         # Glow exterior
-        glow_radio = radio + 4 + int(2 * math.sin(self.tiempo * 5))
-        glow_surface = pygame.Surface((glow_radio * 4, glow_radio * 4), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, color_glow, 
-                         (glow_radio * 2, glow_radio * 2), glow_radio)
-        superficie.blit(glow_surface, (centro_x - glow_radio * 2, centro_y - glow_radio * 2))
+        glow_radio = radio + 4 + self._pulso_jugador_glow
+        zona = self._dibujar_circulo_translucido(superficie, color_glow,
+                                                 (centro_x, centro_y), glow_radio)
         
         # Jugador principal
-        pygame.draw.circle(superficie, color_jugador, (centro_x, centro_y), radio)
+        zona = zona.union(pygame.draw.circle(superficie, color_jugador, (centro_x, centro_y), radio))
         
         # Brillo interno
         brillo_pos = (centro_x - 3, centro_y - 3)
-        pygame.draw.circle(superficie, Colores.TEXTO, brillo_pos, 3)
+        return zona.union(pygame.draw.circle(superficie, Colores.TEXTO, brillo_pos, 3))
     
-    def _dibujar_trampa(self, superficie: pygame.Surface, x: int, y: int):
+    def _dibujar_trampa(self, superficie: pygame.Surface, x: int, y: int) -> pygame.Rect:
         """
         Dibuja una trampa en el mapa.
         
@@ -244,34 +512,39 @@ class RenderizadorMapa:
             superficie: Superficie de pygame donde dibujar.
             x: Posición X en píxeles.
             y: Posición Y en píxeles.
+            
+        Returns:
+            Rectángulo de la superficie afectado por el dibujo.
         """
         # Calcular centro de la celda
         centro_x = int(x + self.tamano_celda // 2)
         centro_y = int(y + self.tamano_celda // 2)
         
         # Efecto de pulso (el radio varía con el tiempo)
-        pulso = int(3 * math.sin(self.tiempo * 8))
+        pulso = self._pulso_trampa
         radio = self.tamano_celda // 4 + pulso
         
         # Círculo exterior con glow (brillo rojo)
-        glow_surface = pygame.Surface((radio * 4, radio * 4), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*Colores.ROJO_NEON, 150), 
-                         (radio * 2, radio * 2), radio + 2)
-        superficie.blit(glow_surface, (centro_x - radio * 2, centro_y - radio * 2))
+        zona = self._dibujar_circulo_translucido(superficie, (*Colores.ROJO_NEON, 150),
+                                                 (centro_x, centro_y), radio + 2)
+        
+        # Referencias locales (se usan varias veces por trampa)
+        draw = pygame.draw
+        rojo = Colores.ROJO_NEON
         
         # Trampa principal: círculo con borde rojo
-        pygame.draw.circle(superficie, Colores.ROJO_NEON, (centro_x, centro_y), radio, 2)
+        zona = zona.union(draw.circle(superficie, rojo, (centro_x, centro_y), radio, 2))
         
         # Dibujar X en el centro (símbolo de trampa)
         offset = radio - 2
-        pygame.draw.line(superficie, Colores.ROJO_NEON, 
-                        (centro_x - offset, centro_y - offset),
-                        (centro_x + offset, centro_y + offset), 2)
-        pygame.draw.line(superficie, Colores.ROJO_NEON,
-                        (centro_x - offset, centro_y + offset),
-                        (centro_x + offset, centro_y - offset), 2)
+        zona = zona.union(draw.line(superficie, rojo,
+                                    (centro_x - offset, centro_y - offset),
+                                    (centro_x + offset, centro_y + offset), 2))
+        return zona.union(draw.line(superficie, rojo,
+                                    (centro_x - offset, centro_y + offset),
+                                    (centro_x + offset, centro_y - offset), 2))
     
-    def _dibujar_enemigo(self, superficie: pygame.Surface, x: int, y: int, en_spawn: bool = False, modo: str = "escapa"):
+    def _dibujar_enemigo(self, superficie: pygame.Surface, x: int, y: int, en_spawn: bool = False, modo: str = "escapa") -> pygame.Rect:
         """
         Dibuja un enemigo en el mapa.
         
@@ -288,6 +561,9 @@ class RenderizadorMapa:
             y: Posición Y en píxeles.
             en_spawn: True si el enemigo está en el spawn (apareciendo).
             modo: Modo de juego ("escapa" o "cazador").
+            
+        Returns:
+            Rectángulo de la superficie afectado por el dibujo.
         """
         # Calcular centro y radio del enemigo
         centro_x = int(x + self.tamano_celda // 2)
@@ -300,107 +576,123 @@ class RenderizadorMapa:
         else:
             color_enemigo = Colores.MAGENTA_NEON  # Magenta en modo escapa
         
-        # Si está en spawn, dibujar con opacidad reducida (semi-transparente)
-        alpha = 150 if en_spawn else 255
-        
         # Glow exterior pulsante (efecto de brillo alrededor del enemigo)
-        glow_radio = radio + 2 + int(2 * math.sin(self.tiempo * 6))
-        glow_surface = pygame.Surface((glow_radio * 4, glow_radio * 4), pygame.SRCALPHA)
+        glow_radio = radio + 2 + self._pulso_enemigo_glow
         glow_alpha = 80 if en_spawn else 120  # Opacidad del glow
-        pygame.draw.circle(glow_surface, (*color_enemigo, glow_alpha),
-                         (glow_radio * 2, glow_radio * 2), glow_radio)
-        superficie.blit(glow_surface, (centro_x - glow_radio * 2, centro_y - glow_radio * 2))
+        zona = self._dibujar_circulo_translucido(superficie, (*color_enemigo, glow_alpha),
+                                                 (centro_x, centro_y), glow_radio)
+        
+        # Enemigo principal: sprite pre-renderizado (ver _crear_sprite_enemigo).
+        # En spawn es semi-transparente y sin ojos
+        sprite = self._sprites_enemigo[(color_enemigo, en_spawn)]
+        mitad = sprite.get_width() // 2
+        return zona.union(superficie.blit(sprite, (centro_x - mitad, centro_y - mitad)))
+    
+    def dibujar_estatico(self, superficie: pygame.Surface, mapa: Mapa,
+                         offset: Tuple[int, int] = (0, 0)):
+        """
+        Dibuja la parte del mapa que no cambia entre frames.
         
-        # Enemigo principal con opacidad
-        if en_spawn:
-            # Crear superficie temporal para aplicar alpha (transparencia)
-            temp_surface = pygame.Surface((radio * 2 + 4, radio * 2 + 4), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, (*color_enemigo, alpha), (radio + 2, radio + 2), radio)
-            superficie.blit(temp_surface, (centro_x - radio - 2, centro_y - radio - 2))
-        else:
-            # Enemigo completamente visible
-            pygame.draw.circle(superficie, color_enemigo, (centro_x, centro_y), radio)
-        
-        # Ojos (dos puntos negros) - solo si no está en spawn
-        # Esto le da personalidad al enemigo
-        if not en_spawn:
-            pygame.draw.circle(superficie, Colores.FONDO_OSCURO, 
-                             (centro_x - 3, centro_y - 2), 2)  # Ojo izquierdo
-            pygame.draw.circle(superficie, Colores.FONDO_OSCURO,
-                             (centro_x + 3, centro_y - 2), 2)  # Ojo derecho
+        Incluye todas las celdas (tiles) y el marcador de la posición de
+        inicio. Puede dibujarse una sola vez en una superficie de fondo
+        y reutilizarse (ver PantallaJuego).
+        
+        Args:
+            superficie: Superficie de pygame donde dibujar.
+            mapa: Objeto Mapa a dibujar.
+            offset: Offset (x, y) en píxeles para posicionar el mapa en la pantalla.
+        """
+        # ============================================
+        # DIBUJAR TODAS LAS CELDAS DEL MAPA
+        # ============================================
+        # El mapa estático se renderiza una sola vez (ver _obtener_fondo);
+        # en cada frame solo se copia la parte visible de la superficie
+        superficie.blit(self._obtener_fondo(mapa), offset)
+        
+        # Marcar la posición de inicio encima de los tiles
+        self._actualizar_tablas_px(mapa, offset)
+        pos_inicio = mapa.obtener_posicion_inicio_jugador()
+        self._dibujar_posicion_especial(superficie, self._col_px[pos_inicio[1]],
+                                        self._fila_px[pos_inicio[0]], es_inicio=True)
     
-    def dibujar(self, superficie: pygame.Surface, mapa: Mapa, 
-                jugador: Jugador = None, offset: Tuple[int, int] = (0, 0),
-                trampas: Optional[List[Trampa]] = None,
-                enemigos: Optional[List[Enemigo]] = None,
-                modo: str = "escapa"):
+    def dibujar_dinamico(self, superficie: pygame.Surface, mapa: Mapa,
+                         jugador: Jugador = None, offset: Tuple[int, int] = (0, 0),
+                         trampas: Optional[List[Trampa]] = None,
+                         enemigos: Optional[List[Enemigo]] = None,
+                         modo: str = "escapa") -> List[pygame.Rect]:
         """
-        Dibuja el mapa completo con todos sus elementos.
+        Dibuja los elementos animados o móviles del mapa.
         
-        Este es el método principal de renderizado que dibuja:
-        - Todas las celdas del mapa (tiles)
-        - Posiciones especiales (inicio y salidas)
-        - Trampas activas
-        - Enemigos vivos
-        - Jugador con interpolación suave
+        Dibuja las salidas (con pulso), las trampas, los enemigos y el
+        jugador, y devuelve las zonas modificadas para poder actualizar
+        solo esas regiones de la pantalla.
         
         Args:
             superficie: Superficie de pygame donde dibujar.
             mapa: Objeto Mapa a dibujar.
             jugador: Jugador a dibujar (opcional).
             offset: Offset (x, y) en píxeles para posicionar el mapa en la pantalla.
-            trampas: Lista de trampas a dibujar (opcional).
-            enemigos: Lista de enemigos a dibujar (opcional).
+            trampas: Lista de trampas activas a dibujar (opcional, ya filtrada).
+            enemigos: Lista de enemigos vivos a dibujar (opcional, ya filtrada).
             modo: Modo de juego ("escapa" o "cazador") - afecta colores.
+            
+        Returns:
+            Lista de rectángulos de la superficie modificados.
         """
         offset_x, offset_y = offset
         pos_inicio = mapa.obtener_posicion_inicio_jugador()
         posiciones_salida = mapa.obtener_posiciones_salida()
-        
-        # ============================================
-        # DIBUJAR TODAS LAS CELDAS DEL MAPA
-        # ============================================
-        # Iterar sobre todas las celdas y dibujar cada tile
-        for fila in range(mapa.alto):
-            for col in range(mapa.ancho):
-                tile = mapa.obtener_casilla(fila, col)
-                # Calcular posición en píxeles
-                x = offset_x + col * self.tamano_celda
-                y = offset_y + fila * self.tamano_celda
-                
-                # Dibujar la celda (tile)
-                self._dibujar_celda(superficie, tile, x, y)
-                
-                # Marcar posiciones especiales (inicio y salidas)
-                if (fila, col) == pos_inicio:
-                    self._dibujar_posicion_especial(superficie, x, y, es_inicio=True)
-                elif (fila, col) in posiciones_salida:
-                    self._dibujar_posicion_especial(superficie, x, y, es_inicio=False)
+        tamano = self.tamano_celda
+        zonas = []
+        
+        # Coordenadas en píxeles de cada columna/fila (ver _actualizar_tablas_px)
+        self._actualizar_tablas_px(mapa, offset)
+        col_px = self._col_px
+        fila_px = self._fila_px
+        
+        # Zona visible (con margen de una celda para los brillos): las trampas
+        # y enemigos fuera de ella no se dibujan
+        vista = superficie.get_clip()
+        vista_x_min = vista.left - tamano
+        vista_x_max = vista.right
+        vista_y_min = vista.top - tamano
+        vista_y_max = vista.bottom
+        
+        # Marcar las salidas (con efecto de pulso) encima de los tiles
+        for salida in posiciones_salida:
+            if salida != pos_inicio:
+                zonas.append(self._dibujar_posicion_especial(superficie, col_px[salida[1]],
+                                                             fila_px[salida[0]], es_inicio=False))
         
         # ============================================
         # DIBUJAR TRAMPAS
         # ============================================
-        # Dibujar todas las trampas activas
+        # Las trampas llegan ya filtradas (solo activas)
         if trampas:
+            dibujar_trampa = self._dibujar_trampa  # Referencia local para el bucle
             for trampa in trampas:
-                if trampa.esta_activa():
-                    pos = trampa.obtener_posicion()
-                    x = offset_x + pos[1] * self.tamano_celda
-                    y = offset_y + pos[0] * self.tamano_celda
-                    self._dibujar_trampa(superficie, x, y)
+                pos = trampa.obtener_posicion()
+                x = col_px[pos[1]]
+                y = fila_px[pos[0]]
+                if vista_x_min < x < vista_x_max and vista_y_min < y < vista_y_max:
+                    zonas.append(dibujar_trampa(superficie, x, y))
         
         # ============================================
         # DIBUJAR ENEMIGOS
         # ============================================
-        # Dibujar todos los enemigos vivos
+        # Los enemigos llegan ya filtrados (solo vivos)
         if enemigos:
+            # Referencias locales para el bucle
+            dibujar_enemigo = self._dibujar_enemigo
+            en_spawn = EstadoEnemigo.EN_SPAWN
             for enemigo in enemigos:
-                if enemigo.esta_vivo():
-                    pos = enemigo.obtener_posicion()
-                    x = offset_x + pos[1] * self.tamano_celda
-                    y = offset_y + pos[0] * self.tamano_celda
-                    # Dibujar con opacidad reducida si está en spawn (apareciendo)
-                    self._dibujar_enemigo(superficie, x, y, en_spawn=enemigo.estado == EstadoEnemigo.EN_SPAWN, modo=modo)
+                pos = enemigo.obtener_posicion()
+                x = col_px[pos[1]]
+                y = fila_px[pos[0]]
+                if not (vista_x_min < x < vista_x_max and vista_y_min < y < vista_y_max):
+                    continue
+                # Dibujar con opacidad reducida si está en spawn (apareciendo)
+                zonas.append(dibujar_enemigo(superficie, x, y, enemigo.estado == en_spawn, modo))
         
         # ============================================
         # DIBUJAR JUGADOR
@@ -410,16 +702,47 @@ class RenderizadorMapa:
             pos = jugador.obtener_posicion()
             
             # Inicializar posición visual si es necesario (primera vez)
-            if self.posicion_jugador_visual is None:
-                self.posicion_jugador_visual = (
-                    pos[1] * self.tamano_celda,
-                    pos[0] * self.tamano_celda
-                )
+            if self._pjv_x is None:
+                self._pjv_x = pos[1] * tamano
+                self._pjv_y = pos[0] * tamano
             
             # Usar posición visual interpolada para movimiento suave
-            jugador_x = offset_x + self.posicion_jugador_visual[0]
-            jugador_y = offset_y + self.posicion_jugador_visual[1]
-            self._dibujar_jugador(superficie, jugador_x, jugador_y, modo)
+            zonas.append(self._dibujar_jugador(superficie, offset_x + self._pjv_x,
+                                               offset_y + self._pjv_y, modo))
+        
+        return zonas
+    
+    def dibujar(self, superficie: pygame.Surface, mapa: Mapa, 
+                jugador: Jugador = None, offset: Tuple[int, int] = (0, 0),
+                trampas: Optional[List[Trampa]] = None,
+                enemigos: Optional[List[Enemigo]] = None,
+                modo: str = "escapa") -> List[pygame.Rect]:
+        """
+        Dibuja el mapa completo con todos sus elementos.
+        
+        Este es el método principal de renderizado que dibuja:
+        - Todas las celdas del mapa (tiles)
+        - Posiciones especiales (inicio y salidas)
+        - Trampas activas
+        - Enemigos vivos
+        - Jugador con interpolación suave
+        
+        Equivale a dibujar_estatico seguido de dibujar_dinamico.
+        
+        Args:
+            superficie: Superficie de pygame donde dibujar.
+            mapa: Objeto Mapa a dibujar.
+            jugador: Jugador a dibujar (opcional).
+            offset: Offset (x, y) en píxeles para posicionar el mapa en la pantalla.
+            trampas: Lista de trampas activas a dibujar (opcional, ya filtrada).
+            enemigos: Lista de enemigos vivos a dibujar (opcional, ya filtrada).
+            modo: Modo de juego ("escapa" o "cazador") - afecta colores.
+            
+        Returns:
+            Lista de rectángulos modificados por los elementos dinámicos.
+        """
+        self.dibujar_estatico(superficie, mapa, offset)
+        return self.dibujar_dinamico(superficie, mapa, jugador, offset, trampas, enemigos, modo)
     
     def resetear_posicion_jugador(self, jugador: Jugador):
         """
@@ -435,10 +758,8 @@ class RenderizadorMapa:
         if jugador:
             pos = jugador.obtener_posicion()
             # Sincronizar posición visual con posición lógica
-            self.posicion_jugador_visual = (
-                pos[1] * self.tamano_celda,
-                pos[0] * self.tamano_celda
-            )
+            self._pjv_x = pos[1] * self.tamano_celda
+            self._pjv_y = pos[0] * self.tamano_celda
     
     def obtener_tamano_mapa_pixeles(self, mapa: Mapa) -> Tuple[int, int]:
         """
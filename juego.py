@@ -15,15 +15,31 @@ Controles:
     - ESC: Pausar / Menú
 """
 
-import pygame
 import sys
 import os
-import traceback
-# Agregar el directorio del proyecto al path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import time
 
-from gui.config import Config, Colores
-from gui.pantallas import MenuPrincipal, PantallaJuego, PantallaPuntajes, PantallaInformacion, PantallaDetallesModos
+# pygame y los módulos de la GUI se importan al crear el juego (ver
+# _importar_modulos_graficos): importar este módulo no carga pygame
+pygame = None
+Config = None
+MenuPrincipal = PantallaJuego = PantallaPuntajes = None
+PantallaInformacion = PantallaDetallesModos = None
+
+
+def _importar_modulos_graficos():
+    """
+    Importa pygame y las pantallas de la GUI en el espacio global del módulo.
+    
+    Se llama al crear JuegoLaberinto; las importaciones posteriores son
+    solo una búsqueda en sys.modules.
+    """
+    global pygame, Config, MenuPrincipal, PantallaJuego, PantallaPuntajes
+    global PantallaInformacion, PantallaDetallesModos
+    import pygame
+    from gui.config import Config
+    from gui.pantallas import (MenuPrincipal, PantallaJuego, PantallaPuntajes,
+                               PantallaInformacion, PantallaDetallesModos)
 
 
 class JuegoLaberinto:
@@ -45,26 +61,28 @@ class JuegoLaberinto:
         inicializa el reloj de pygame y establece el estado inicial
         del juego en el menú principal.
         """
-        # Inicializar pygame
+        # Cargar pygame y la GUI, e inicializar pygame
+        _importar_modulos_graficos()
         pygame.init()
         pygame.display.set_caption(Config.TITULO)
         
         # Configurar ventana (pantalla completa o ventana)
-        if Config.PANTALLA_COMPLETA:
-            # Modo pantalla completa: usar toda la pantalla disponible
-            self.ventana = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-            # Obtener dimensiones reales de la pantalla
-            self.ancho_pantalla, self.alto_pantalla = self.ventana.get_size()
-        else:
-            # Modo ventana: usar dimensiones predefinidas
-            self.ventana = pygame.display.set_mode(
-                (Config.ANCHO_VENTANA, Config.ALTO_VENTANA)
-            )
-            self.ancho_pantalla = Config.ANCHO_VENTANA
-            self.alto_pantalla = Config.ALTO_VENTANA
+        self._crear_ventana()
+        
+        # Encolar solo los eventos que alguna pantalla procesa; el resto (por ejemplo
+        # MOUSEMOTION, ya que el mouse se consulta con pygame.mouse.get_pos()) se
+        # descarta en SDL sin llegar a crear objetos de evento en Python.
+        # Los eventos de ventana expuesta se conservan para repintarla completa
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+            pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+            pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE,
+        ])
         
-        # Reloj para controlar FPS
-        self.reloj = pygame.time.Clock()
+        # Reloj de alta resolución (segundos) para el bucle de paso fijo;
+        # Clock.tick tiene una granularidad de >10 ms en algunas plataformas
+        self.reloj = time.perf_counter
         # Flag para controlar si el juego sigue corriendo
         self.corriendo = True
         
@@ -73,48 +91,92 @@ class JuegoLaberinto:
         # Nombre del jugador (se actualiza cuando inicia una partida)
         self.nombre_jugador = "Jugador"
         
+        # Teclas globales: se manejan aquí y no se pasan a la pantalla actual
+        self._teclas_globales = {
+            pygame.K_F11: self._alternar_pantalla_completa,
+        }
+        
+        # Tabla de navegación: destino solicitado por una pantalla -> acción.
+        # Cada acción recibe los datos de retorno de la pantalla (ej: modo, nombre)
+        self._navegacion = {
+            "salir": lambda datos: self._salir(),
+            "menu": lambda datos: self._ir_a_menu(),
+            "juego": lambda datos: self._ir_a_juego(datos.get("modo", "escapa"), datos.get("nombre", "Jugador")),
+            "juego_nuevo": lambda datos: self._ir_a_juego(datos.get("modo", "escapa"), self.nombre_jugador),
+            "puntajes": lambda datos: self._ir_a_puntajes(),
+            "informacion": lambda datos: self._ir_a_informacion(),
+            "detalles_modos": lambda datos: self._ir_a_detalles_modos(),
+        }
+        
         # Iniciar en el menú principal
         self._ir_a_menu()
+        self._configurar_eventos_pantalla()
     
-    def _alternar_pantalla_completa(self):
+    def _configurar_eventos_pantalla(self):
         """
-        Alterna entre pantalla completa y ventana.
+        Habilita MOUSEMOTION en SDL solo si la pantalla actual lo necesita.
         
-        Cambia el modo de visualización y recrea la pantalla actual
-        con las nuevas dimensiones para mantener la consistencia visual.
+        Las pantallas que siguen el mouse con eventos (en lugar de consultar
+        pygame.mouse.get_pos()) lo indican con USA_MOVIMIENTO_MOUSE; para el
+        resto el evento se bloquea y no llega a encolarse.
         """
-        # Cambiar el estado de pantalla completa
-        Config.PANTALLA_COMPLETA = not Config.PANTALLA_COMPLETA
+        if self.pantalla_actual.USA_MOVIMIENTO_MOUSE:
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
+        else:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+    
+    def _crear_ventana(self):
+        """
+        Crea la superficie de la ventana según Config.PANTALLA_COMPLETA.
         
-        # Aplicar el nuevo modo de visualización
+        Pide a SDL una ventana SCALED con doble buffer y vsync, que se
+        presenta como una textura en la GPU (flip barato y sin tearing).
+        Si el sistema no lo soporta, se usa el modo por software de siempre.
+        Actualiza también ancho_pantalla y alto_pantalla.
+        """
         if Config.PANTALLA_COMPLETA:
-            # Cambiar a pantalla completa
-            self.ventana = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            # Modo pantalla completa: usar toda la pantalla disponible
+            # (SCALED no admite el tamaño (0, 0), se pide el del escritorio)
+            tamano = pygame.display.get_desktop_sizes()[0]
+            banderas = pygame.FULLSCREEN
         else:
-            # Cambiar a ventana con dimensiones predefinidas
+            # Modo ventana: usar dimensiones predefinidas
+            tamano = (Config.ANCHO_VENTANA, Config.ALTO_VENTANA)
+            banderas = 0
+        
+        try:
+            self.ventana = pygame.display.set_mode(
+                tamano, banderas | pygame.SCALED | pygame.DOUBLEBUF, vsync=1
+            )
+        except pygame.error:
+            # Sin renderizador acelerado o sin vsync: modo por software
             self.ventana = pygame.display.set_mode(
-                (Config.ANCHO_VENTANA, Config.ALTO_VENTANA)
+                (0, 0) if Config.PANTALLA_COMPLETA else tamano, banderas
             )
         
-        # Actualizar dimensiones
+        # Obtener dimensiones reales de la ventana
         self.ancho_pantalla, self.alto_pantalla = self.ventana.get_size()
+    
+    def _alternar_pantalla_completa(self):
+        """
+        Alterna entre pantalla completa y ventana.
         
-        # Recrear la pantalla actual con las nuevas dimensiones
-        # para que se ajuste correctamente al nuevo tamaño
-        if isinstance(self.pantalla_actual, MenuPrincipal):
-            self._ir_a_menu()
-        elif isinstance(self.pantalla_actual, PantallaJuego):
-            # Obtener datos del juego actual para recrearlo
-            datos = self.pantalla_actual.datos_retorno if hasattr(self.pantalla_actual, 'datos_retorno') else {}
-            self.pantalla_actual = PantallaJuego(
-                self.ancho_pantalla, self.alto_pantalla,
-                datos.get("modo", "escapa"),
-                datos.get("nombre_jugador", "Jugador")
-            )
-        elif isinstance(self.pantalla_actual, PantallaPuntajes):
-            self.pantalla_actual = PantallaPuntajes(
-                self.ancho_pantalla, self.alto_pantalla
-            )
+        Cambia el modo de visualización y adapta la pantalla actual
+        a las nuevas dimensiones para mantener la consistencia visual.
+        """
+        # Cambiar el estado de pantalla completa
+        Config.PANTALLA_COMPLETA = not Config.PANTALLA_COMPLETA
+        
+        # Aplicar el nuevo modo de visualización (actualiza las dimensiones)
+        self._crear_ventana()
+        
+        # Adaptar la pantalla actual a las nuevas dimensiones sin recrearla,
+        # así una partida en curso conserva su mapa, enemigos y trampas
+        self.pantalla_actual.redimensionar(self.ancho_pantalla, self.alto_pantalla)
+    
+    def _salir(self):
+        """Detiene el bucle principal del juego."""
+        self.corriendo = False
     
     def _ir_a_menu(self):
         """
@@ -172,86 +234,140 @@ class JuegoLaberinto:
         self.pantalla_actual = PantallaDetallesModos(self.ancho_pantalla, self.alto_pantalla)
         self.pantalla_actual.inicializar_fuentes()
     
-    def _manejar_navegacion(self):
+    def _manejar_navegacion(self) -> bool:
         """
         Maneja la navegación entre pantallas.
         
         Verifica si la pantalla actual ha solicitado un cambio de pantalla
         y ejecuta la transición correspondiente. Las pantallas indican su
         destino mediante el atributo `siguiente_pantalla`.
+        
+        Returns:
+            True si se ejecutó una transición (la pantalla actual pudo
+            cambiar), False en caso contrario.
         """
         # Verificar si hay una solicitud de cambio de pantalla
-        if self.pantalla_actual.siguiente_pantalla:
-            destino = self.pantalla_actual.siguiente_pantalla
-            # Obtener datos adicionales si los hay (ej: modo de juego, nombre)
-            datos = self.pantalla_actual.datos_retorno
-            
-            # Ejecutar la transición según el destino
-            if destino == "salir":
-                # Salir del juego
-                self.corriendo = False
-            elif destino == "menu":
-                # Ir al menú principal
-                self._ir_a_menu()
-            elif destino == "juego":
-                # Iniciar nueva partida
-                self._ir_a_juego(datos.get("modo", "escapa"), datos.get("nombre", "Jugador"))
-            elif destino == "juego_nuevo":
-                # Reiniciar partida con el mismo modo
-                self._ir_a_juego(datos.get("modo", "escapa"), self.nombre_jugador)
-            elif destino == "puntajes":
-                # Ir a la pantalla de puntajes
-                self._ir_a_puntajes()
-            elif destino == "informacion":
-                # Ir a la pantalla de información
-                self._ir_a_informacion()
-            elif destino == "detalles_modos":
-                # Ir a la pantalla de detalles de modos
-                self._ir_a_detalles_modos()
+        destino = self.pantalla_actual.siguiente_pantalla
+        if destino:
+            # Ejecutar la transición según el destino (ver tabla _navegacion),
+            # pasando los datos adicionales si los hay (ej: modo de juego, nombre)
+            accion = self._navegacion.get(destino)
+            if accion:
+                accion(self.pantalla_actual.datos_retorno)
+                self._configurar_eventos_pantalla()
+                return True
+        return False
     
     def ejecutar(self):
         """
         Bucle principal del juego.
         
         Este método contiene el ciclo principal del juego que se ejecuta
-        continuamente hasta que el usuario cierra el juego. En cada iteración:
-        1. Calcula el tiempo transcurrido (delta time)
-        2. Procesa eventos de entrada (teclado, mouse, etc.)
-        3. Actualiza el estado del juego
-        4. Maneja la navegación entre pantallas
-        5. Dibuja el contenido en la pantalla
+        continuamente hasta que el usuario cierra el juego. La entrada, la
+        lógica y el dibujado corren con calendarios independientes:
+        1. Procesa eventos de entrada en cada iteración del bucle
+        2. Actualiza el estado del juego en pasos fijos de 1/FPS_LOGICA
+           segundos, consumidos desde un acumulador de tiempo
+        3. Maneja la navegación entre pantallas tras cada paso de lógica
+        4. Dibuja el contenido solo cuando se cumple el intervalo de
+           1/FPS de la pantalla actual
+        5. Cede la CPU durante el tiempo sobrante hasta el siguiente plazo
         """
+        QUIT = pygame.QUIT
+        KEYDOWN = pygame.KEYDOWN
+        EXPUESTA = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+        obtener_eventos = pygame.event.get
+        flip = pygame.display.flip
+        actualizar_zonas = pygame.display.update
+        manejar_navegacion = self._manejar_navegacion
+        teclas_globales = self._teclas_globales
+        reloj = self.reloj
+        dormir = time.sleep
+        
+        paso_logica = 1.0 / Config.FPS_LOGICA
+        # Tope del tiempo acumulado por iteración: evita la "espiral de la
+        # muerte" tras una pausa larga (arrastrar la ventana, un breakpoint...)
+        max_transcurrido = Config.MAX_PASOS_LOGICA * paso_logica
+        
+        # Pantalla actual en una variable local; se vuelve a leer solo
+        # cuando puede haber cambiado (tecla global o navegación), junto con
+        # su intervalo de dibujado (cada pantalla declara sus FPS)
+        pantalla = self.pantalla_actual
+        intervalo_dibujo = 1.0 / pantalla.FPS
+        
+        acumulador_logica = 0.0
+        acumulador_dibujo = intervalo_dibujo  # Dibujar en la primera iteración
+        # Si la ventana fue tapada/expuesta, su contenido en el escritorio puede
+        # estar desactualizado: el siguiente frame se presenta completo
+        presentar_completo = False
+        anterior = reloj()
+        
         while self.corriendo:
-            # Calcular delta time en segundos (tiempo transcurrido desde el último frame)
-            # tick() limita el FPS y devuelve milisegundos, convertimos a segundos
-            dt = self.reloj.tick(Config.FPS) / 1000.0
+            # Tiempo real transcurrido desde la iteración anterior (segundos)
+            ahora = reloj()
+            transcurrido = ahora - anterior
+            anterior = ahora
+            if transcurrido > max_transcurrido:
+                transcurrido = max_transcurrido
+            acumulador_logica += transcurrido
+            acumulador_dibujo += transcurrido
             
-            # Manejar eventos de pygame
-            for evento in pygame.event.get():
+            # Manejar eventos de pygame en cada iteración, sin esperar al
+            # siguiente frame (referencias locales para el bucle de eventos)
+            manejar_evento = pantalla.manejar_evento
+            # Cada tipo se extrae con un get() filtrado (la selección la hace
+            # SDL en C); solo el primero bombea la cola del sistema
+            if obtener_eventos(QUIT):
                 # Evento de cierre de ventana
-                if evento.type == pygame.QUIT:
-                    self.corriendo = False
-                elif evento.type == pygame.KEYDOWN:
-                    # F11 para alternar entre pantalla completa y ventana
-                    if evento.key == pygame.K_F11:
-                        self._alternar_pantalla_completa()
-                    else:
-                        # Pasar otros eventos a la pantalla actual
-                        self.pantalla_actual.manejar_evento(evento)
+                self.corriendo = False
+            if obtener_eventos(EXPUESTA, pump=False):
+                presentar_completo = True
+            for evento in obtener_eventos(KEYDOWN, pump=False):
+                if evento.key in teclas_globales:
+                    # Teclas globales (F11: alternar pantalla completa)
+                    teclas_globales[evento.key]()
+                    pantalla = self.pantalla_actual
+                    manejar_evento = pantalla.manejar_evento
+                    intervalo_dibujo = 1.0 / pantalla.FPS
                 else:
-                    # Pasar todos los demás eventos a la pantalla actual
-                    self.pantalla_actual.manejar_evento(evento)
+                    manejar_evento(evento)
+            # Pasar todos los demás eventos a la pantalla actual
+            for evento in obtener_eventos(pump=False):
+                manejar_evento(evento)
             
-            # Actualizar el estado del juego (lógica, animaciones, etc.)
-            self.pantalla_actual.actualizar(dt)
+            # Actualizar el estado del juego con un dt fijo (lógica determinista)
+            while acumulador_logica >= paso_logica:
+                pantalla.actualizar(paso_logica)
+                # Verificar si hay solicitud de cambio de pantalla
+                if manejar_navegacion():
+                    pantalla = self.pantalla_actual
+                    intervalo_dibujo = 1.0 / pantalla.FPS
+                acumulador_logica -= paso_logica
             
-            # Verificar si hay solicitud de cambio de pantalla
-            self._manejar_navegacion()
+            if acumulador_dibujo >= intervalo_dibujo:
+                # Si el dibujado se retrasó más de un intervalo, no intentar
+                # recuperar los frames perdidos
+                acumulador_dibujo %= intervalo_dibujo
+                
+                # Dibujar el contenido de la pantalla actual
+                zonas_modificadas = pantalla.dibujar(self.ventana)
+                # Actualizar la pantalla (mostrar el frame dibujado): solo las zonas
+                # modificadas si la pantalla las informa, o la ventana completa si no
+                if zonas_modificadas is None or presentar_completo:
+                    flip()
+                    presentar_completo = False
+                elif zonas_modificadas:
+                    actualizar_zonas(zonas_modificadas)
             
-            # Dibujar el contenido de la pantalla actual
-            self.pantalla_actual.dibujar(self.ventana)
-            # Actualizar la pantalla (mostrar el frame dibujado)
-            pygame.display.flip()
+            # Ceder la CPU hasta el próximo plazo (lógica o dibujado). Se duerme
+            # solo la parte gruesa de la espera y el resto se reparte entre
+            # iteraciones con sleep(0), por la poca precisión de sleep()
+            espera = min(paso_logica - acumulador_logica,
+                         intervalo_dibujo - acumulador_dibujo)
+            if espera > Config.MARGEN_ESPERA:
+                dormir(espera - Config.MARGEN_ESPERA)
+            else:
+                dormir(0)
         
         # Limpiar recursos de pygame y salir
         pygame.quit()
@@ -284,10 +400,13 @@ def main():
         # Manejar errores y mostrar información de depuración
         print(f"\n[ERROR] Error al ejecutar el juego: {e}")
         # Mostrar el traceback completo para depuración
+        import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
 if __name__ == "__main__":
+    # Agregar el directorio del proyecto al path
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     main()
 
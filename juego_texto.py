@@ -2,23 +2,138 @@
 Interfaz mínima de texto para probar los modos de juego.
 """
 
+import random
 import sys
-import time
 from modos import GameModeEscapa, GameModeCazador
 from logica import Dificultad
 from sistema import ScoreBoard
 
 
+# Simulación por pasos fijos: el estado del juego solo depende del dt que se
+# le pasa, así que no hace falta esperar tiempo real entre actualizaciones
+PASO_SIMULACION = 0.1  # Segundos de juego simulados por paso
+PASOS_POR_REPORTE = 10  # Mostrar el estado cada 10 pasos (1 segundo de juego)
+MAX_PASOS_SIMULACION = 3000  # Tope de seguridad (5 minutos de juego)
+
+# ============================================
+# TEXTOS FIJOS DE LA INTERFAZ
+# ============================================
+# Se arman una sola vez y se escriben con un único sys.stdout.write
+SEPARADOR = "=" * 60
+SEPARADOR_SIMPLE = "-" * 60
+
+BANNER_INICIO = "\n".join([
+    "",
+    SEPARADOR,
+    "   ESCAPA DEL LABERINTO - Interfaz de Texto",
+    SEPARADOR,
+    "",
+    "Esta es una interfaz mínima para probar los modos de juego.",
+    "En una implementación completa, esto sería una GUI interactiva.",
+    "",
+])
+
+BANNER_MENU = "\n".join([
+    "",
+    SEPARADOR,
+    "   ESCAPA DEL LABERINTO - Modos de Juego",
+    SEPARADOR,
+    "",
+    "1. Modo Escapa",
+    "2. Modo Cazador",
+    "3. Ver Top 5 Puntajes",
+    "4. Salir",
+    "",
+    SEPARADOR_SIMPLE,
+    "",
+])
+
+BANNER_DIFICULTAD = "\n".join([
+    "",
+    SEPARADOR_SIMPLE,
+    "Dificultades disponibles:",
+    "1. Fácil",
+    "2. Normal",
+    "3. Difícil",
+    SEPARADOR_SIMPLE,
+    "",
+])
+
+BANNER_ESCAPA = "\n".join([
+    "",
+    SEPARADOR,
+    "   MODO ESCAPA",
+    SEPARADOR,
+    "",
+    "Objetivo: Llega a la salida antes de que los enemigos te alcancen.",
+    "Puedes colocar trampas (máximo 3, cooldown 5 segundos) para eliminar enemigos.",
+    "",
+    "Controles simulados:",
+    "  - w/a/s/d: Mover (arriba/izquierda/abajo/derecha)",
+    "  - t: Colocar trampa",
+    "  - q: Terminar partida",
+    "",
+    SEPARADOR_SIMPLE,
+    "",
+])
+
+BANNER_CAZADOR = "\n".join([
+    "",
+    SEPARADOR,
+    "   MODO CAZADOR",
+    SEPARADOR,
+    "",
+    "Objetivo: Atrapa a los enemigos antes de que escapen por la salida.",
+    "Gana puntos por cada captura, pierde puntos si un enemigo escapa.",
+    "",
+    "Controles simulados:",
+    "  - w/a/s/d: Mover (arriba/izquierda/abajo/derecha)",
+    "  - q: Terminar partida",
+    "",
+    SEPARADOR_SIMPLE,
+    "",
+])
+
+BANNER_TOP5 = "\n".join([
+    "",
+    SEPARADOR,
+    "   TOP 5 PUNTAJES",
+    SEPARADOR,
+    "",
+])
+
+# ScoreBoard compartido por la interfaz de texto; se crea (y lee los JSON
+# de disco) la primera vez que se consulta el top 5
+_scoreboard = None
+
+
+def obtener_scoreboard() -> ScoreBoard:
+    """
+    Obtiene el ScoreBoard de la interfaz, cargándolo solo si hace falta.
+    
+    Returns:
+        El ScoreBoard en caché con los puntajes leídos de disco.
+    """
+    global _scoreboard
+    if _scoreboard is None:
+        _scoreboard = ScoreBoard()
+    return _scoreboard
+
+
+def invalidar_scoreboard():
+    """
+    Descarta el ScoreBoard en caché.
+    
+    Los modos de juego registran sus puntajes con su propio ScoreBoard,
+    así que tras cada partida hay que volver a leer los archivos.
+    """
+    global _scoreboard
+    _scoreboard = None
+
+
 def mostrar_menu_principal():
     """Muestra el menú principal y obtiene la selección del usuario."""
-    print("\n" + "=" * 60)
-    print("   ESCAPA DEL LABERINTO - Modos de Juego")
-    print("=" * 60)
-    print("\n1. Modo Escapa")
-    print("2. Modo Cazador")
-    print("3. Ver Top 5 Puntajes")
-    print("4. Salir")
-    print("\n" + "-" * 60)
+    sys.stdout.write(BANNER_MENU)
     
     opcion = input("Selecciona una opción (1-4): ").strip()
     return opcion
@@ -26,12 +141,7 @@ def mostrar_menu_principal():
 
 def seleccionar_dificultad():
     """Permite al usuario seleccionar la dificultad."""
-    print("\n" + "-" * 60)
-    print("Dificultades disponibles:")
-    print("1. Fácil")
-    print("2. Normal")
-    print("3. Difícil")
-    print("-" * 60)
+    sys.stdout.write(BANNER_DIFICULTAD)
     
     opcion = input("Selecciona dificultad (1-3, por defecto Normal): ").strip()
     
@@ -51,16 +161,7 @@ def obtener_nombre_jugador():
 
 def simular_modo_escapa():
     """Simula una partida del modo Escapa."""
-    print("\n" + "=" * 60)
-    print("   MODO ESCAPA")
-    print("=" * 60)
-    print("\nObjetivo: Llega a la salida antes de que los enemigos te alcancen.")
-    print("Puedes colocar trampas (máximo 3, cooldown 5 segundos) para eliminar enemigos.")
-    print("\nControles simulados:")
-    print("  - w/a/s/d: Mover (arriba/izquierda/abajo/derecha)")
-    print("  - t: Colocar trampa")
-    print("  - q: Terminar partida")
-    print("\n" + "-" * 60)
+    sys.stdout.write(BANNER_ESCAPA)
     
     nombre = obtener_nombre_jugador()
     dificultad = seleccionar_dificultad()
@@ -79,19 +180,23 @@ def simular_modo_escapa():
     print(f"Posición inicial: {modo.jugador.obtener_posicion()}")
     print(f"Salida: {modo.mapa.obtener_posicion_salida()}")
     
-    # Simular partida
-    ultima_actualizacion = time.time()
+    # Camino más corto hacia la salida, calculado una sola vez (la salida no
+    # cambia durante la partida)
+    camino = modo.mapa.obtener_camino_mas_corto(
+        modo.jugador.obtener_posicion(), modo.mapa.obtener_posicion_salida()
+    ) or []
+    siguiente = 0
     
-    while not modo.juego_terminado:
-        tiempo_actual = time.time()
-        delta_tiempo = tiempo_actual - ultima_actualizacion
-        ultima_actualizacion = tiempo_actual
+    # Simular partida con un dt fijo por paso
+    for paso in range(1, MAX_PASOS_SIMULACION + 1):
+        if modo.juego_terminado:
+            break
         
         # Actualizar juego
-        modo.actualizar(delta_tiempo)
+        modo.actualizar(PASO_SIMULACION)
         
-        # Mostrar estado cada segundo aproximadamente
-        if int(modo.tiempo_juego) != int(modo.tiempo_juego - delta_tiempo):
+        # Mostrar estado cada segundo de juego
+        if paso % PASOS_POR_REPORTE == 0:
             estado = modo.obtener_estado()
             print(f"\n[Tiempo: {estado['tiempo_juego']:.1f}s] "
                   f"Puntos: {estado['puntos']} | "
@@ -101,22 +206,11 @@ def simular_modo_escapa():
         
         # Simular entrada del usuario (simplificado)
         # En una implementación real, esto sería un bucle de eventos
-        time.sleep(0.1)  # Pequeña pausa para no saturar
-        
-        # Simular algunos movimientos automáticos hacia la salida
-        if modo.movimientos < 50:  # Limitar movimientos para la demo
-            salida = modo.mapa.obtener_posicion_salida()
-            jugador_pos = modo.jugador.obtener_posicion()
-            
-            # Movimiento simple hacia la salida
-            if jugador_pos[0] < salida[0]:
-                modo.mover_jugador("abajo", corriendo=False)
-            elif jugador_pos[0] > salida[0]:
-                modo.mover_jugador("arriba", corriendo=False)
-            elif jugador_pos[1] < salida[1]:
-                modo.mover_jugador("derecha", corriendo=False)
-            elif jugador_pos[1] > salida[1]:
-                modo.mover_jugador("izquierda", corriendo=False)
+        # Simular algunos movimientos automáticos hacia la salida, siguiendo
+        # el camino precalculado (se avanza solo si el movimiento se realizó)
+        if modo.movimientos < 50 and siguiente < len(camino):  # Limitar movimientos para la demo
+            if modo.mover_jugador(camino[siguiente], corriendo=False):
+                siguiente += 1
         
         # Verificar si llegó a la salida
         if modo.jugador.ha_llegado_a_salida(modo.mapa):
@@ -137,17 +231,15 @@ def simular_modo_escapa():
     print("=" * 60)
 
 
-def simular_modo_cazador():
-    """Simula una partida del modo Cazador."""
-    print("\n" + "=" * 60)
-    print("   MODO CAZADOR")
-    print("=" * 60)
-    print("\nObjetivo: Atrapa a los enemigos antes de que escapen por la salida.")
-    print("Gana puntos por cada captura, pierde puntos si un enemigo escapa.")
-    print("\nControles simulados:")
-    print("  - w/a/s/d: Mover (arriba/izquierda/abajo/derecha)")
-    print("  - q: Terminar partida")
-    print("\n" + "-" * 60)
+def simular_modo_cazador(semilla=None):
+    """
+    Simula una partida del modo Cazador.
+    
+    Args:
+        semilla: Semilla para los movimientos aleatorios del jugador simulado.
+                 Si es None, cada partida usa movimientos distintos.
+    """
+    sys.stdout.write(BANNER_CAZADOR)
     
     nombre = obtener_nombre_jugador()
     dificultad = seleccionar_dificultad()
@@ -167,19 +259,23 @@ def simular_modo_cazador():
     print(f"Tiempo límite: {modo.tiempo_limite} segundos")
     print(f"Puntos iniciales: {modo.puntos}")
     
-    # Simular partida
-    ultima_actualizacion = time.time()
+    # Generador propio (sin el estado global del módulo random) y
+    # referencias locales para el bucle de simulación
+    generador = random.Random(semilla)
+    aleatorio = generador.random
+    elegir = generador.choice
+    direcciones = ("arriba", "abajo", "izquierda", "derecha")
     
-    while not modo.juego_terminado:
-        tiempo_actual = time.time()
-        delta_tiempo = tiempo_actual - ultima_actualizacion
-        ultima_actualizacion = tiempo_actual
+    # Simular partida con un dt fijo por paso
+    for paso in range(1, MAX_PASOS_SIMULACION + 1):
+        if modo.juego_terminado:
+            break
         
         # Actualizar juego
-        modo.actualizar(delta_tiempo)
+        modo.actualizar(PASO_SIMULACION)
         
-        # Mostrar estado cada segundo aproximadamente
-        if int(modo.tiempo_juego) != int(modo.tiempo_juego - delta_tiempo):
+        # Mostrar estado cada segundo de juego
+        if paso % PASOS_POR_REPORTE == 0:
             estado = modo.obtener_estado()
             print(f"\n[Tiempo: {estado['tiempo_restante']:.1f}s restantes] "
                   f"Puntos: {estado['puntos']} | "
@@ -188,16 +284,11 @@ def simular_modo_cazador():
                   f"Escapados: {estado['enemigos_escapados']}")
         
         # Simular entrada del usuario (simplificado)
-        time.sleep(0.1)
-        
         # Simular algunos movimientos automáticos
         if modo.movimientos < 30:  # Limitar movimientos para la demo
             # Movimiento aleatorio simple
-            import random
-            direcciones = ["arriba", "abajo", "izquierda", "derecha"]
-            if random.random() < 0.3:  # 30% de probabilidad de moverse
-                direccion = random.choice(direcciones)
-                modo.mover_jugador(direccion, corriendo=False)
+            if aleatorio() < 0.3:  # 30% de probabilidad de moverse
+                modo.mover_jugador(elegir(direcciones), corriendo=False)
     
     # Mostrar resultado final
     estado_final = modo.obtener_estado()
@@ -213,49 +304,39 @@ def simular_modo_cazador():
 
 def mostrar_top5_puntajes():
     """Muestra el top 5 de puntajes para ambos modos."""
-    print("\n" + "=" * 60)
-    print("   TOP 5 PUNTAJES")
-    print("=" * 60)
+    scoreboard = obtener_scoreboard()
     
-    scoreboard = ScoreBoard()
-    
-    print("\n--- MODO ESCAPA ---")
-    top5_escapa = scoreboard.obtener_top5("escapa")
-    if top5_escapa:
-        for i, puntaje in enumerate(top5_escapa, 1):
-            fecha_str = puntaje.obtener_fecha_formateada()
-            print(f"  {i}. {puntaje.nombre_jugador}: {puntaje.puntos} puntos ({fecha_str})")
-    else:
-        print("  No hay puntajes registrados aún.")
-    
-    print("\n--- MODO CAZADOR ---")
-    top5_cazador = scoreboard.obtener_top5("cazador")
-    if top5_cazador:
-        for i, puntaje in enumerate(top5_cazador, 1):
-            fecha_str = puntaje.obtener_fecha_formateada()
-            print(f"  {i}. {puntaje.nombre_jugador}: {puntaje.puntos} puntos ({fecha_str})")
-    else:
-        print("  No hay puntajes registrados aún.")
-    
-    print("\n" + "=" * 60)
+    # Acumular todas las líneas y escribirlas de una sola vez
+    lineas = [BANNER_TOP5]
+    for titulo, modo in (("MODO ESCAPA", "escapa"), ("MODO CAZADOR", "cazador")):
+        lineas.append(f"\n--- {titulo} ---\n")
+        top5 = tuple(scoreboard.obtener_top5(modo))
+        if top5:
+            lineas.extend([
+                f"  {i}. {puntaje.nombre_jugador}: {puntaje.puntos} puntos "
+                f"({puntaje.obtener_fecha_formateada()})\n"
+                for i, puntaje in enumerate(top5, 1)
+            ])
+        else:
+            lineas.append("  No hay puntajes registrados aún.\n")
+    lineas.append("\n" + SEPARADOR + "\n")
+    sys.stdout.write("".join(lineas))
     input("\nPresiona Enter para continuar...")
 
 
 def main():
     """Función principal."""
-    print("\n" + "=" * 60)
-    print("   ESCAPA DEL LABERINTO - Interfaz de Texto")
-    print("=" * 60)
-    print("\nEsta es una interfaz mínima para probar los modos de juego.")
-    print("En una implementación completa, esto sería una GUI interactiva.")
+    sys.stdout.write(BANNER_INICIO)
     
     while True:
         opcion = mostrar_menu_principal()
         
         if opcion == "1":
             simular_modo_escapa()
+            invalidar_scoreboard()
         elif opcion == "2":
             simular_modo_cazador()
+            invalidar_scoreboard()
         elif opcion == "3":
             mostrar_top5_puntajes()
         elif opcion == "4":
@@ -3,7 +3,7 @@ Módulo logica: Contiene la lógica del juego (generación de mapas, dificultad)
 """
 
 from .generador_mapa import GeneradorMapa
-from .dificultad import Dificultad, ConfiguracionDificultad
+from .dificultad import Dificultad, ConfiguracionDificultad, ParametrosDificultad
 
-__all__ = ['GeneradorMapa', 'Dificultad', 'ConfiguracionDificultad']
+__all__ = ['GeneradorMapa', 'Dificultad', 'ConfiguracionDificultad', 'ParametrosDificultad']
 
@@ -2,6 +2,7 @@
 Módulo dificultad: Define el sistema de dificultad del juego.
 """
 
+from dataclasses import dataclass, asdict
 from enum import Enum
 from typing import Dict, Any
 
@@ -13,6 +14,39 @@ class Dificultad(Enum):
     DIFICIL = "dificil"
 
 
+@dataclass(frozen=True)
+class ParametrosDificultad:
+    """
+    Parámetros de balance de un nivel de dificultad (solo lectura).
+    
+    Cada campo se lee como un atributo con slot, sin búsquedas en
+    diccionarios anidados. Los __slots__ se declaran a mano porque
+    dataclass(slots=True) requiere Python 3.10.
+    """
+    
+    __slots__ = (
+        "cantidad_enemigos",
+        "velocidad_enemigos",
+        "energia_inicial_jugador",
+        "puntos_base_escapa",
+        "puntos_base_cazador",
+        "puntos_por_enemigo_eliminado",
+        "puntos_perdidos_por_escape",
+        "puntos_ganados_por_captura",
+        "tiempo_respawn_enemigo",
+    )
+    
+    cantidad_enemigos: int
+    velocidad_enemigos: float  # movimientos por segundo
+    energia_inicial_jugador: int
+    puntos_base_escapa: int  # Puntos base al completar el modo escapa
+    puntos_base_cazador: int  # Puntos iniciales en modo cazador
+    puntos_por_enemigo_eliminado: int  # Bono por eliminar enemigo con trampa
+    puntos_perdidos_por_escape: int  # Puntos perdidos si enemigo escapa
+    puntos_ganados_por_captura: int  # Puntos ganados al capturar enemigo
+    tiempo_respawn_enemigo: float  # segundos
+
+
 class ConfiguracionDificultad:
     """
     Configuración de parámetros para cada nivel de dificultad.
@@ -23,191 +57,96 @@ class ConfiguracionDificultad:
     - Energía inicial del jugador
     - Sistema de puntuación
     - Tiempos de respawn
+    
+    Los parámetros se leen como atributos del ParametrosDificultad que
+    devuelve obtener_parametros (p. ej. `parametros.cantidad_enemigos`).
     """
     
     # ============================================
     # CONFIGURACIONES POR DIFICULTAD
     # ============================================
-    # Cada dificultad tiene un diccionario con todos los parámetros
-    # que afectan el balance del juego
-    CONFIGURACIONES: Dict[Dificultad, Dict[str, Any]] = {
-        Dificultad.FACIL: {
+    # Cada dificultad tiene un ParametrosDificultad inmutable con todos
+    # los parámetros que afectan el balance del juego
+    CONFIGURACIONES: Dict[Dificultad, ParametrosDificultad] = {
+        Dificultad.FACIL: ParametrosDificultad(
             # Enemigos: pocos y lentos
-            "cantidad_enemigos": 4,  # Aumentado de 2 a 4 para mejor balance
-            "velocidad_enemigos": 0.5,  # movimientos por segundo (lento)
+            cantidad_enemigos=4,  # Aumentado de 2 a 4 para mejor balance
+            velocidad_enemigos=0.5,  # movimientos por segundo (lento)
             # Jugador: mucha energía inicial
-            "energia_inicial_jugador": 200,  # Aumentado de 150 a 200 para mejor balance
+            energia_inicial_jugador=200,  # Aumentado de 150 a 200 para mejor balance
             # Sistema de puntuación (modo escapa)
-            "puntos_base_escapa": 100,  # Puntos base al completar el modo
+            puntos_base_escapa=100,  # Puntos base al completar el modo
             # Sistema de puntuación (modo cazador)
-            "puntos_base_cazador": 50,  # Puntos iniciales en modo cazador
-            "puntos_por_enemigo_eliminado": 15,  # Bono por eliminar enemigo con trampa
-            "puntos_perdidos_por_escape": 5,  # Puntos perdidos si enemigo escapa
-            "puntos_ganados_por_captura": 10,  # Puntos ganados al capturar enemigo
+            puntos_base_cazador=50,  # Puntos iniciales en modo cazador
+            puntos_por_enemigo_eliminado=15,  # Bono por eliminar enemigo con trampa
+            puntos_perdidos_por_escape=5,  # Puntos perdidos si enemigo escapa
+            puntos_ganados_por_captura=10,  # Puntos ganados al capturar enemigo
             # Sistema de respawn
-            "tiempo_respawn_enemigo": 10.0,  # segundos (según especificación)
-        },
-        Dificultad.NORMAL: {
+            tiempo_respawn_enemigo=10.0,  # segundos (según especificación)
+        ),
+        Dificultad.NORMAL: ParametrosDificultad(
             # Enemigos: cantidad y velocidad moderadas
-            "cantidad_enemigos": 8,  # Aumentado de 4 a 8 para mejor balance
-            "velocidad_enemigos": 1.0,  # movimientos por segundo (normal)
+            cantidad_enemigos=8,  # Aumentado de 4 a 8 para mejor balance
+            velocidad_enemigos=1.0,  # movimientos por segundo (normal)
             # Jugador: energía moderada
-            "energia_inicial_jugador": 150,  # Aumentado de 100 a 150 para mejor balance
+            energia_inicial_jugador=150,  # Aumentado de 100 a 150 para mejor balance
             # Sistema de puntuación (modo escapa)
-            "puntos_base_escapa": 200,  # Puntos base al completar el modo
+            puntos_base_escapa=200,  # Puntos base al completar el modo
             # Sistema de puntuación (modo cazador)
-            "puntos_base_cazador": 100,  # Puntos iniciales en modo cazador
-            "puntos_por_enemigo_eliminado": 20,  # Bono por eliminar enemigo con trampa
-            "puntos_perdidos_por_escape": 10,  # Puntos perdidos si enemigo escapa
-            "puntos_ganados_por_captura": 20,  # Puntos ganados al capturar enemigo
+            puntos_base_cazador=100,  # Puntos iniciales en modo cazador
+            puntos_por_enemigo_eliminado=20,  # Bono por eliminar enemigo con trampa
+            puntos_perdidos_por_escape=10,  # Puntos perdidos si enemigo escapa
+            puntos_ganados_por_captura=20,  # Puntos ganados al capturar enemigo
             # Sistema de respawn
-            "tiempo_respawn_enemigo": 10.0,  # segundos (según especificación)
-        },
-        Dificultad.DIFICIL: {
+            tiempo_respawn_enemigo=10.0,  # segundos (según especificación)
+        ),
+        Dificultad.DIFICIL: ParametrosDificultad(
             # Enemigos: muchos y rápidos
-            "cantidad_enemigos": 12,  # Aumentado de 6 a 12 para mejor balance
-            "velocidad_enemigos": 1.5,  # movimientos por segundo (rápido)
+            cantidad_enemigos=12,  # Aumentado de 6 a 12 para mejor balance
+            velocidad_enemigos=1.5,  # movimientos por segundo (rápido)
             # Jugador: poca energía inicial
-            "energia_inicial_jugador": 120,  # Aumentado de 75 a 120 para mejor balance
+            energia_inicial_jugador=120,  # Aumentado de 75 a 120 para mejor balance
             # Sistema de puntuación (modo escapa)
-            "puntos_base_escapa": 300,  # Puntos base al completar el modo (más recompensa)
+            puntos_base_escapa=300,  # Puntos base al completar el modo (más recompensa)
             # Sistema de puntuación (modo cazador)
-            "puntos_base_cazador": 150,  # Puntos iniciales en modo cazador
-            "puntos_por_enemigo_eliminado": 30,  # Bono por eliminar enemigo con trampa (más recompensa)
-            "puntos_perdidos_por_escape": 20,  # Puntos perdidos si enemigo escapa (más penalización)
-            "puntos_ganados_por_captura": 40,  # Puntos ganados al capturar enemigo (más recompensa)
+            puntos_base_cazador=150,  # Puntos iniciales en modo cazador
+            puntos_por_enemigo_eliminado=30,  # Bono por eliminar enemigo con trampa (más recompensa)
+            puntos_perdidos_por_escape=20,  # Puntos perdidos si enemigo escapa (más penalización)
+            puntos_ganados_por_captura=40,  # Puntos ganados al capturar enemigo (más recompensa)
             # Sistema de respawn
-            "tiempo_respawn_enemigo": 10.0,  # segundos (según especificación)
-        }
+            tiempo_respawn_enemigo=10.0,  # segundos (según especificación)
+        ),
     }
     
     @classmethod
-    def obtener_configuracion(cls, dificultad: Dificultad) -> Dict[str, Any]:
-        """
-        Obtiene la configuración para un nivel de dificultad.
-        
-        Args:
-            dificultad: Nivel de dificultad.
-            
-        Returns:
-            Diccionario con los parámetros de configuración.
-        """
-        return cls.CONFIGURACIONES.get(dificultad, cls.CONFIGURACIONES[Dificultad.NORMAL]).copy()
-    
-    @classmethod
-    def obtener_cantidad_enemigos(cls, dificultad: Dificultad) -> int:
-        """
-        Obtiene la cantidad de enemigos para una dificultad.
-        
-        Args:
-            dificultad: Nivel de dificultad.
-            
-        Returns:
-            Cantidad de enemigos.
-        """
-        return cls.obtener_configuracion(dificultad)["cantidad_enemigos"]
-    
-    @classmethod
-    def obtener_velocidad_enemigos(cls, dificultad: Dificultad) -> float:
-        """
-        Obtiene la velocidad de los enemigos para una dificultad.
-        
-        Args:
-            dificultad: Nivel de dificultad.
-            
-        Returns:
-            Velocidad de los enemigos.
-        """
-        return cls.obtener_configuracion(dificultad)["velocidad_enemigos"]
-    
-    @classmethod
-    def obtener_energia_inicial(cls, dificultad: Dificultad) -> int:
-        """
-        Obtiene la energía inicial del jugador para una dificultad.
-        
-        Args:
-            dificultad: Nivel de dificultad.
-            
-        Returns:
-            Energía inicial.
-        """
-        return cls.obtener_configuracion(dificultad)["energia_inicial_jugador"]
-    
-    @classmethod
-    def obtener_puntos_base_escapa(cls, dificultad: Dificultad) -> int:
-        """
-        Obtiene los puntos base para el modo escapa.
-        
-        Args:
-            dificultad: Nivel de dificultad.
-            
-        Returns:
-            Puntos base.
-        """
-        return cls.obtener_configuracion(dificultad)["puntos_base_escapa"]
-    
-    @classmethod
-    def obtener_puntos_base_cazador(cls, dificultad: Dificultad) -> int:
-        """
-        Obtiene los puntos base para el modo cazador.
-        
-        Args:
-            dificultad: Nivel de dificultad.
-            
-        Returns:
-            Puntos base.
-        """
-        return cls.obtener_configuracion(dificultad)["puntos_base_cazador"]
-    
-    @classmethod
-    def obtener_puntos_por_enemigo_eliminado(cls, dificultad: Dificultad) -> int:
+    def obtener_parametros(cls, dificultad: Dificultad) -> ParametrosDificultad:
         """
-        Obtiene los puntos por enemigo eliminado.
+        Obtiene los parámetros de un nivel de dificultad.
         
         Args:
             dificultad: Nivel de dificultad.
             
         Returns:
-            Puntos por enemigo eliminado.
+            ParametrosDificultad compartido (inmutable, no se copia).
         """
-        return cls.obtener_configuracion(dificultad)["puntos_por_enemigo_eliminado"]
+        configuraciones = cls.CONFIGURACIONES
+        parametros = configuraciones.get(dificultad)
+        if parametros is None:
+            parametros = configuraciones[Dificultad.NORMAL]
+        return parametros
     
     @classmethod
-    def obtener_puntos_perdidos_por_escape(cls, dificultad: Dificultad) -> int:
+    def obtener_configuracion(cls, dificultad: Dificultad) -> Dict[str, Any]:
         """
-        Obtiene los puntos perdidos cuando un enemigo escapa (modo cazador).
+        Obtiene la configuración para un nivel de dificultad como diccionario.
         
-        Args:
-            dificultad: Nivel de dificultad.
-            
-        Returns:
-            Puntos perdidos.
-        """
-        return cls.obtener_configuracion(dificultad)["puntos_perdidos_por_escape"]
-    
-    @classmethod
-    def obtener_puntos_ganados_por_captura(cls, dificultad: Dificultad) -> int:
-        """
-        Obtiene los puntos ganados al capturar un enemigo (modo cazador).
+        Se mantiene por compatibilidad; el código nuevo debe usar
+        obtener_parametros y leer los atributos directamente.
         
         Args:
             dificultad: Nivel de dificultad.
             
         Returns:
-            Puntos ganados.
-        """
-        return cls.obtener_configuracion(dificultad)["puntos_ganados_por_captura"]
-    
-    @classmethod
-    def obtener_tiempo_respawn(cls, dificultad: Dificultad) -> float:
-        """
-        Obtiene el tiempo de respawn de los enemigos.
-        
-        Args:
-            dificultad: Nivel de dificultad.
-            
-        Returns:
-            Tiempo de respawn en segundos.
+            Diccionario con los parámetros de configuración.
         """
-        return cls.obtener_configuracion(dificultad)["tiempo_respawn_enemigo"]
-
+        return asdict(cls.obtener_parametros(dificultad))
@@ -3,23 +3,187 @@ Módulo generador_mapa: Genera mapas aleatorios con garantía de camino válido.
 """
 
 import random
-from typing import Tuple, List, Set, Optional
-from collections import deque
+from array import array
+from collections import OrderedDict, deque
+from itertools import permutations
+from typing import Deque, Iterable, Tuple, List, Optional
+
+import numpy as np
 
 from modelo.mapa import Mapa
 from modelo.tile import Tile, Camino, Muro, Liana, Tunel
 
 
+# ============================================
+# CASILLAS COMPARTIDAS (FLYWEIGHT)
+# ============================================
+# Las casillas no guardan estado propio más allá de su tipo (ver __slots__ en
+# modelo.tile), así que todas las posiciones de un mismo tipo pueden compartir
+# una única instancia en lugar de crear una por celda
+_CAMINO = Camino()
+_MURO = Muro()
+_LIANA = Liana()
+_TUNEL = Tunel()
+
+# ============================================
+# GRID DE CÓDIGOS (GENERACIÓN)
+# ============================================
+# Durante la generación el mapa es una matriz int8 de códigos (un byte por
+# celda); solo al final se convierte a objetos Tile para construir el Mapa
+CELDA_MURO = 0
+CELDA_CAMINO = 1
+CELDA_LIANA = 2
+CELDA_TUNEL = 3
+
+# Casilla compartida correspondiente a cada código (indexable con el grid)
+_CASILLAS_POR_CODIGO = np.array([_MURO, _CAMINO, _LIANA, _TUNEL], dtype=object)
+
+# Transitabilidad para el jugador de cada código, según el modo de juego:
+# en modo escapa puede pasar por Camino y Tunel; en modo cazador (reglas
+# invertidas) por Camino y Liana
+_TRANSITABLE_ESCAPA = np.array([0, 1, 0, 1], dtype=np.uint8)
+_TRANSITABLE_CAZADOR = np.array([0, 1, 1, 0], dtype=np.uint8)
+
+# Direcciones (df, dc) del DFS: arriba, abajo, izquierda, derecha
+_DIRECCIONES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+# Las 24 ordenaciones posibles de _DIRECCIONES: el DFS elige una al azar por
+# celda con un solo sorteo en lugar de copiar y barajar la tupla
+_PERMUTACIONES_DIRECCIONES = tuple(permutations(_DIRECCIONES))
+
+# Algoritmos disponibles para tallar el laberinto base
+ALGORITMO_DFS = "dfs"  # Pasillos largos y sinuosos (por defecto)
+ALGORITMO_KRUSKAL = "kruskal"  # Más ramificado; más rápido de generar
+
+# ============================================
+# CACHÉ DE MAPAS CON SEMILLA
+# ============================================
+# Con semilla la generación es determinista, así que se guarda el grid de
+# códigos (inmutable) y las salidas de los últimos mapas generados; el Mapa
+# se reconstruye a partir de ellos porque es mutable
+MAX_MAPAS_EN_CACHE = 32
+_cache_mapas: "OrderedDict[tuple, Tuple[np.ndarray, List[Tuple[int, int]]]]" = OrderedDict()
+
+
+# ============================================
+# BFS SOBRE EL GRID PLANO
+# ============================================
+# Las búsquedas reciben la transitabilidad con un borde centinela de casillas
+# no transitables alrededor del mapa: así los cuatro vecinos de cualquier
+# casilla alcanzable existen siempre y no hace falta comprobar límites
+def _bfs_predecesores(transitable: bytes, ancho: int,
+                      origen: int, destinos: List[int]) -> array:
+    """
+    BFS desde `origen` que registra el predecesor de cada casilla alcanzada.
+    
+    Una sola búsqueda sirve para todos los `destinos`: se detiene en cuanto
+    se alcanza el último que sea transitable (o al agotar la región conexa
+    del origen), y el camino a cada uno se reconstruye después con
+    _camino_desde_predecesores.
+    
+    Args:
+        transitable: Grid plano con 1 en las celdas transitables, rodeado
+                     de un borde no transitable (ver _construir_grid_transitable).
+        ancho: Ancho del grid plano, borde incluido.
+        origen: Índice plano de inicio.
+        destinos: Índices planos de las casillas buscadas.
+        
+    Returns:
+        Array de predecesores: -1 en las casillas no alcanzadas y el propio
+        origen como predecesor de sí mismo (todo -1 si el origen no es
+        transitable).
+    """
+    total = len(transitable)
+    anterior = array('l', [-1]) * total
+    if not transitable[origen]:
+        return anterior
+    anterior[origen] = origen
+    pendientes = {destino for destino in destinos if transitable[destino]}
+    pendientes.discard(origen)
+    if not pendientes:
+        return anterior
+    
+    cola = [0] * total
+    cola[0] = origen
+    cabeza = 0
+    fin = 1
+    
+    while cabeza < fin:
+        actual = cola[cabeza]
+        cabeza += 1
+        for vecino in (actual - ancho, actual + ancho, actual - 1, actual + 1):
+            if anterior[vecino] < 0 and transitable[vecino]:
+                anterior[vecino] = actual
+                if vecino in pendientes:
+                    pendientes.discard(vecino)
+                    if not pendientes:
+                        return anterior
+                cola[fin] = vecino
+                fin += 1
+    
+    return anterior
+
+
+def _camino_desde_predecesores(anterior: array, destino: int) -> Optional[Deque[int]]:
+    """
+    Reconstruye el camino hasta `destino` a partir de un array de predecesores.
+    
+    Los predecesores se recorren del destino al origen y cada uno se
+    inserta al principio, así que el camino queda en orden sin invertirlo.
+    
+    Args:
+        anterior: Array devuelto por _bfs_predecesores.
+        destino: Índice plano de destino.
+        
+    Returns:
+        Deque de índices planos del origen al destino (ambos incluidos),
+        o None si el destino no se alcanzó.
+    """
+    if anterior[destino] < 0:
+        return None
+    camino = deque([destino])
+    agregar_al_inicio = camino.appendleft
+    actual = destino
+    while anterior[actual] != actual:
+        actual = anterior[actual]
+        agregar_al_inicio(actual)
+    return camino
+
+
+def _bfs_alcanza_todos(transitable: bytes, ancho: int,
+                       origen: int, destinos: List[int]) -> bool:
+    """
+    Comprueba que todos los `destinos` estén en la región conexa de `origen`.
+    
+    Equivale a etiquetar la componente conexa del origen y comparar las
+    etiquetas de los destinos, pero con una sola búsqueda para todos ellos
+    que se detiene en cuanto se alcanza el último.
+    
+    Args:
+        transitable: Grid plano con 1 en las celdas transitables, rodeado
+                     de un borde no transitable (ver _construir_grid_transitable).
+        ancho: Ancho del grid plano, borde incluido.
+        origen: Índice plano de inicio.
+        destinos: Índices planos que deben ser alcanzables.
+        
+    Returns:
+        True si todos los destinos son alcanzables, False en caso contrario.
+    """
+    anterior = _bfs_predecesores(transitable, ancho, origen, destinos)
+    return all(anterior[destino] >= 0 for destino in destinos)
+
+
 class GeneradorMapa:
     """
-    Generador de mapas aleatorios usando DFS recursivo.
+    Generador de mapas aleatorios usando DFS (iterativo) o Kruskal.
     Asegura que siempre hay un camino válido desde el inicio hasta la salida.
     """
     
     def __init__(self, ancho: int = 15, alto: int = 15, 
                  densidad_muros: float = 0.4,  # Aumentada para laberintos más cerrados
                  probabilidad_liana: float = 0.05,  # Reducida para más caminos libres
-                 probabilidad_tunel: float = 0.05):  # Reducida para más caminos libres
+                 probabilidad_tunel: float = 0.05,  # Reducida para más caminos libres
+                 semilla: Optional[int] = None,
+                 algoritmo: str = ALGORITMO_DFS):
         """
         Inicializa el generador.
         
@@ -29,103 +193,150 @@ class GeneradorMapa:
             densidad_muros: Probabilidad de que una casilla sea muro (0.0 a 1.0).
             probabilidad_liana: Probabilidad de liana en casillas transitables (0.0 a 1.0).
             probabilidad_tunel: Probabilidad de túnel en casillas transitables (0.0 a 1.0).
+            semilla: Semilla por defecto para generar_mapa. Si es None, cada
+                     mapa usa el estado global de `random` y `numpy.random`.
+            algoritmo: Algoritmo del laberinto base (ALGORITMO_DFS o
+                       ALGORITMO_KRUSKAL).
         """
         self.ancho = ancho
         self.alto = alto
         self.densidad_muros = densidad_muros
         self.probabilidad_liana = probabilidad_liana
         self.probabilidad_tunel = probabilidad_tunel
+        self.semilla = semilla
+        self.algoritmo = algoritmo
+        
+        # Generadores aleatorios en uso (los globales salvo durante un
+        # generar_mapa con semilla)
+        self._rng = random
+        self._rng_np = np.random
     
-    def generar_mapa(self, cantidad_salidas: Optional[int] = None, modo: str = "escapa") -> Mapa:
+    def generar_mapa(self, cantidad_salidas: Optional[int] = None, modo: str = "escapa",
+                     semilla: Optional[int] = None) -> Mapa:
         """
         Genera un mapa aleatorio con garantía de camino válido a múltiples salidas.
         
+        Todo el proceso trabaja sobre un único grid de códigos int8 (ver
+        CELDA_*); las casillas Tile se crean solo para el mapa final.
+        
+        Con semilla el resultado es reproducible y se guarda en una caché
+        LRU (ver MAX_MAPAS_EN_CACHE), así que repetir los mismos parámetros
+        solo reconstruye el Mapa a partir del grid guardado.
+        
         Args:
             cantidad_salidas: Número de salidas a generar. Si es None, se elige aleatoriamente 1 o 2.
             modo: Modo de juego ("escapa" o "cazador"). Afecta la generación de lianas y túneles.
+            semilla: Semilla para una generación determinista. Si es None se
+                     usa la del generador (self.semilla).
         
         Returns:
             Un objeto Mapa con caminos válidos desde inicio hasta todas las salidas.
         """
-        # ============================================
-        # CONFIGURACIÓN INICIAL
-        # ============================================
         # Posición de inicio siempre en esquina superior izquierda
         posicion_inicio = (1, 1)
+        if semilla is None:
+            semilla = self.semilla
+        
+        if semilla is None:
+            grid, posiciones_salida = self._generar_grid(posicion_inicio, cantidad_salidas, modo)
+        else:
+            clave = (self.ancho, self.alto, self.densidad_muros, self.probabilidad_liana,
+                     self.probabilidad_tunel, self.algoritmo, cantidad_salidas, modo, semilla)
+            en_cache = _cache_mapas.get(clave)
+            if en_cache is not None:
+                _cache_mapas.move_to_end(clave)
+                grid, posiciones_salida = en_cache
+            else:
+                self._rng = random.Random(semilla)
+                self._rng_np = np.random.default_rng(semilla)
+                try:
+                    grid, posiciones_salida = self._generar_grid(
+                        posicion_inicio, cantidad_salidas, modo
+                    )
+                finally:
+                    self._rng = random
+                    self._rng_np = np.random
+                grid.setflags(write=False)
+                _cache_mapas[clave] = (grid, posiciones_salida)
+                if len(_cache_mapas) > MAX_MAPAS_EN_CACHE:
+                    _cache_mapas.popitem(last=False)
+        
+        return Mapa(self.ancho, self.alto, self._casillas_desde_grid(grid),
+                    posicion_inicio, list(posiciones_salida))
+    
+    def _generar_grid(self, posicion_inicio: Tuple[int, int],
+                      cantidad_salidas: Optional[int],
+                      modo: str) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+        """
+        Genera el grid de códigos de un mapa y sus posiciones de salida.
+        
+        Usa self._rng / self._rng_np para todos los sorteos.
+        
+        Invariante: el laberinto base abre y conecta todas las celdas de
+        coordenadas impares, entre ellas el inicio; cada salida se abre
+        junto a una de ellas (ver _conectar_salida). Por eso hay camino a
+        todas las salidas desde la primera generación, sin reintentos.
+        
+        Args:
+            posicion_inicio: Posición de inicio del jugador.
+            cantidad_salidas: Número de salidas a generar. Si es None, se elige aleatoriamente 1 o 2.
+            modo: Modo de juego ("escapa" o "cazador").
         
+        Returns:
+            Tupla (grid, posiciones_salida) con caminos válidos desde el
+            inicio hasta todas las salidas.
+        """
+        # ============================================
+        # CONFIGURACIÓN INICIAL
+        # ============================================
         # Si no se especifica cantidad, elegir aleatoriamente 1 o 2 salidas
         # Esto permite variabilidad en los mapas generados
         if cantidad_salidas is None:
-            cantidad_salidas = random.choice([1, 2])
+            cantidad_salidas = self._rng.choice([1, 2])
         
         # Generar posiciones de salida distribuidas en diferentes áreas del mapa
         # Las salidas se distribuyen en esquinas y bordes para crear múltiples rutas
         posiciones_salida = self._generar_posiciones_salida(cantidad_salidas, posicion_inicio)
         
         # ============================================
-        # GENERACIÓN DE MAPA CON VALIDACIÓN
+        # GENERACIÓN DE MAPA (CONEXO POR CONSTRUCCIÓN)
         # ============================================
-        # Intentamos generar un mapa válido (máximo 10 intentos)
-        # Un mapa válido debe tener caminos transitables desde inicio hasta todas las salidas
-        for intento in range(10):
-            # Paso 1: Generar laberinto base usando DFS (Depth-First Search)
-            # Esto crea una estructura de laberinto tradicional con caminos conectados
-            casillas_laberinto = self._generar_laberinto_dfs()
-            
-            # Paso 2: Asegurar que inicio y todas las salidas sean transitables
-            # Esto garantiza que las posiciones críticas no sean muros
-            casillas_laberinto[posicion_inicio[0]][posicion_inicio[1]] = Camino()
-            for salida in posiciones_salida:
-                casillas_laberinto[salida[0]][salida[1]] = Camino()
-            
-            # Paso 3: Verificar que existe camino válido a todas las salidas
-            # antes de agregar variación (lianas y túneles)
-            caminos_validos = all(
-                self._existe_camino_valido(casillas_laberinto, posicion_inicio, salida)
-                for salida in posiciones_salida
-            )
-            if not caminos_validos:
-                # Si no hay caminos válidos, intentar de nuevo
-                continue
-            
+        # Paso 1: Generar laberinto base (DFS desde el inicio o Kruskal). Como
+        # el inicio tiene coordenadas impares, ambos abren todas las celdas de
+        # coordenadas impares del mapa, conectadas entre sí
+        grid = self._generar_laberinto(posicion_inicio)
+        
+        # Paso 2: Abrir las salidas y unirlas al laberinto
+        for salida in posiciones_salida:
+            self._conectar_salida(grid, salida)
+        
+        # Paso 3: Comprobación de seguridad con una sola búsqueda. Por
+        # construcción siempre hay camino a todas las salidas; solo falla con
+        # una configuración rota (p. ej. un inicio con coordenadas pares)
+        transitable = self._construir_grid_transitable(grid)
+        if self._existen_caminos_validos(transitable, posicion_inicio, posiciones_salida):
             # Paso 4: Agregar variación con lianas y túneles
-            # Esto preserva los caminos pero añade complejidad y mecánicas especiales
-            casillas = self._agregar_variacion_terreno_segura_multiple(
-                casillas_laberinto, posicion_inicio, posiciones_salida, modo=modo
+            # Esto preserva los caminos pero añade complejidad y mecánicas especiales.
+            # La variación nunca vuelve intransitable (para el modo) un camino
+            # crítico hacia una salida, así que no hace falta volver a validar
+            grid = self._agregar_variacion_terreno_segura_multiple(
+                grid, posicion_inicio, posiciones_salida, modo=modo
             )
-            
-            # Paso 5: Verificar que los caminos siguen siendo válidos después de agregar variación
-            # En modo cazador, las reglas de transición son diferentes (jugador/enemigos)
-            if modo == "cazador":
-                # En modo cazador, usar verificación con reglas del modo cazador
-                # (jugador puede pasar por Liana, enemigos por Tunel)
-                caminos_validos = all(
-                    self._existe_camino_valido_cazador(casillas, posicion_inicio, salida)
-                    for salida in posiciones_salida
-                )
-            else:
-                # En modo escapa, usar verificación estándar
-                caminos_validos = all(
-                    self._existe_camino_valido(casillas, posicion_inicio, salida)
-                    for salida in posiciones_salida
-                )
-            
-            # Si todos los caminos son válidos, retornar el mapa generado
-            if caminos_validos:
-                return Mapa(self.ancho, self.alto, casillas, posicion_inicio, posiciones_salida)
+            return grid, posiciones_salida
         
         # ============================================
         # FALLBACK: MAPA SIMPLE
         # ============================================
-        # Si después de 10 intentos no se generó un mapa válido,
+        # Si la configuración no permite un mapa válido,
         # devolver un mapa simple con solo caminos (patrón de tablero de ajedrez)
         # Esto garantiza que siempre haya un mapa jugable
-        casillas = [[Camino() if (i + j) % 2 == 0 else Muro() for j in range(self.ancho)] for i in range(self.alto)]
+        filas, cols = np.indices((self.alto, self.ancho))
+        grid = np.where((filas + cols) % 2 == 0, CELDA_CAMINO, CELDA_MURO).astype(np.int8)
         # Asegurar que inicio y salidas sean transitables
-        casillas[posicion_inicio[0]][posicion_inicio[1]] = Camino()
+        grid[posicion_inicio] = CELDA_CAMINO
         for salida in posiciones_salida:
-            casillas[salida[0]][salida[1]] = Camino()
-        return Mapa(self.ancho, self.alto, casillas, posicion_inicio, posiciones_salida)
+            grid[salida] = CELDA_CAMINO
+        return grid, posiciones_salida
     
     def _generar_posiciones_salida(self, cantidad: int, posicion_inicio: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
@@ -154,203 +365,271 @@ class GeneradorMapa:
         candidatos = [c for c in candidatos if c != posicion_inicio]
         
         # Seleccionar cantidad de salidas aleatoriamente
-        random.shuffle(candidatos)
+        self._rng.shuffle(candidatos)
         salidas = candidatos[:min(cantidad, len(candidatos))]
         
         # Si no hay suficientes candidatos, generar posiciones aleatorias
+        # (1 + int(random() * n) sortea en [1, n] sin el coste de randint).
+        # `ocupadas` (inicio y salidas ya elegidas) evita repetir posiciones;
+        # la lista conserva el orden de elección
+        ocupadas = set(salidas)
+        ocupadas.add(posicion_inicio)
+        azar = self._rng.random
         while len(salidas) < cantidad:
-            fila = random.randint(1, self.alto - 2)
-            col = random.randint(1, self.ancho - 2)
+            fila = 1 + int(azar() * (self.alto - 2))
+            col = 1 + int(azar() * (self.ancho - 2))
             pos = (fila, col)
-            if pos != posicion_inicio and pos not in salidas:
+            if pos not in ocupadas:
+                ocupadas.add(pos)
                 salidas.append(pos)
         
         return salidas
     
-    def _generar_laberinto_dfs(self) -> List[List[Tile]]:
+    def _generar_laberinto(self, inicio: Tuple[int, int]) -> np.ndarray:
         """
-        Genera un laberinto tradicional usando DFS recursivo.
+        Genera un laberinto tradicional con el algoritmo configurado (DFS o Kruskal).
         Mantiene la estructura de laberinto pero más cerrado.
         
+        Args:
+            inicio: Celda desde la que parte el DFS. Con coordenadas impares
+                    se abren todas las celdas impares del mapa (Kruskal
+                    siempre las abre todas).
+        
         Returns:
-            Matriz 2D de casillas (Camino o Muro).
+            Grid (alto, ancho) de códigos int8 (CELDA_CAMINO o CELDA_MURO).
+            Es una vista sobre el bytearray en el que se talló el laberinto.
         """
-        # Inicializamos todo como muros
-        casillas = [[Muro() for _ in range(self.ancho)] for _ in range(self.alto)]
-        visitado = [[False for _ in range(self.ancho)] for _ in range(self.alto)]
-        
-        # Empezamos desde una posición aleatoria (pero dentro de los límites)
-        inicio_fila = random.randint(1, self.alto - 2)
-        inicio_col = random.randint(1, self.ancho - 2)
+        # Inicializamos todo como muros. El DFS trabaja sobre un bytearray
+        # plano (celda (fila, col) en fila * ancho + col), mucho más rápido
+        # de indexar elemento a elemento que un ndarray
+        celdas = bytearray(self.ancho * self.alto)  # CELDA_MURO == 0
         
-        # DFS recursivo tradicional
-        self._dfs_laberinto(casillas, visitado, inicio_fila, inicio_col)
+        if self.algoritmo == ALGORITMO_KRUSKAL:
+            self._kruskal_laberinto(celdas)
+        else:
+            # DFS tradicional (iterativo, con pila explícita)
+            visitado = bytearray(self.ancho * self.alto)
+            self._dfs_laberinto(celdas, visitado, inicio[0], inicio[1])
         
         # Crear algunos caminos adicionales estratégicos para múltiples rutas (muy limitado)
-        self._agregar_caminos_alternativos(casillas, visitado)
+        self._agregar_caminos_alternativos(celdas)
         
-        return casillas
+        # Vista int8 (sin copia) para los pasos vectorizados
+        return np.frombuffer(celdas, dtype=np.int8).reshape(self.alto, self.ancho)
     
-    def _dfs_laberinto(self, casillas: List[List[Tile]], 
-                      visitado: List[List[bool]], 
+    @staticmethod
+    def _conectar_salida(grid: np.ndarray, salida: Tuple[int, int]) -> None:
+        """
+        Abre una salida y la une a las celdas impares del laberinto.
+        
+        Una salida con alguna coordenada impar ya es vecina de una celda
+        impar (abierta por el DFS). Si ambas son pares, se abre también el
+        muro de arriba, que sí toca la celda (fila - 1, col - 1).
+        
+        Args:
+            grid: Grid de códigos (se modifica en el lugar).
+            salida: Posición (fila, columna) de la salida, dentro del borde.
+        """
+        fila, col = salida
+        grid[fila, col] = CELDA_CAMINO
+        if fila % 2 == 0 and col % 2 == 0:
+            grid[fila - 1, col] = CELDA_CAMINO
+    
+    def _dfs_laberinto(self, celdas: bytearray, 
+                      visitado: bytearray, 
                       fila: int, col: int):
         """
-        DFS recursivo tradicional para generar el laberinto.
+        DFS iterativo para generar el laberinto.
         
         Utiliza el algoritmo de Depth-First Search para crear un laberinto
         perfecto (un solo camino entre cualquier par de celdas). El algoritmo
         funciona moviéndose en pasos de 2 celdas y abriendo el muro intermedio.
         
-        Args:
-            casillas: Matriz de casillas a modificar (se convierte Muro -> Camino).
-            visitado: Matriz de visitados para evitar ciclos.
-            fila: Fila actual en el proceso de generación.
-            col: Columna actual en el proceso de generación.
-        """
-        # Marcar la celda actual como visitada y convertir en camino
-        visitado[fila][col] = True
-        casillas[fila][col] = Camino()
-        
-        # Direcciones posibles: arriba, abajo, izquierda, derecha
-        # Se aleatorizan para crear laberintos diferentes cada vez
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        random.shuffle(direcciones)
-        
-        # Explorar cada dirección
-        for df, dc in direcciones:
-            # Moverse 2 celdas en la dirección (saltando el muro intermedio)
-            nueva_fila = fila + df * 2
-            nueva_col = col + dc * 2
-            
-            # Verificar que la nueva posición esté dentro de los límites y no visitada
-            if (0 < nueva_fila < self.alto - 1 and 
-                0 < nueva_col < self.ancho - 1 and 
-                not visitado[nueva_fila][nueva_col]):
-                
-                # Abrir el muro entre la celda actual y la nueva (celda intermedia)
-                casillas[fila + df][col + dc] = Camino()
-                # Continuar recursivamente desde la nueva posición
-                self._dfs_laberinto(casillas, visitado, nueva_fila, nueva_col)
-    
-    def _agregar_caminos_alternativos(self, casillas: List[List[Tile]], 
-                                      visitado: List[List[bool]]) -> None:
-        """
-        Agrega algunos caminos alternativos estratégicos para crear múltiples rutas.
-        Muy limitado para mantener la estructura de laberinto.
+        Usa una pila explícita en lugar de recursión (sin límite de recursión
+        en mapas grandes). Cada entrada de la pila guarda el iterador de las
+        direcciones que le quedan por explorar a esa celda, así que el orden
+        de visita es el mismo que el de la versión recursiva.
         
         Args:
-            casillas: Matriz de casillas a modificar.
-            visitado: Matriz de visitados.
+            celdas: Grid plano de códigos a modificar (CELDA_MURO -> CELDA_CAMINO).
+            visitado: Matriz plana de visitados (índice fila * ancho + col)
+                      para evitar ciclos.
+            fila: Fila de la celda inicial.
+            col: Columna de la celda inicial.
         """
-        # Solo agregar un número muy limitado de conexiones adicionales
-        # Basado en el tamaño del mapa, pero mucho más conservador
-        num_conexiones = max(2, min(8, (self.ancho + self.alto) // 15))
-        
-        intentos = 0
-        conexiones_creadas = 0
-        
-        while conexiones_creadas < num_conexiones and intentos < num_conexiones * 10:
-            intentos += 1
-            fila = random.randint(2, self.alto - 3)
-            col = random.randint(2, self.ancho - 3)
-            
-            # Solo convertir muros que están entre dos caminos (crea intersecciones)
-            if isinstance(casillas[fila][col], Muro):
-                # Verificar que tenga exactamente 2 caminos opuestos adyacentes
-                direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-                caminos_opuestos = 0
+        # Referencias locales para el bucle
+        ancho = self.ancho
+        alto = self.alto
+        azar = self._rng.random
+        permutaciones = _PERMUTACIONES_DIRECCIONES
+        num_permutaciones = len(permutaciones)
+        
+        def entrar(fila: int, col: int):
+            """Marca la celda como visitada, la abre y la apila."""
+            indice = fila * ancho + col
+            visitado[indice] = 1
+            celdas[indice] = CELDA_CAMINO
+            # Orden aleatorio de las direcciones (uniforme entre las 24
+            # permutaciones) para crear laberintos diferentes cada vez. Las
+            # permutaciones son tuplas compartidas: cada celda solo guarda en
+            # la pila su propio iterador
+            direcciones = permutaciones[int(azar() * num_permutaciones)]
+            pila.append((fila, col, iter(direcciones)))
+        
+        pila = []
+        entrar(fila, col)
+        
+        while pila:
+            fila, col, pendientes = pila[-1]
+            # Explorar la siguiente dirección pendiente de la celda en la cima
+            for df, dc in pendientes:
+                # Moverse 2 celdas en la dirección (saltando el muro intermedio)
+                nueva_fila = fila + df * 2
+                nueva_col = col + dc * 2
                 
-                for i in range(0, len(direcciones), 2):
-                    df1, dc1 = direcciones[i]
-                    df2, dc2 = direcciones[i + 1]
-                    
-                    fila1 = fila + df1
-                    col1 = col + dc1
-                    fila2 = fila + df2
-                    col2 = col + dc2
+                # Verificar que la nueva posición esté dentro de los límites y no visitada
+                if (0 < nueva_fila < alto - 1 and 
+                    0 < nueva_col < ancho - 1 and 
+                    not visitado[nueva_fila * ancho + nueva_col]):
                     
-                    if (0 <= fila1 < self.alto and 0 <= col1 < self.ancho and
-                        0 <= fila2 < self.alto and 0 <= col2 < self.ancho):
-                        if (isinstance(casillas[fila1][col1], Camino) and 
-                            isinstance(casillas[fila2][col2], Camino)):
-                            caminos_opuestos += 1
-                
-                # Solo crear conexión si hay un par de caminos opuestos
-                # Esto crea intersecciones sin abrir demasiado el laberinto
-                if caminos_opuestos == 1:
-                    casillas[fila][col] = Camino()
-                    conexiones_creadas += 1
+                    # Abrir el muro entre la celda actual y la nueva (celda intermedia)
+                    celdas[(fila + df) * ancho + col + dc] = CELDA_CAMINO
+                    # Continuar desde la nueva posición
+                    entrar(nueva_fila, nueva_col)
+                    break
+            else:
+                # Sin direcciones pendientes: retroceder
+                pila.pop()
     
-    def _agregar_variacion_terreno(self, casillas: List[List[Tile]]) -> List[List[Tile]]:
+    def _kruskal_laberinto(self, celdas: bytearray) -> None:
         """
-        Agrega lianas y túneles aleatoriamente en casillas transitables.
+        Talla un laberinto perfecto con el algoritmo de Kruskal.
+        
+        Abre todas las celdas de coordenadas impares y recorre en orden
+        aleatorio los muros que separan celdas vecinas: cada muro se abre
+        solo si une dos componentes distintas (union-find con compresión de
+        caminos por mitades sobre índices planos). Sin pila ni barajado por
+        celda, es más rápido que el DFS y da laberintos más ramificados.
         
         Args:
-            casillas: Matriz de casillas base.
-            
-        Returns:
-            Matriz de casillas con variación de terreno.
-        """
-        for fila in range(self.alto):
-            for col in range(self.ancho):
-                # Solo modificamos casillas que son camino
-                if isinstance(casillas[fila][col], Camino):
-                    rand = random.random()
-                    if rand < self.probabilidad_liana:
-                        casillas[fila][col] = Liana()
-                    elif rand < self.probabilidad_liana + self.probabilidad_tunel:
-                        casillas[fila][col] = Tunel()
-        
-        return casillas
+            celdas: Grid plano de códigos a modificar (CELDA_MURO -> CELDA_CAMINO).
+        """
+        ancho = self.ancho
+        alto = self.alto
+        
+        # Abrir todas las celdas del laberinto (coordenadas impares) de una vez
+        vista = np.frombuffer(celdas, dtype=np.int8).reshape(alto, ancho)
+        vista[1:alto - 1:2, 1:ancho - 1:2] = CELDA_CAMINO
+        
+        # Aristas (celda, muro intermedio, celda vecina) hacia la derecha y abajo
+        aristas = []
+        for fila in range(1, alto - 1, 2):
+            for col in range(1, ancho - 1, 2):
+                indice = fila * ancho + col
+                if col + 2 < ancho - 1:
+                    aristas.append((indice, indice + 1, indice + 2))
+                if fila + 2 < alto - 1:
+                    aristas.append((indice, indice + ancho, indice + 2 * ancho))
+        self._rng.shuffle(aristas)
+        
+        # Union-find: cada celda apunta a su representante
+        padre = list(range(ancho * alto))
+        for a, muro, b in aristas:
+            while padre[a] != a:
+                padre[a] = padre[padre[a]]
+                a = padre[a]
+            while padre[b] != b:
+                padre[b] = padre[padre[b]]
+                b = padre[b]
+            if a != b:
+                padre[a] = b
+                celdas[muro] = CELDA_CAMINO
     
-    def _agregar_variacion_terreno_segura(self, casillas: List[List[Tile]], 
-                                          inicio: Tuple[int, int], 
-                                          salida: Tuple[int, int]) -> List[List[Tile]]:
+    def _agregar_caminos_alternativos(self, celdas: bytearray) -> None:
         """
-        Agrega lianas y túneles de manera que no bloqueen el camino principal.
-        Usa BFS para encontrar un camino y evita modificar esas casillas críticas.
+        Agrega algunos caminos alternativos estratégicos para crear múltiples rutas.
+        Muy limitado para mantener la estructura de laberinto.
+        
+        Los muros candidatos (entre exactamente un par de caminos opuestos)
+        se buscan de una vez con operaciones vectorizadas sobre el interior
+        del mapa; después se recorren en orden aleatorio y se abren los
+        primeros que sigan cumpliendo la condición, ya que abrir uno puede
+        cambiar la de sus vecinos.
         
         Args:
-            casillas: Matriz de casillas base.
-            inicio: Posición de inicio.
-            salida: Posición de salida.
-            
-        Returns:
-            Matriz de casillas con variación de terreno.
-        """
-        # Encontrar un camino válido usando BFS
-        camino_critico = self._encontrar_camino_bfs(casillas, inicio, salida)
-        casillas_criticas = set(camino_critico) if camino_critico else set()
-        
-        # Agregar variación solo en casillas que no están en el camino crítico
-        for fila in range(self.alto):
-            for col in range(self.ancho):
-                # Solo modificamos casillas que son camino y no están en el camino crítico
-                if isinstance(casillas[fila][col], Camino) and (fila, col) not in casillas_criticas:
-                    rand = random.random()
-                    if rand < self.probabilidad_liana:
-                        casillas[fila][col] = Liana()
-                    elif rand < self.probabilidad_liana + self.probabilidad_tunel:
-                        casillas[fila][col] = Tunel()
-        
-        return casillas
+            celdas: Grid plano de códigos a modificar.
+        """
+        ancho = self.ancho
+        alto = self.alto
+        if alto < 5 or ancho < 5:
+            return
+        
+        # Solo agregar un número muy limitado de conexiones adicionales
+        # Basado en el tamaño del mapa, pero mucho más conservador
+        num_conexiones = max(2, min(8, (ancho + alto) // 15))
+        
+        # ============================================
+        # CANDIDATOS VECTORIZADOS
+        # ============================================
+        # Interior [2, alto - 3] x [2, ancho - 3]: sus cuatro vecinos existen
+        grid = np.frombuffer(celdas, dtype=np.int8).reshape(alto, ancho)
+        camino = grid == CELDA_CAMINO
+        interior = (slice(2, alto - 2), slice(2, ancho - 2))
+        vertical = camino[1:alto - 3, 2:ancho - 2] & camino[3:alto - 1, 2:ancho - 2]
+        horizontal = camino[2:alto - 2, 1:ancho - 3] & camino[2:alto - 2, 3:ancho - 1]
+        # Solo muros con exactamente un par de caminos opuestos
+        # (arriba/abajo o izquierda/derecha): crea intersecciones sin
+        # abrir demasiado el laberinto
+        candidatos = (grid[interior] == CELDA_MURO) & (vertical ^ horizontal)
+        filas, cols = np.nonzero(candidatos)
+        if not len(filas):
+            return
+        indices = ((filas + 2) * ancho + cols + 2).tolist()
+        
+        # ============================================
+        # APERTURA EN ORDEN ALEATORIO
+        # ============================================
+        conexiones_creadas = 0
+        for indice in self._rng_np.permutation(len(indices)).tolist():
+            indice = indices[indice]
+            # Volver a comprobar: una conexión abierta antes puede haber
+            # añadido un segundo par de caminos opuestos a este muro
+            caminos_opuestos = (
+                (celdas[indice - ancho] == CELDA_CAMINO and
+                 celdas[indice + ancho] == CELDA_CAMINO) +
+                (celdas[indice - 1] == CELDA_CAMINO and
+                 celdas[indice + 1] == CELDA_CAMINO)
+            )
+            if caminos_opuestos == 1:
+                celdas[indice] = CELDA_CAMINO
+                conexiones_creadas += 1
+                if conexiones_creadas == num_conexiones:
+                    break
     
-    def _agregar_variacion_terreno_segura_multiple(self, casillas: List[List[Tile]], 
+    def _agregar_variacion_terreno_segura_multiple(self, grid: np.ndarray, 
                                                    inicio: Tuple[int, int], 
                                                    salidas: List[Tuple[int, int]],
-                                                   modo: str = "escapa") -> List[List[Tile]]:
+                                                   modo: str = "escapa") -> np.ndarray:
         """
         Agrega lianas y túneles de manera que no bloqueen los caminos a ninguna salida.
         Encuentra caminos a todas las salidas y evita modificar esas casillas críticas.
         
+        Las zonas protegidas y los sorteos se calculan con máscaras de NumPy
+        sobre todo el grid a la vez, en lugar de recorrerlo celda a celda.
+        
+        Garantía: las casillas de los caminos críticos (inicio -> cada salida,
+        calculados con las reglas del modo) quedan como Camino, o como Liana
+        en modo cazador, donde el jugador puede pasar. Por eso, si el grid de
+        entrada tenía caminos válidos, el de salida también los tiene.
+        
         Args:
-            casillas: Matriz de casillas base.
+            grid: Grid de códigos base (se modifica en el lugar).
             inicio: Posición de inicio.
             salidas: Lista de posiciones de salida.
             modo: Modo de juego ("escapa" o "cazador"). Afecta las probabilidades.
             
         Returns:
-            Matriz de casillas con variación de terreno.
+            Grid de códigos con variación de terreno.
         """
         # Ajustar probabilidades según el modo
         prob_liana = self.probabilidad_liana
@@ -362,330 +641,216 @@ class GeneradorMapa:
             prob_liana = 0.075  # Lianas reducidas a 7.5%
             prob_tunel = 0.025  # Túneles reducidos a 2.5%
         
-        # Encontrar caminos válidos a todas las salidas usando BFS
-        # En modo cazador, usar reglas de transición del modo cazador
-        casillas_criticas = set()
-        for salida in salidas:
-            if modo == "cazador":
-                # En modo cazador, el jugador puede pasar por Liana pero no por Tunel
-                camino_critico = self._encontrar_camino_bfs_cazador(casillas, inicio, salida)
-            else:
-                camino_critico = self._encontrar_camino_bfs(casillas, inicio, salida)
-            if camino_critico:
-                casillas_criticas.update(camino_critico)
+        # Coordenadas de cada celda (para las distancias) y máscara de casillas críticas
+        filas, cols = np.ogrid[:self.alto, :self.ancho]
+        criticas = np.zeros(grid.shape, dtype=bool)
         
-        # Asegurar que el área alrededor del inicio sea transitable para el jugador
-        # (en modo cazador, esto significa lianas o caminos, NO túneles)
+        # En modo cazador, también se protegen caminos hacia las esquinas donde
+        # están los enemigos (esquinas superior e inferior izquierda)
+        esquinas_enemigos = []
         if modo == "cazador":
-            # Proteger un área más grande alrededor del inicio (radio 5)
-            radio_seguro = 5
-            for df in range(-radio_seguro, radio_seguro + 1):
-                for dc in range(-radio_seguro, radio_seguro + 1):
-                    fila = inicio[0] + df
-                    col = inicio[1] + dc
-                    if (0 <= fila < self.alto and 0 <= col < self.ancho and
-                        isinstance(casillas[fila][col], Camino)):
-                        distancia = abs(df) + abs(dc)
-                        if distancia <= 3:  # Área inmediata alrededor del inicio
-                            # Proteger estas casillas (no poner túneles)
-                            casillas_criticas.add((fila, col))
-                            # Preferir lianas sobre caminos cerca del inicio (40% probabilidad)
-                            if random.random() < 0.4:
-                                casillas[fila][col] = Liana()
-                        elif distancia <= radio_seguro:  # Área más lejana
-                            # Proteger estas casillas también
-                            casillas_criticas.add((fila, col))
-            
-            # En modo cazador, también proteger caminos hacia las esquinas donde están los enemigos
-            # (esquinas superior e inferior izquierda)
             esquinas_enemigos = [
                 (1, 1),  # Esquina superior izquierda
                 (self.alto - 2, 1)  # Esquina inferior izquierda
             ]
+        
+        # Encontrar caminos válidos a todas las salidas (y esquinas) con una sola BFS.
+        # En modo cazador, usar reglas de transición del modo cazador (el jugador
+        # puede pasar por Liana pero no por Tunel). Las lianas que se colocan más
+        # abajo cerca del inicio no cambian qué casillas son transitables en ese
+        # modo, así que los caminos sirven para toda la función
+        transitable = self._construir_grid_transitable(grid, modo)
+        caminos_criticos = self._encontrar_caminos_bfs(transitable, inicio,
+                                                       salidas + esquinas_enemigos)
+        for camino_critico in caminos_criticos[:len(salidas)]:
+            self._marcar_posiciones(criticas, camino_critico)
+        
+        # Asegurar que el área alrededor del inicio sea transitable para el jugador
+        # (en modo cazador, esto significa lianas o caminos, NO túneles)
+        # Las distancias por eje al inicio se calculan una vez (vectores de
+        # una fila/columna que NumPy expande) y sirven tanto para la distancia
+        # Manhattan como para las áreas cuadradas
+        caminos = grid == CELDA_CAMINO
+        dist_filas_inicio = abs(filas - inicio[0])
+        dist_cols_inicio = abs(cols - inicio[1])
+        dist_inicio = dist_filas_inicio + dist_cols_inicio
+        if modo == "cazador":
+            # Proteger un área más grande alrededor del inicio (radio 5)
+            radio_seguro = 5
+            criticas |= caminos & (dist_inicio <= radio_seguro)
+            # Área inmediata alrededor del inicio (distancia <= 3):
+            # preferir lianas sobre caminos (40% probabilidad)
+            cerca_inicio = caminos & (dist_inicio <= 3)
+            grid[cerca_inicio & (self._rng_np.random(grid.shape) < 0.4)] = CELDA_LIANA
             
-            for esquina in esquinas_enemigos:
-                # Encontrar camino desde el inicio hasta la esquina de enemigos
-                camino_a_esquina = self._encontrar_camino_bfs_cazador(casillas, inicio, esquina)
+            # Proteger también los caminos hacia las esquinas de los enemigos
+            caminos = grid == CELDA_CAMINO
+            for esquina, camino_a_esquina in zip(esquinas_enemigos,
+                                                    caminos_criticos[len(salidas):]):
                 if camino_a_esquina:
                     # Proteger todo el camino (no poner túneles)
-                    casillas_criticas.update(camino_a_esquina)
-                    # También proteger área alrededor de la esquina
+                    self._marcar_posiciones(criticas, camino_a_esquina)
+                    # También proteger área (cuadrada) alrededor de la esquina
                     radio_esquina = 3
-                    for df in range(-radio_esquina, radio_esquina + 1):
-                        for dc in range(-radio_esquina, radio_esquina + 1):
-                            fila = esquina[0] + df
-                            col = esquina[1] + dc
-                            if (0 <= fila < self.alto and 0 <= col < self.ancho and
-                                isinstance(casillas[fila][col], Camino)):
-                                casillas_criticas.add((fila, col))
+                    criticas |= caminos & ((abs(filas - esquina[0]) <= radio_esquina) &
+                                           (abs(cols - esquina[1]) <= radio_esquina))
         else:
-            # En modo escapa, proteger el área alrededor del inicio normalmente
+            # En modo escapa, proteger el área (cuadrada) alrededor del inicio normalmente
             radio_seguro = 3
-            for df in range(-radio_seguro, radio_seguro + 1):
-                for dc in range(-radio_seguro, radio_seguro + 1):
-                    fila = inicio[0] + df
-                    col = inicio[1] + dc
-                    if (0 <= fila < self.alto and 0 <= col < self.ancho and
-                        isinstance(casillas[fila][col], Camino)):
-                        casillas_criticas.add((fila, col))
-        
-        # Agregar variación solo en casillas que no están en ningún camino crítico
-        for fila in range(self.alto):
-            for col in range(self.ancho):
-                # Solo modificamos casillas que son camino y no están en ningún camino crítico
-                if isinstance(casillas[fila][col], Camino) and (fila, col) not in casillas_criticas:
-                    rand = random.random()
-                    if rand < prob_liana:
-                        casillas[fila][col] = Liana()
-                    elif rand < prob_liana + prob_tunel:
-                        # En modo cazador, verificar que no bloquee rutas importantes antes de poner túnel
-                        if modo == "cazador":
-                            # Verificar que esta casilla no sea crítica para llegar a áreas importantes
-                            # Si está en el centro del mapa o cerca de rutas principales, evitar túneles
-                            distancia_centro_x = abs(col - self.ancho // 2)
-                            distancia_centro_y = abs(fila - self.alto // 2)
-                            
-                            # Calcular distancia a las esquinas de enemigos
-                            dist_esquina_sup = abs(fila - 1) + abs(col - 1)
-                            dist_esquina_inf = abs(fila - (self.alto - 2)) + abs(col - 1)
-                            dist_min_esquina = min(dist_esquina_sup, dist_esquina_inf)
-                            
-                            # Evitar túneles solo en áreas muy críticas:
-                            # 1. Muy cerca del centro del mapa (solo 1/4 del mapa)
-                            # 2. Muy cerca de las esquinas de enemigos (dentro de 5 casillas)
-                            # 3. Muy cerca del inicio del jugador (dentro de 8 casillas)
-                            dist_inicio = abs(fila - inicio[0]) + abs(col - inicio[1])
-                            
-                            # Solo evitar túneles en áreas muy cercanas a rutas críticas
-                            # Reducir restricciones para permitir más túneles
-                            if (distancia_centro_x < self.ancho // 5 or 
-                                distancia_centro_y < self.alto // 5 or
-                                dist_min_esquina < 4 or
-                                dist_inicio < 6):
-                                # En lugar de túnel, poner liana o dejar camino
-                                if random.random() < 0.3:
-                                    casillas[fila][col] = Liana()
-                                # Si no, dejar como Camino
-                            else:
-                                # Áreas periféricas y medias, permitir túnel normalmente
-                                casillas[fila][col] = Tunel()
-                        else:
-                            # Modo escapa, comportamiento normal
-                            casillas[fila][col] = Tunel()
-        
-        return casillas
+            criticas |= caminos & ((dist_filas_inicio <= radio_seguro) &
+                                   (dist_cols_inicio <= radio_seguro))
+        
+        # Agregar variación solo en casillas que son camino y no están en ningún camino crítico
+        # (`caminos` ya refleja las lianas puestas cerca del inicio en modo cazador).
+        # Un único sorteo por celda decide entre liana, túnel o nada
+        candidatas = caminos & ~criticas
+        sorteo = self._rng_np.random(grid.shape)
+        lianas = candidatas & (sorteo < prob_liana)
+        tuneles = candidatas & (sorteo >= prob_liana) & (sorteo < prob_liana + prob_tunel)
+        grid[lianas] = CELDA_LIANA
+        
+        if modo == "cazador":
+            # En modo cazador, verificar que no bloquee rutas importantes antes de poner túnel.
+            # Evitar túneles solo en áreas muy críticas:
+            # 1. Muy cerca del centro del mapa (solo 1/4 del mapa)
+            # 2. Muy cerca de las esquinas de enemigos (dentro de 4 casillas)
+            # 3. Muy cerca del inicio del jugador (dentro de 6 casillas)
+            dist_esquina_sup = abs(filas - 1) + abs(cols - 1)
+            dist_esquina_inf = abs(filas - (self.alto - 2)) + abs(cols - 1)
+            zona_restringida = (
+                (abs(cols - self.ancho // 2) < self.ancho // 5) |
+                (abs(filas - self.alto // 2) < self.alto // 5) |
+                (np.minimum(dist_esquina_sup, dist_esquina_inf) < 4) |
+                (dist_inicio < 6)
+            )
+            # En zonas restringidas, en lugar de túnel poner liana (30%) o dejar camino;
+            # en áreas periféricas y medias, permitir túnel normalmente
+            grid[tuneles & zona_restringida &
+                 (self._rng_np.random(grid.shape) < 0.3)] = CELDA_LIANA
+            grid[tuneles & ~zona_restringida] = CELDA_TUNEL
+        else:
+            # Modo escapa, comportamiento normal
+            grid[tuneles] = CELDA_TUNEL
+        
+        return grid
     
-    def _encontrar_camino_bfs_cazador(self, casillas: List[List[Tile]], 
-                                      inicio: Tuple[int, int], 
-                                      salida: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+    @staticmethod
+    def _marcar_posiciones(mascara: np.ndarray,
+                           indices: Optional[List[int]]) -> None:
         """
-        Encuentra un camino desde inicio hasta salida usando BFS con reglas del modo cazador.
-        En modo cazador, el jugador puede pasar por Camino y Liana, pero NO por Tunel.
+        Marca en una máscara booleana una lista de casillas dadas por índice plano.
         
         Args:
-            casillas: Matriz de casillas.
-            inicio: Posición de inicio.
-            salida: Posición de salida.
-            
-        Returns:
-            Lista de tuplas (fila, columna) representando el camino, o None si no existe.
+            mascara: Máscara (alto, ancho) contigua a modificar.
+            indices: Índices planos (fila * ancho + col) a marcar; si es None
+                     o está vacía no se hace nada.
         """
-        from modelo.tile import Camino, Liana
-        
-        # Verificar que inicio y salida sean transitables para el jugador en modo cazador
-        tile_inicio = casillas[inicio[0]][inicio[1]]
-        tile_salida = casillas[salida[0]][salida[1]]
-        
-        if not (isinstance(tile_inicio, Camino) or isinstance(tile_inicio, Liana)):
-            return None
-        if not (isinstance(tile_salida, Camino) or isinstance(tile_salida, Liana)):
-            return None
-        
-        visitado = [[False for _ in range(self.ancho)] for _ in range(self.alto)]
-        padre = {}
-        cola = deque([inicio])
-        visitado[inicio[0]][inicio[1]] = True
+        if indices:
+            mascara.reshape(-1)[indices] = True
+    
+    def _construir_grid_transitable(self, grid: np.ndarray,
+                                    modo: str = "escapa") -> bytes:
+        """
+        Precalcula qué casillas puede atravesar el jugador.
         
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        Se obtiene con una sola búsqueda en tabla vectorizada sobre el grid,
+        para que las búsquedas BFS consulten un byte por vecino. El resultado
+        lleva un borde centinela de una casilla no transitable (ver
+        _indice_transitable), de modo que las búsquedas no comprueban límites.
         
-        while cola:
-            fila, col = cola.popleft()
-            
-            if (fila, col) == salida:
-                # Reconstruir camino
-                camino = []
-                actual = salida
-                while actual is not None:
-                    camino.append(actual)
-                    actual = padre.get(actual)
-                return camino[::-1]  # Invertir para tener inicio -> salida
+        Args:
+            grid: Grid (alto, ancho) de códigos de casilla.
+            modo: Modo de juego. En modo cazador el jugador puede pasar por
+                  Camino y Liana, pero NO por Tunel; en modo escapa por
+                  Camino y Tunel, pero NO por Liana.
             
-            for df, dc in direcciones:
-                nueva_fila = fila + df
-                nueva_col = col + dc
-                
-                if (0 <= nueva_fila < self.alto and 
-                    0 <= nueva_col < self.ancho and 
-                    not visitado[nueva_fila][nueva_col]):
-                    
-                    tile = casillas[nueva_fila][nueva_col]
-                    # En modo cazador, el jugador puede pasar por Camino y Liana, pero NO por Tunel
-                    if isinstance(tile, Camino) or isinstance(tile, Liana):
-                        visitado[nueva_fila][nueva_col] = True
-                        padre[(nueva_fila, nueva_col)] = (fila, col)
-                        cola.append((nueva_fila, nueva_col))
-        
-        return None
+        Returns:
+            Matriz plana de (alto + 2) x (ancho + 2) con 1 en las casillas
+            transitables y 0 en el resto y en el borde.
+        """
+        tabla = _TRANSITABLE_CAZADOR if modo == "cazador" else _TRANSITABLE_ESCAPA
+        return np.pad(tabla[grid], 1).tobytes()
     
-    def _encontrar_camino_bfs(self, casillas: List[List[Tile]], 
-                             inicio: Tuple[int, int], 
-                             salida: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+    def _indice_transitable(self, posicion: Tuple[int, int]) -> int:
         """
-        Encuentra un camino desde inicio hasta salida usando BFS.
+        Índice plano de una posición en la matriz de _construir_grid_transitable.
         
         Args:
-            casillas: Matriz de casillas.
-            inicio: Posición de inicio.
-            salida: Posición de salida.
+            posicion: Tupla (fila, columna) del mapa.
             
         Returns:
-            Lista de tuplas (fila, columna) representando el camino, o None si no existe.
+            Índice desplazado por el borde centinela.
         """
-        if not casillas[inicio[0]][inicio[1]].permite_paso_jugador():
-            return None
-        if not casillas[salida[0]][salida[1]].permite_paso_jugador():
-            return None
-        
-        visitado = [[False for _ in range(self.ancho)] for _ in range(self.alto)]
-        padre = {}
-        cola = deque([inicio])
-        visitado[inicio[0]][inicio[1]] = True
-        
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        return (posicion[0] + 1) * (self.ancho + 2) + posicion[1] + 1
+    
+    def _indices_del_mapa(self, camino: Optional[Iterable[int]]) -> Optional[List[int]]:
+        """
+        Convierte índices de la matriz con borde a índices planos del mapa.
         
-        while cola:
-            fila, col = cola.popleft()
-            
-            if (fila, col) == salida:
-                # Reconstruir camino
-                camino = []
-                actual = salida
-                while actual is not None:
-                    camino.append(actual)
-                    actual = padre.get(actual)
-                return camino[::-1]  # Invertir para tener inicio -> salida
+        Args:
+            camino: Índices de la matriz de _construir_grid_transitable, o None.
             
-            for df, dc in direcciones:
-                nueva_fila = fila + df
-                nueva_col = col + dc
-                
-                if (0 <= nueva_fila < self.alto and 
-                    0 <= nueva_col < self.ancho and 
-                    not visitado[nueva_fila][nueva_col] and
-                    casillas[nueva_fila][nueva_col].permite_paso_jugador()):
-                    
-                    visitado[nueva_fila][nueva_col] = True
-                    padre[(nueva_fila, nueva_col)] = (fila, col)
-                    cola.append((nueva_fila, nueva_col))
-        
-        return None
+        Returns:
+            Índices planos del mapa (fila * ancho + col), o None.
+        """
+        if camino is None:
+            return None
+        ancho = self.ancho
+        ancho_con_borde = ancho + 2
+        # Una fila con borde tiene 2 casillas más: restar la fila y columna extra
+        return [indice - ancho_con_borde - 1 - 2 * (indice // ancho_con_borde - 1)
+                for indice in camino]
     
-    def _existe_camino_valido_cazador(self, casillas: List[List[Tile]], 
-                                      inicio: Tuple[int, int], 
-                                      salida: Tuple[int, int]) -> bool:
+    @staticmethod
+    def _casillas_desde_grid(grid: np.ndarray) -> List[List[Tile]]:
         """
-        Verifica si existe un camino válido desde inicio hasta salida usando BFS con reglas del modo cazador.
-        En modo cazador, el jugador puede pasar por Camino y Liana, pero NO por Tunel.
+        Convierte el grid de códigos en la matriz de casillas del Mapa.
         
         Args:
-            casillas: Matriz de casillas.
-            inicio: Tupla (fila, columna) de inicio.
-            salida: Tupla (fila, columna) de salida.
+            grid: Grid (alto, ancho) de códigos de casilla.
             
         Returns:
-            True si existe un camino válido para el jugador en modo cazador, False en caso contrario.
+            Matriz 2D de casillas compartidas (una instancia por tipo).
         """
-        from modelo.tile import Camino, Liana
-        
-        # Verificar que inicio y salida sean transitables para el jugador en modo cazador
-        tile_inicio = casillas[inicio[0]][inicio[1]]
-        tile_salida = casillas[salida[0]][salida[1]]
-        
-        if not (isinstance(tile_inicio, Camino) or isinstance(tile_inicio, Liana)):
-            return False
-        if not (isinstance(tile_salida, Camino) or isinstance(tile_salida, Liana)):
-            return False
-        
-        visitado = [[False for _ in range(self.ancho)] for _ in range(self.alto)]
-        cola = deque([inicio])
-        visitado[inicio[0]][inicio[1]] = True
-        
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        return _CASILLAS_POR_CODIGO[grid].tolist()
+    
+    def _encontrar_caminos_bfs(self, transitable: bytes,
+                               inicio: Tuple[int, int],
+                               destinos: List[Tuple[int, int]]) -> List[Optional[List[int]]]:
+        """
+        Encuentra con una sola BFS los caminos desde inicio hasta varios destinos.
         
-        while cola:
-            fila, col = cola.popleft()
-            
-            if (fila, col) == salida:
-                return True
+        Args:
+            transitable: Matriz plana de casillas transitables para el jugador
+                         (ver _construir_grid_transitable).
+            inicio: Posición de inicio.
+            destinos: Posiciones de destino.
             
-            for df, dc in direcciones:
-                nueva_fila = fila + df
-                nueva_col = col + dc
-                
-                if (0 <= nueva_fila < self.alto and 
-                    0 <= nueva_col < self.ancho and 
-                    not visitado[nueva_fila][nueva_col]):
-                    
-                    tile = casillas[nueva_fila][nueva_col]
-                    # En modo cazador, el jugador puede pasar por Camino y Liana, pero NO por Tunel
-                    if isinstance(tile, Camino) or isinstance(tile, Liana):
-                        visitado[nueva_fila][nueva_col] = True
-                        cola.append((nueva_fila, nueva_col))
-        
-        return False
+        Returns:
+            Para cada destino (en el mismo orden), la lista de índices planos
+            del camino, o None si no existe.
+        """
+        indices = [self._indice_transitable(destino) for destino in destinos]
+        anterior = _bfs_predecesores(transitable, self.ancho + 2,
+                                     self._indice_transitable(inicio), indices)
+        return [self._indices_del_mapa(_camino_desde_predecesores(anterior, indice))
+                for indice in indices]
     
-    def _existe_camino_valido(self, casillas: List[List[Tile]], 
-                              inicio: Tuple[int, int], 
-                              salida: Tuple[int, int]) -> bool:
+    def _existen_caminos_validos(self, transitable: bytes,
+                                 inicio: Tuple[int, int],
+                                 salidas: List[Tuple[int, int]]) -> bool:
         """
-        Verifica si existe un camino válido desde inicio hasta salida usando BFS.
+        Verifica con una sola búsqueda que todas las salidas sean alcanzables desde inicio.
         
         Args:
-            casillas: Matriz de casillas.
+            transitable: Matriz plana de casillas transitables para el jugador
+                         (ver _construir_grid_transitable).
             inicio: Tupla (fila, columna) de inicio.
-            salida: Tupla (fila, columna) de salida.
+            salidas: Lista de tuplas (fila, columna) de salida.
             
         Returns:
-            True si existe un camino válido para el jugador, False en caso contrario.
+            True si existe un camino válido a cada salida para el jugador,
+            False en caso contrario.
         """
-        if not casillas[inicio[0]][inicio[1]].permite_paso_jugador():
-            return False
-        if not casillas[salida[0]][salida[1]].permite_paso_jugador():
-            return False
-        
-        visitado = [[False for _ in range(self.ancho)] for _ in range(self.alto)]
-        cola = deque([inicio])
-        visitado[inicio[0]][inicio[1]] = True
-        
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        while cola:
-            fila, col = cola.popleft()
-            
-            if (fila, col) == salida:
-                return True
-            
-            for df, dc in direcciones:
-                nueva_fila = fila + df
-                nueva_col = col + dc
-                
-                if (0 <= nueva_fila < self.alto and 
-                    0 <= nueva_col < self.ancho and 
-                    not visitado[nueva_fila][nueva_col] and
-                    casillas[nueva_fila][nueva_col].permite_paso_jugador()):
-                    
-                    visitado[nueva_fila][nueva_col] = True
-                    cola.append((nueva_fila, nueva_col))
-        
-        return False
-
+        return _bfs_alcanza_todos(transitable, self.ancho + 2, self._indice_transitable(inicio),
+                                  [self._indice_transitable(salida) for salida in salidas])
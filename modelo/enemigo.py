@@ -2,19 +2,24 @@
 Módulo enemigo: Define la clase Enemigo con movimiento e IA.
 """
 
+from array import array
 from typing import Tuple, Optional, List
 from enum import Enum
 
 # Importaciones que funcionan tanto como módulo como ejecutado directamente
 try:
-    from .mapa import Mapa
+    from .mapa import Mapa, TIPOS_TRANSITABLES_ENEMIGO
     from .jugador import Jugador
 except ImportError:
     # Si falla la importación relativa, intentar absoluta
-    from modelo.mapa import Mapa
+    from modelo.mapa import Mapa, TIPOS_TRANSITABLES_ENEMIGO
     from modelo.jugador import Jugador
 
 
+# Direcciones (df, dc) del pathfinding: arriba, abajo, izquierda, derecha
+_DIRECCIONES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
 class EstadoEnemigo(Enum):
     """Estados posibles de un enemigo."""
     EN_SPAWN = "en_spawn"  # Esperando en el spawn
@@ -389,59 +394,7 @@ class Enemigo:
         Returns:
             Lista de posiciones desde inicio hasta destino, o None si no hay camino.
         """
-        from collections import deque
-        
-        if inicio == destino:
-            return [inicio]
-        
-        # Verificar que inicio y destino sean transitables para enemigos en modo escapa
-        if not mapa.es_transitable_por_enemigo(inicio[0], inicio[1], modo="escapa"):
-            return None
-        if not mapa.es_transitable_por_enemigo(destino[0], destino[1], modo="escapa"):
-            return None
-        
-        # Inicializar estructuras de datos para BFS
-        visitado = [[False for _ in range(mapa.ancho)] for _ in range(mapa.alto)]  # Matriz de visitados
-        padre = {}  # Diccionario para reconstruir el camino: {hijo: padre}
-        cola = deque([inicio])  # Cola FIFO para BFS
-        visitado[inicio[0]][inicio[1]] = True  # Marcar inicio como visitado
-        
-        # Direcciones posibles: arriba, abajo, izquierda, derecha
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        # BFS: explorar nivel por nivel hasta encontrar el destino
-        while cola:
-            fila, col = cola.popleft()  # Obtener siguiente posición de la cola
-            
-            # Si llegamos al destino, reconstruir y retornar el camino
-            if (fila, col) == destino:
-                # Reconstruir camino desde destino hasta inicio usando el diccionario padre
-                camino = []
-                actual = destino
-                while actual is not None:
-                    camino.append(actual)
-                    actual = padre.get(actual)  # Obtener padre de la posición actual
-                # Invertir para tener el camino desde inicio -> destino
-                return camino[::-1]
-            
-            # Explorar vecinos (4 direcciones)
-            for df, dc in direcciones:
-                nueva_fila = fila + df
-                nueva_col = col + dc
-                
-                # Verificar que la nueva posición sea válida y transitable
-                if (0 <= nueva_fila < mapa.alto and 
-                    0 <= nueva_col < mapa.ancho and 
-                    not visitado[nueva_fila][nueva_col] and
-                    mapa.es_transitable_por_enemigo(nueva_fila, nueva_col, modo="escapa")):
-                    
-                    # Marcar como visitado y agregar a la cola
-                    visitado[nueva_fila][nueva_col] = True
-                    padre[(nueva_fila, nueva_col)] = (fila, col)  # Guardar relación padre-hijo
-                    cola.append((nueva_fila, nueva_col))
-        
-        # No se encontró camino
-        return None
+        return self._encontrar_camino_bfs(mapa, inicio, destino, modo="escapa")
     
     def _perseguir_jugador_simple(self, mapa: Mapa, jugador_pos: Tuple[int, int], enemigo_pos: Tuple[int, int]) -> Optional[str]:
         """
@@ -605,60 +558,97 @@ class Enemigo:
             elif mejor_movimiento == "derecha":
                 self.mover_derecha(mapa, modo="cazador")
     
-    def _encontrar_camino_bfs(self, mapa: Mapa, inicio: Tuple[int, int], destino: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+    def _encontrar_camino_bfs(self, mapa: Mapa, inicio: Tuple[int, int], destino: Tuple[int, int],
+                              modo: str = "cazador") -> Optional[List[Tuple[int, int]]]:
         """
-        Encuentra el camino más corto desde inicio hasta destino usando BFS.
+        Encuentra el camino más corto desde inicio hasta destino usando BFS bidireccional.
+        
+        La búsqueda avanza por niveles desde ambos extremos, expandiendo
+        siempre el frente más pequeño, y se detiene cuando los dos frentes se
+        tocan (cada uno explora más o menos la mitad del radio). Las casillas
+        se identifican por índice plano (fila * ancho + col): cada visitada
+        guarda su dueño (1 = lado del inicio, 2 = lado del destino) en un
+        bytearray y su predecesor en un array de enteros. Como se conoce la
+        profundidad de cada frente, el camino se rellena en una lista
+        preasignada, sin invertirlo.
         
         Args:
             mapa: Mapa del juego.
             inicio: Posición inicial (fila, columna).
             destino: Posición destino (fila, columna).
+            modo: Modo de juego cuyas reglas de paso para enemigos se aplican.
             
         Returns:
             Lista de posiciones desde inicio hasta destino, o None si no hay camino.
         """
-        from collections import deque
-        
         if inicio == destino:
             return [inicio]
         
-        # Verificar que inicio y destino sean transitables para enemigos en modo cazador
-        if not mapa.es_transitable_por_enemigo(inicio[0], inicio[1], modo="cazador"):
+        # Verificar que inicio y destino sean transitables para enemigos en este modo
+        transitable = mapa.es_transitable_por_enemigo
+        if not transitable(inicio[0], inicio[1], modo=modo):
             return None
-        if not mapa.es_transitable_por_enemigo(destino[0], destino[1], modo="cazador"):
+        if not transitable(destino[0], destino[1], modo=modo):
             return None
         
-        visitado = [[False for _ in range(mapa.ancho)] for _ in range(mapa.alto)]
-        padre = {}
-        cola = deque([inicio])
-        visitado[inicio[0]][inicio[1]] = True
-        
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        while cola:
-            fila, col = cola.popleft()
-            
-            if (fila, col) == destino:
-                # Reconstruir camino
-                camino = []
-                actual = destino
-                while actual is not None:
-                    camino.append(actual)
-                    actual = padre.get(actual)
-                return camino[::-1]  # Invertir para tener inicio -> destino
-            
-            for df, dc in direcciones:
-                nueva_fila = fila + df
-                nueva_col = col + dc
-                
-                if (0 <= nueva_fila < mapa.alto and 
-                    0 <= nueva_col < mapa.ancho and 
-                    not visitado[nueva_fila][nueva_col] and
-                    mapa.es_transitable_por_enemigo(nueva_fila, nueva_col, modo="cazador")):
-                    
-                    visitado[nueva_fila][nueva_col] = True
-                    padre[(nueva_fila, nueva_col)] = (fila, col)
-                    cola.append((nueva_fila, nueva_col))
+        # Referencias locales para el bucle: la transitabilidad de cada vecino
+        # se comprueba con un `in` sobre el tipo de la casilla
+        ancho = mapa.ancho
+        alto = mapa.alto
+        casillas = mapa.casillas
+        transitables = TIPOS_TRANSITABLES_ENEMIGO.get(modo, TIPOS_TRANSITABLES_ENEMIGO["escapa"])
+        origen = inicio[0] * ancho + inicio[1]
+        objetivo = destino[0] * ancho + destino[1]
+        
+        dueno = bytearray(ancho * alto)
+        padre = array('l', [-1]) * (ancho * alto)
+        dueno[origen] = 1
+        dueno[objetivo] = 2
+        padre[origen] = origen
+        padre[objetivo] = objetivo
+        frentes = [None, [origen], [objetivo]]  # Indexados por dueño
+        profundidad = [0, 0, 0]  # Profundidad del frente de cada lado
+        
+        while frentes[1] and frentes[2]:
+            propio = 1 if len(frentes[1]) <= len(frentes[2]) else 2
+            siguiente = []
+            for actual in frentes[propio]:
+                fila, col = divmod(actual, ancho)
+                for df, dc in _DIRECCIONES:
+                    nueva_fila = fila + df
+                    nueva_col = col + dc
+                    if not (0 <= nueva_fila < alto and 0 <= nueva_col < ancho):
+                        continue
+                    vecino = nueva_fila * ancho + nueva_col
+                    marca = dueno[vecino]
+                    if not marca:
+                        if casillas[nueva_fila][nueva_col].tipo in transitables:
+                            dueno[vecino] = propio
+                            padre[vecino] = actual
+                            siguiente.append(vecino)
+                    elif marca != propio:
+                        # Los frentes se tocan: `lado_inicio` y `lado_destino`
+                        # son las dos casillas adyacentes del encuentro
+                        if propio == 1:
+                            lado_inicio, lado_destino = actual, vecino
+                        else:
+                            lado_inicio, lado_destino = vecino, actual
+                        
+                        # Reconstruir: mitad del inicio de atrás hacia adelante y
+                        # mitad del destino hacia adelante
+                        medio = profundidad[1]
+                        camino = [None] * (medio + profundidad[2] + 2)
+                        indice = lado_inicio
+                        for i in range(medio, -1, -1):
+                            camino[i] = divmod(indice, ancho)
+                            indice = padre[indice]
+                        indice = lado_destino
+                        for i in range(medio + 1, len(camino)):
+                            camino[i] = divmod(indice, ancho)
+                            indice = padre[indice]
+                        return camino
+            frentes[propio] = siguiente
+            profundidad[propio] += 1
         
         return None
     
@@ -2,15 +2,33 @@
 Módulo mapa: Define la clase Mapa que representa el laberinto.
 """
 
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Dict, FrozenSet
 from collections import deque
+from array import array
 
 # Importación que funciona tanto como módulo como ejecutado directamente
 try:
-    from .tile import Tile, Camino, Muro
+    from .tile import Tile, Camino, Muro, TipoTile
 except ImportError:
     # Si falla la importación relativa, intentar absoluta
-    from modelo.tile import Tile, Camino, Muro
+    from modelo.tile import Tile, Camino, Muro, TipoTile
+
+
+# ============================================
+# TIPOS TRANSITABLES POR MODO
+# ============================================
+# Tipos de casilla que cada actor puede atravesar en cada modo. Reflejan las
+# reglas de es_transitable_por_jugador / es_transitable_por_enemigo y permiten
+# a las búsquedas comprobar una casilla con un `in` sobre su tipo, sin llamar
+# a un método por vecino
+TIPOS_TRANSITABLES_JUGADOR: Dict[str, FrozenSet[TipoTile]] = {
+    "escapa": frozenset({TipoTile.CAMINO, TipoTile.TUNEL}),
+    "cazador": frozenset({TipoTile.CAMINO, TipoTile.LIANA}),
+}
+TIPOS_TRANSITABLES_ENEMIGO: Dict[str, FrozenSet[TipoTile]] = {
+    "escapa": frozenset({TipoTile.CAMINO, TipoTile.LIANA}),
+    "cazador": frozenset({TipoTile.CAMINO, TipoTile.TUNEL}),
+}
 
 
 class Mapa:
@@ -80,6 +98,10 @@ class Mapa:
         # Mantener compatibilidad hacia atrás: primera salida como salida principal
         # (algunos métodos antiguos pueden usar posicion_salida en singular)
         self.posicion_salida = posiciones_salida[0]
+        
+        # Mapas de transitabilidad del jugador por modo, construidos al usarse
+        # por primera vez (ver _obtener_transitable_jugador)
+        self._transitable_jugador: Dict[str, bytes] = {}
     
     def es_posicion_valida(self, fila: int, columna: int) -> bool:
         """
@@ -119,11 +141,12 @@ class Mapa:
         # - Jugador puede pasar por Liana (verde) pero NO por Tunel (azul)
         # - Esto crea una mecánica diferente donde el jugador y los enemigos
         #   tienen acceso a diferentes áreas del mapa
+        # (el tipo se compara por identidad del enum, sin isinstance)
         if modo == "cazador":
-            from modelo.tile import Liana, Tunel
-            if isinstance(tile, Liana):
+            tipo = tile.tipo
+            if tipo is TipoTile.LIANA:
                 return True  # En modo cazador, el jugador puede pasar por Liana
-            elif isinstance(tile, Tunel):
+            elif tipo is TipoTile.TUNEL:
                 return False  # En modo cazador, el jugador NO puede pasar por Tunel
         
         # En modo escapa, usar las reglas normales del tile
@@ -154,10 +177,10 @@ class Mapa:
         # - Enemigos pueden pasar por Tunel (azul) pero NO por Liana (verde)
         # - Esto complementa las reglas del jugador para crear mecánicas asimétricas
         if modo == "cazador":
-            from modelo.tile import Liana, Tunel
-            if isinstance(tile, Tunel):
+            tipo = tile.tipo
+            if tipo is TipoTile.TUNEL:
                 return True  # En modo cazador, los enemigos pueden pasar por Tunel
-            elif isinstance(tile, Liana):
+            elif tipo is TipoTile.LIANA:
                 return False  # En modo cazador, los enemigos NO pueden pasar por Liana
         
         # En modo escapa, usar las reglas normales del tile
@@ -218,6 +241,36 @@ class Mapa:
         """
         return self.posicion_inicio
     
+    def _obtener_transitable_jugador(self, modo: str = "escapa") -> bytes:
+        """
+        Devuelve la transitabilidad del jugador como un grid plano de bytes.
+        
+        Cada casilla vale 1 si el jugador puede pasar en `modo` y 0 si no. El
+        grid lleva un borde de casillas no transitables alrededor del mapa
+        (ancho + 2 columnas por fila), así que los cuatro vecinos de cualquier
+        casilla existen y las búsquedas no necesitan comprobar límites. Se
+        construye una sola vez por modo: las casillas no cambian durante la
+        partida.
+        
+        Args:
+            modo: Modo de juego ("escapa" o "cazador").
+            
+        Returns:
+            Bytes de tamaño (alto + 2) * (ancho + 2); la casilla (fila, col)
+            está en el índice (fila + 1) * (ancho + 2) + col + 1.
+        """
+        transitable = self._transitable_jugador.get(modo)
+        if transitable is None:
+            transitables = TIPOS_TRANSITABLES_JUGADOR.get(modo, TIPOS_TRANSITABLES_JUGADOR["escapa"])
+            borde = bytes(self.ancho + 2)
+            filas = [borde]
+            for fila in self.casillas:
+                filas.append(b"\0" + bytes([tile.tipo in transitables for tile in fila]) + b"\0")
+            filas.append(borde)
+            transitable = b"".join(filas)
+            self._transitable_jugador[modo] = transitable
+        return transitable
+    
     def existe_camino_valido(self, desde: Optional[Tuple[int, int]] = None, 
                              hasta: Optional[Tuple[int, int]] = None) -> bool:
         """
@@ -247,44 +300,149 @@ class Mapa:
             return False
         
         # ============================================
-        # BFS (Breadth-First Search) PARA ENCONTRAR CAMINO
+        # BFS BIDIRECCIONAL PARA ENCONTRAR CAMINO
         # ============================================
-        # BFS explora el mapa nivel por nivel hasta encontrar el destino
-        # Es ideal para encontrar el camino más corto en un grafo no ponderado
+        # La búsqueda avanza por niveles desde el inicio y desde el destino a
+        # la vez, expandiendo siempre el frente más pequeño, y termina en
+        # cuanto los dos frentes se tocan: cada uno recorre más o menos la
+        # mitad del radio en lugar del radio completo
+        
+        # Las casillas se identifican por índice plano sobre el grid de
+        # transitabilidad con borde: cada vecino se comprueba con dos lecturas
+        # de bytes, sin límites ni llamadas a métodos
+        ancho = self.ancho + 2
+        transitable = self._obtener_transitable_jugador("escapa")
+        origen = (fila_inicio + 1) * ancho + col_inicio + 1
+        objetivo = (fila_fin + 1) * ancho + col_fin + 1
+        if origen == objetivo:
+            return True
+        
+        # Dueño de cada casilla visitada en un bytearray plano del mismo
+        # tamaño: 0 = sin visitar, 1 = lado del inicio, 2 = lado del destino
+        dueno = bytearray(len(transitable))
+        dueno[origen] = 1
+        dueno[objetivo] = 2
+        frente_inicio = [origen]
+        frente_destino = [objetivo]
+        
+        while frente_inicio and frente_destino:
+            if len(frente_inicio) <= len(frente_destino):
+                frente, propio = frente_inicio, 1
+            else:
+                frente, propio = frente_destino, 2
+            
+            siguiente = []
+            encolar = siguiente.append
+            for actual in frente:
+                # Explorar vecinos (arriba, abajo, izquierda, derecha)
+                # desenrollado: sin tupla de vecinos ni iteración por casilla.
+                # Un vecino transitable (el borde nunca lo es) del otro lado
+                # une los frentes; uno sin visitar se marca y se encola
+                vecino = actual - ancho
+                marca = dueno[vecino]
+                if marca != propio and transitable[vecino]:
+                    if marca:
+                        return True
+                    dueno[vecino] = propio
+                    encolar(vecino)
+                vecino = actual + ancho
+                marca = dueno[vecino]
+                if marca != propio and transitable[vecino]:
+                    if marca:
+                        return True
+                    dueno[vecino] = propio
+                    encolar(vecino)
+                vecino = actual - 1
+                marca = dueno[vecino]
+                if marca != propio and transitable[vecino]:
+                    if marca:
+                        return True
+                    dueno[vecino] = propio
+                    encolar(vecino)
+                vecino = actual + 1
+                marca = dueno[vecino]
+                if marca != propio and transitable[vecino]:
+                    if marca:
+                        return True
+                    dueno[vecino] = propio
+                    encolar(vecino)
+            
+            if propio == 1:
+                frente_inicio = siguiente
+            else:
+                frente_destino = siguiente
         
-        # Inicializar estructuras de datos para BFS
-        visitado = [[False for _ in range(self.ancho)] for _ in range(self.alto)]  # Matriz de visitados
-        cola = deque([(fila_inicio, col_inicio)])  # Cola FIFO para BFS
-        visitado[fila_inicio][col_inicio] = True  # Marcar inicio como visitado
+        # No se encontró camino
+        return False
+    
+    def obtener_camino_mas_corto(self, desde: Tuple[int, int], hasta: Tuple[int, int],
+                                 modo: str = "escapa") -> Optional[List[str]]:
+        """
+        Calcula el camino más corto del jugador entre dos posiciones.
         
-        # Direcciones posibles: arriba, abajo, izquierda, derecha
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        Args:
+            desde: Posición (fila, columna) de inicio.
+            hasta: Posición (fila, columna) de destino.
+            modo: Modo de juego ("escapa" o "cazador"), que define qué casillas
+                  son transitables para el jugador.
+            
+        Returns:
+            Lista de direcciones ("arriba", "abajo", "izquierda", "derecha") que
+            llevan de `desde` a `hasta` (vacía si son la misma posición), o None
+            si no existe camino.
+        """
+        if not (self.es_transitable_por_jugador(desde[0], desde[1], modo) and
+                self.es_transitable_por_jugador(hasta[0], hasta[1], modo)):
+            return None
+        
+        # ============================================
+        # BFS CON REGISTRO DE PREDECESORES
+        # ============================================
+        # Las casillas se identifican por índice plano (fila * ancho + col).
+        # Para cada casilla alcanzada se guarda el índice de la anterior (-1 si
+        # no se ha visitado) y el índice de la dirección usada para llegar, lo
+        # que permite reconstruir el camino al llegar al destino sin crear
+        # tuplas ni consultar un diccionario por vecino
+        direcciones = (("arriba", -1, 0), ("abajo", 1, 0),
+                       ("izquierda", 0, -1), ("derecha", 0, 1))
+        ancho = self.ancho
+        alto = self.alto
+        casillas = self.casillas
+        transitables = TIPOS_TRANSITABLES_JUGADOR.get(modo, TIPOS_TRANSITABLES_JUGADOR["escapa"])
+        origen = desde[0] * ancho + desde[1]
+        objetivo = hasta[0] * ancho + hasta[1]
+        anterior = array('l', [-1]) * (ancho * alto)
+        direccion_llegada = bytearray(ancho * alto)
+        anterior[origen] = origen
+        cola = deque([origen])
+        sacar = cola.popleft
+        encolar = cola.append
         
-        # BFS: explorar nivel por nivel
         while cola:
-            fila, col = cola.popleft()  # Obtener siguiente posición de la cola
-            
-            # Si llegamos al destino, existe un camino
-            if (fila, col) == (fila_fin, col_fin):
-                return True
+            actual = sacar()
+            if actual == objetivo:
+                # Reconstruir el camino desde el destino hacia el inicio
+                camino = []
+                while actual != origen:
+                    camino.append(direcciones[direccion_llegada[actual]][0])
+                    actual = anterior[actual]
+                camino.reverse()
+                return camino
             
-            # Explorar vecinos (4 direcciones)
-            for df, dc in direcciones:
+            fila, col = divmod(actual, ancho)
+            for i, (_, df, dc) in enumerate(direcciones):
                 nueva_fila = fila + df
                 nueva_col = col + dc
-                
-                # Verificar que la nueva posición sea válida, no visitada y transitable
-                if (0 <= nueva_fila < self.alto and 
-                    0 <= nueva_col < self.ancho and 
-                    not visitado[nueva_fila][nueva_col] and
-                    self.es_transitable_por_jugador(nueva_fila, nueva_col)):
-                    
-                    # Marcar como visitado y agregar a la cola para explorar después
-                    visitado[nueva_fila][nueva_col] = True
-                    cola.append((nueva_fila, nueva_col))
+                if not (0 <= nueva_fila < alto and 0 <= nueva_col < ancho):
+                    continue
+                vecino = nueva_fila * ancho + nueva_col
+                if anterior[vecino] < 0 and casillas[nueva_fila][nueva_col].tipo in transitables:
+                    anterior[vecino] = actual
+                    direccion_llegada[vecino] = i
+                    encolar(vecino)
         
         # No se encontró camino
-        return False
+        return None
     
     def __repr__(self) -> str:
         """Representación del mapa."""
@@ -21,8 +21,13 @@ class Tile(ABC):
     Cada casilla define si permite el paso del jugador y/o enemigos.
     Las reglas de transición pueden variar según el modo de juego
     (especialmente en modo "cazador" donde se invierten algunas reglas).
+    
+    Las casillas no tienen estado mutable: una misma instancia puede
+    compartirse entre todas las posiciones del mapa de su tipo.
     """
     
+    __slots__ = ("tipo",)
+    
     def __init__(self, tipo: TipoTile):
         """
         Inicializa una casilla.
@@ -66,6 +71,8 @@ class Camino(Tile):
     Es el tipo de casilla más común y versátil del mapa.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(TipoTile.CAMINO)
     
@@ -86,6 +93,8 @@ class Muro(Tile):
     Los muros forman las paredes del laberinto y bloquean el paso.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(TipoTile.MURO)
     
@@ -111,6 +120,8 @@ class Liana(Tile):
     - Los enemigos NO pueden pasar por lianas
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(TipoTile.LIANA)
     
@@ -142,6 +153,8 @@ class Tunel(Tile):
     - Los enemigos SÍ pueden pasar por túneles
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(TipoTile.TUNEL)
     
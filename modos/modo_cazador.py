@@ -41,7 +41,7 @@ class GameModeCazador:
         self.nombre_jugador = nombre_jugador
         self.dificultad = dificultad
         # Obtener configuración según la dificultad (energía, velocidad enemigos, etc.)
-        self.config = ConfiguracionDificultad.obtener_configuracion(dificultad)
+        self.config = ConfiguracionDificultad.obtener_parametros(dificultad)
         self.tiempo_limite = tiempo_limite  # Tiempo límite para capturar a los 3 enemigos
         
         # ============================================
@@ -68,7 +68,7 @@ class GameModeCazador:
             pos_inicio = self._buscar_posicion_cercana(pos_inicio)
         
         # Crear jugador con energía inicial según dificultad
-        energia_inicial = self.config["energia_inicial_jugador"]
+        energia_inicial = self.config.energia_inicial_jugador
         self.jugador = Jugador(pos_inicio[0], pos_inicio[1], energia_maxima=energia_inicial)
         
         # ============================================
@@ -83,7 +83,7 @@ class GameModeCazador:
         # ESTADO DEL JUEGO
         # ============================================
         self.tiempo_juego = 0.0  # Tiempo transcurrido en segundos
-        self.puntos = self.config["puntos_base_cazador"]  # Puntos iniciales
+        self.puntos = self.config.puntos_base_cazador  # Puntos iniciales
         self.juego_terminado = False  # Flag de fin de juego
         self.victoria = False  # True si capturó a los 3 enemigos, False si uno escapó
         self.enemigos_capturados = 0  # Contador de enemigos capturados
@@ -136,7 +136,7 @@ class GameModeCazador:
         activamente la salida más cercana usando pathfinding BFS.
         """
         cantidad = 3  # Siempre 3 enemigos en modo cazador (especificación)
-        velocidad_base = self.config["velocidad_enemigos"]
+        velocidad_base = self.config.velocidad_enemigos
         # Aumentar velocidad según dificultad (30% más rápido que la base)
         velocidad = velocidad_base * 1.3
         tiempo_respawn = 10.0  # No se usa en este modo (enemigos no respawnean), pero necesario para Enemigo
@@ -380,7 +380,7 @@ class GameModeCazador:
         Args:
             enemigo: Enemigo que escapó.
         """
-        puntos_perdidos = self.config["puntos_perdidos_por_escape"]
+        puntos_perdidos = self.config.puntos_perdidos_por_escape
         self.puntos = max(0, self.puntos - puntos_perdidos)
         self.enemigos_escapados += 1
         
@@ -401,7 +401,7 @@ class GameModeCazador:
             enemigo: Enemigo capturado.
         """
         # El jugador gana el doble de puntos que perdería si escapara
-        puntos_perdidos_por_escape = self.config["puntos_perdidos_por_escape"]
+        puntos_perdidos_por_escape = self.config.puntos_perdidos_por_escape
         puntos_ganados = puntos_perdidos_por_escape * 2
         
         # Sistema de combos: si capturas rápido, bono adicional
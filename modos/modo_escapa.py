@@ -40,7 +40,7 @@ class GameModeEscapa:
         self.nombre_jugador = nombre_jugador
         self.dificultad = dificultad
         # Obtener configuración según la dificultad (energía, velocidad enemigos, etc.)
-        self.config = ConfiguracionDificultad.obtener_configuracion(dificultad)
+        self.config = ConfiguracionDificultad.obtener_parametros(dificultad)
         
         # ============================================
         # GENERACIÓN O USO DE MAPA
@@ -76,7 +76,7 @@ class GameModeEscapa:
                         break
         
         # Crear jugador con energía inicial según dificultad
-        energia_inicial = self.config["energia_inicial_jugador"]
+        energia_inicial = self.config.energia_inicial_jugador
         self.jugador = Jugador(pos_inicio[0], pos_inicio[1], energia_maxima=energia_inicial)
         
         # ============================================
@@ -170,7 +170,7 @@ class GameModeEscapa:
         # 3 cazadores por cada trampa disponible (3 trampas = 9 cazadores)
         cantidad = self.trampas_disponibles * 3
         # Aumentar velocidad de los cazadores
-        velocidad_base = self.config["velocidad_enemigos"]
+        velocidad_base = self.config.velocidad_enemigos
         velocidad = velocidad_base * 1.5  # Aumentar 50% la velocidad
         # Tiempo de respawn siempre 10 segundos según especificación
         tiempo_respawn = 10.0
@@ -516,7 +516,7 @@ class GameModeEscapa:
         if enemigos_eliminados > 0:
             self.enemigos_eliminados += enemigos_eliminados
             # Bono de puntos por cada cazador eliminado
-            puntos_ganados = enemigos_eliminados * self.config["puntos_por_enemigo_eliminado"]
+            puntos_ganados = enemigos_eliminados * self.config.puntos_por_enemigo_eliminado
             self.puntos += puntos_ganados
         
         # Verificar si un enemigo alcanzó al jugador
@@ -627,7 +627,7 @@ class GameModeEscapa:
             # 4. Conservación de energía
             
             # Puntos base según dificultad
-            puntos_base = self.config["puntos_base_escapa"]
+            puntos_base = self.config.puntos_base_escapa
             
             # ============================================
             # BONO POR TIEMPO
@@ -647,7 +647,7 @@ class GameModeEscapa:
             # BONO POR ENEMIGOS ELIMINADOS
             # ============================================
             # Recompensa por usar trampas estratégicamente
-            bono_enemigos = self.enemigos_eliminados * self.config["puntos_por_enemigo_eliminado"]
+            bono_enemigos = self.enemigos_eliminados * self.config.puntos_por_enemigo_eliminado
             
             # ============================================
             # BONO POR ENERGÍA RESTANTE
@@ -718,7 +718,7 @@ class GameModeEscapa:
             bono_tiempo = int(tiempo_sobrevivido * 0.5)  # 0.5 puntos por segundo
             
             # Bono por enemigos eliminados (mismo que en victoria)
-            bono_enemigos = self.enemigos_eliminados * self.config["puntos_por_enemigo_eliminado"]
+            bono_enemigos = self.enemigos_eliminados * self.config.puntos_por_enemigo_eliminado
             
             # Bono por energía restante (reducido)
             energia_restante = self.jugador.obtener_energia_actual()
@@ -10,6 +10,11 @@ from enum import Enum
 from datetime import datetime
 
 
+def _clave_orden(puntaje: "Puntaje") -> float:
+    """Clave de orden ascendente equivalente a ordenar por puntos de mayor a menor."""
+    return -puntaje.puntos
+
+
 class ModoJuego(Enum):
     """Enum para los modos de juego."""
     ESCAPA = "escapa"
@@ -186,15 +191,20 @@ class ScoreBoard:
         # ============================================
         # AGREGAR Y ORDENAR
         # ============================================
-        # Agregar el nuevo puntaje a la lista del modo correspondiente
-        self._puntajes[modo].append(nuevo_puntaje)
-        
-        # Ordenar de mayor a menor (mejores puntajes primero)
-        self._puntajes[modo].sort(key=lambda p: p.puntos, reverse=True)
+        # Insertar el nuevo puntaje en su posición: la lista del modo se mantiene
+        # siempre ordenada de mayor a menor (mejores puntajes primero) y nunca
+        # pasa de 10 elementos, así que basta recorrerla hasta el primer
+        # puntaje menor (tras los empates, igual que un sort estable) en lugar
+        # de reordenarla completa
+        puntajes = self._puntajes[modo]
+        posicion = 0
+        while posicion < len(puntajes) and puntajes[posicion].puntos >= nuevo_puntaje.puntos:
+            posicion += 1
+        puntajes.insert(posicion, nuevo_puntaje)
         
         # Mantener solo los 10 mejores para evitar que la lista crezca demasiado
         # Esto optimiza el rendimiento y el tamaño de los archivos JSON
-        self._puntajes[modo] = self._puntajes[modo][:10]
+        del puntajes[10:]
         
         # ============================================
         # PERSISTENCIA
@@ -218,14 +228,8 @@ class ScoreBoard:
         if modo not in [ModoJuego.ESCAPA.value, ModoJuego.CAZADOR.value]:
             raise ValueError(f"Modo inválido: {modo}. Debe ser 'escapa' o 'cazador'.")
         
-        # Ordenar y devolver top 5
-        puntajes_ordenados = sorted(
-            self._puntajes[modo], 
-            key=lambda p: p.puntos, 
-            reverse=True
-        )
-        
-        return puntajes_ordenados[:5]
+        # La lista ya está ordenada de mayor a menor: el top 5 es su inicio
+        return self._puntajes[modo][:5]
     
     def _obtener_archivo_puntajes(self, modo: str) -> str:
         """
@@ -258,7 +262,11 @@ class ScoreBoard:
                     with open(archivo, 'r', encoding='utf-8') as f:
                         data = json.load(f)
                         # Convertir cada diccionario a un objeto Puntaje
-                        self._puntajes[modo] = [Puntaje.from_dict(p) for p in data]
+                        puntajes = [Puntaje.from_dict(p) for p in data]
+                        # Ordenar una sola vez al cargar (mayor a menor); después
+                        # registrar_puntaje mantiene el orden al insertar
+                        puntajes.sort(key=_clave_orden)
+                        self._puntajes[modo] = puntajes
                         print(f"[DEBUG _cargar_puntajes] {modo}: {len(self._puntajes[modo])} puntajes cargados")
                 except (json.JSONDecodeError, KeyError, IOError) as e:
                     # Si hay error al cargar, inicializar lista vacía